@@ -15,7 +15,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Wrapper for the GitLab API."""
 
+import importlib.util
 import warnings
+from typing import Any, TYPE_CHECKING
 
 import gitlab.config  # noqa: F401
 from gitlab._version import (  # noqa: F401
@@ -26,14 +28,20 @@ from gitlab._version import (  # noqa: F401
     __title__,
     __version__,
 )
-from gitlab.client import AsyncGraphQL, Gitlab, GitlabList, GraphQL  # noqa: F401
+from gitlab.client import (  # noqa: F401
+    AsyncGitlabList,
+    AsyncGraphQL,
+    Gitlab,
+    GitlabList,
+    GraphQL,
+)
 from gitlab.exceptions import *  # noqa: F401,F403
 
-try:
+# The async client is imported on first use, as httpx is slow to import
+_ASYNC_AVAILABLE = importlib.util.find_spec("httpx") is not None
+
+if TYPE_CHECKING:
     from gitlab.async_client import AsyncGitlab  # noqa: F401
-    _ASYNC_AVAILABLE = True
-except ImportError:
-    _ASYNC_AVAILABLE = False
 
 warnings.filterwarnings("default", category=DeprecationWarning, module="^gitlab")
 
@@ -47,6 +55,7 @@ __all__ = [
     "__version__",
     "Gitlab",
     "GitlabList",
+    "AsyncGitlabList",
     "AsyncGraphQL",
     "GraphQL",
 ]
@@ -55,3 +64,9 @@ if _ASYNC_AVAILABLE:
     __all__.append("AsyncGitlab")
 
 __all__.extend(gitlab.exceptions.__all__)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "AsyncGitlab" and _ASYNC_AVAILABLE:
+        return importlib.import_module("gitlab.async_client").AsyncGitlab
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
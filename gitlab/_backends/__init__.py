@@ -2,6 +2,9 @@
 Defines http backends for processing http requests
 """
 
+import importlib.util
+from typing import Any, TYPE_CHECKING
+
 from .requests_backend import (
     JobTokenAuth,
     OAuthTokenAuth,
@@ -10,11 +13,11 @@ from .requests_backend import (
     RequestsResponse,
 )
 
-try:
-    from .httpx_backend import HTTPXBackend
-    _ASYNC_AVAILABLE = True
-except ImportError:
-    _ASYNC_AVAILABLE = False
+# The HTTPX backend is imported on first use, as httpx is slow to import
+_ASYNC_AVAILABLE = importlib.util.find_spec("httpx") is not None
+
+if TYPE_CHECKING:
+    from .httpx_backend import HTTPXBackend  # noqa: F401
 
 DefaultBackend = RequestsBackend
 DefaultResponse = RequestsResponse
@@ -29,3 +32,9 @@ __all__ = [
 
 if _ASYNC_AVAILABLE:
     __all__.append("HTTPXBackend")
+
+
+def __getattr__(name: str) -> Any:
+    if name == "HTTPXBackend" and _ASYNC_AVAILABLE:
+        return importlib.import_module(".httpx_backend", __name__).HTTPXBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
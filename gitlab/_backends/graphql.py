@@ -1,10 +1,20 @@
-from typing import Any
+from typing import Any, Optional
 
 import httpx
 from gql.transport.httpx import HTTPXAsyncTransport, HTTPXTransport
+from graphql import ExecutionResult
 
 
-class GitlabTransport(HTTPXTransport):
+class _HTTPVersionMixin:
+    #: HTTP version of the last response, None before the first request
+    http_version: Optional[str] = None
+
+    def _prepare_result(self, response: httpx.Response) -> ExecutionResult:
+        self.http_version = response.http_version
+        return super()._prepare_result(response)  # type: ignore[misc,no-any-return]
+
+
+class GitlabTransport(_HTTPVersionMixin, HTTPXTransport):
     """A gql httpx transport that reuses an existing httpx.Client.
     By default, gql's transports do not have a keep-alive session
     and do not enable providing your own session that's kept open.
@@ -24,7 +34,7 @@ class GitlabTransport(HTTPXTransport):
         pass
 
 
-class GitlabAsyncTransport(HTTPXAsyncTransport):
+class GitlabAsyncTransport(_HTTPVersionMixin, HTTPXAsyncTransport):
     """An async gql httpx transport that reuses an existing httpx.AsyncClient.
     By default, gql's transports do not have a keep-alive session
     and do not enable providing your own session that's kept open.
@@ -1,11 +1,165 @@
 """HTTPX backend for async HTTP requests."""
 
-from typing import Any, Dict, Optional, Union
+import dataclasses
+import mimetypes
+import os
+import re
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 import httpx
 
+from .. import utils
 from .protocol import AsyncBackend, BackendResponse
 
+#: Default size of the connection pool shared by all requests of a backend
+DEFAULT_MAX_CONNECTIONS = 100
+#: Default number of idle connections kept open for reuse
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+#: Default time, in seconds, an idle connection is kept open
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+# Characters escaped in the names of multipart fields, as browsers do
+_FORM_PARAM_ESCAPES = {
+    '"': "%22",
+    "\\": "\\\\",
+    **{chr(c): f"%{c:02X}" for c in range(0x20) if c != 0x1B},
+}
+_FORM_PARAM_RE = re.compile("|".join(map(re.escape, _FORM_PARAM_ESCAPES)))
+
+
+@dataclasses.dataclass
+class SendData:
+    """Request body prepared for ``httpx``.
+
+    ``content_type`` is None for multipart bodies, as httpx sets the header
+    itself to include the boundary. ``content_length`` is set for streamed
+    bodies of known size, which httpx would send with chunked encoding.
+    """
+
+    content_type: Optional[str]
+    data: Optional[Dict[str, Any]] = None
+    json: Optional[Union[Dict[str, Any], bytes]] = None
+    content: Optional[
+        Union[bytes, BinaryIO, "AsyncUploadContent", "AsyncMultipartContent"]
+    ] = None
+    content_length: Optional[int] = None
+
+
+class AsyncUploadContent:
+    """Async iterable over the chunks of an upload stream.
+
+    httpx reads sync iterables in the event loop, and only async iterables
+    that are not generators can be sent again when a request is retried.
+    """
+
+    def __init__(self, stream: utils.UploadStream) -> None:
+        self.stream = stream
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.stream.aiter_chunks()
+
+
+def _form_param(name: str, value: str) -> bytes:
+    value = _FORM_PARAM_RE.sub(lambda match: _FORM_PARAM_ESCAPES[match[0]], value)
+    return f'{name}="{value}"'.encode()
+
+
+class AsyncMultipartContent:
+    """A ``multipart/form-data`` body streamed from the files it contains.
+
+    httpx reads the files of multipart bodies in the event loop, by small
+    chunks. Here files are read as :class:`gitlab.utils.UploadStream`, by
+    large chunks from a worker thread, so that uploading a large file does not
+    block the other tasks. The size of the body is known, and sent as its
+    ``Content-Length``, unless a file is not seekable.
+
+    Args:
+        data: The form fields, with ``str`` values or lists of them
+        files: The files, as ``(filename, data)`` or ``(filename, data,
+            content_type)`` tuples. The data is bytes, or a binary file
+            object or upload stream read from its current position.
+    """
+
+    def __init__(self, data: Dict[str, Any], files: Dict[str, Any]) -> None:
+        self.boundary = os.urandom(16).hex()
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        #: Headers and data of each part, the data being bytes or a stream
+        self._parts: List[Tuple[bytes, Union[bytes, utils.UploadStream]]] = []
+        for name, value in data.items():
+            for item in value if isinstance(value, (list, tuple)) else [value]:
+                if not isinstance(item, bytes):
+                    item = "" if item is None else str(item)
+                    item = item.encode()
+                self._add_part(name, item)
+        for name, value in files.items():
+            if value is None:
+                continue
+            filename, file_data, *rest = value
+            content_type = rest[0] if rest else None
+            if content_type is None:
+                guessed, _ = mimetypes.guess_type(filename or "")
+                content_type = guessed or "application/octet-stream"
+            if isinstance(file_data, str):
+                file_data = file_data.encode()
+            elif not isinstance(file_data, (bytes, utils.UploadStream)):
+                file_data = utils.UploadStream(file_data)
+            self._add_part(name, file_data, filename, content_type)
+        self._end = f"--{self.boundary}--\r\n".encode()
+
+    def _add_part(
+        self,
+        name: str,
+        data: Union[bytes, utils.UploadStream],
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> None:
+        headers = [
+            f"--{self.boundary}\r\n".encode(),
+            b"Content-Disposition: form-data; ",
+            _form_param("name", name),
+        ]
+        if filename:
+            headers.extend([b"; ", _form_param("filename", filename)])
+        if content_type:
+            headers.append(f"\r\nContent-Type: {content_type}".encode())
+        headers.append(b"\r\n\r\n")
+        self._parts.append((b"".join(headers), data))
+
+    @property
+    def size(self) -> Optional[int]:
+        """Size of the body, None if the size of a file is unknown."""
+        size = len(self._end)
+        for headers, data in self._parts:
+            length = len(data) if isinstance(data, bytes) else data.size
+            if length is None:
+                return None
+            size += len(headers) + length + 2
+        return size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for headers, data in self._parts:
+            yield headers
+            if isinstance(data, bytes):
+                yield data
+                yield b"\r\n"
+                continue
+            # The file is read from its start by each attempt of the request
+            data.rewind()
+            async for chunk in data.aiter_chunks():
+                yield chunk
+            yield b"\r\n"
+        yield self._end
+
 
 class HTTPXResponse(BackendResponse):
     def __init__(self, response: httpx.Response) -> None:
@@ -20,8 +174,8 @@ class HTTPXResponse(BackendResponse):
         return self._response.status_code
 
     @property
-    def headers(self) -> Dict[str, str]:
-        return dict(self._response.headers)
+    def headers(self) -> httpx.Headers:
+        return self._response.headers
 
     @property
     def content(self) -> bytes:
@@ -33,18 +187,119 @@ class HTTPXResponse(BackendResponse):
 
     @property
     def reason(self) -> str:
-        return self._response.reason
+        return self._response.reason_phrase
 
     def json(self) -> Any:
         return self._response.json()
 
 
 class HTTPXBackend(AsyncBackend):
-    """HTTPX backend for async HTTP requests."""
+    """HTTPX backend for async HTTP requests.
+
+    A single ``httpx.AsyncClient`` is kept for the lifetime of the backend, so
+    TCP connections and TLS sessions are pooled and reused between requests.
+    Call :meth:`aclose` once the backend is no longer needed.
+
+    Args:
+        client: An existing ``httpx.AsyncClient`` to use. The backend takes
+            ownership of it and closes it in :meth:`aclose`.
+        max_connections: Maximum number of concurrent connections in the pool
+            (``None`` for no limit)
+        max_keepalive_connections: Maximum number of idle connections kept
+            open for reuse (``None`` for no limit)
+        keepalive_expiry: Time, in seconds, after which an idle connection
+            is closed (``None`` to keep it open indefinitely)
+        http2: Whether to enable HTTP/2, which multiplexes concurrent
+            requests over a single connection per host. Requires the ``h2``
+            package (``pip install httpx[http2]``).
+        **kwargs: Additional arguments passed to ``httpx.AsyncClient``
+    """
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        *,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        **kwargs: Any,
+    ) -> None:
         """Initialize the HTTPX backend."""
-        self._kwargs = kwargs
+        if client is None:
+            kwargs["http2"] = http2
+            kwargs.setdefault(
+                "limits",
+                httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+            client = httpx.AsyncClient(**kwargs)
+        self._client: httpx.AsyncClient = client
+        self._http_version: Optional[str] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client
+
+    @property
+    def http_version(self) -> Optional[str]:
+        """HTTP version of the last response ("HTTP/1.1", "HTTP/2"...), None
+        before the first request."""
+        return self._http_version
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying client has been closed."""
+        return self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close the underlying client and all its pooled connections."""
+        await self._client.aclose()
+
+    @staticmethod
+    def prepare_send_data(
+        files: Optional[Dict[str, Any]] = None,
+        post_data: Optional[Union[Dict[str, Any], bytes, BinaryIO]] = None,
+        raw: bool = False,
+    ) -> SendData:
+        if files:
+            data: Dict[str, Any] = {}
+            if isinstance(post_data, dict):
+                for k, v in post_data.items():
+                    if isinstance(v, bool):
+                        v = int(v)
+                    data[k] = v
+            content = AsyncMultipartContent(data, files)
+            return SendData(
+                content=content,
+                content_type=content.content_type,
+                content_length=content.size,
+            )
+
+        if raw and post_data:
+            content_type = "application/octet-stream"
+            if isinstance(post_data, dict):
+                return SendData(data=post_data, content_type=content_type)
+            if isinstance(post_data, (bytes, str)):
+                return SendData(content=post_data, content_type=content_type)
+            stream = post_data
+            if not isinstance(stream, utils.UploadStream):
+                # httpx would read other file objects in the event loop, and
+                # refuses them with an AsyncClient
+                stream = utils.UploadStream(stream)
+            return SendData(
+                content=AsyncUploadContent(stream),
+                content_type=content_type,
+                content_length=stream.size,
+            )
+
+        if TYPE_CHECKING:
+            assert not isinstance(post_data, (bytes, BinaryIO))
+
+        return SendData(json=post_data, content_type="application/json")
 
     async def http_request(
         self,
@@ -54,18 +309,38 @@ class HTTPXBackend(AsyncBackend):
         data: Optional[Union[Dict[str, Any], str]] = None,
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
+        stream: bool = False,
         **kwargs: Any,
     ) -> HTTPXResponse:
-        """Make an async HTTP request using HTTPX."""
-        # Создаем новый AsyncClient для каждого запроса
-        async with httpx.AsyncClient(**self._kwargs) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                params=params,
-                timeout=timeout,
-                **kwargs,
-            )
-            return HTTPXResponse(response=response)
+        """Make an async HTTP request using HTTPX.
+
+        Args:
+            method: The HTTP method to call ('get', 'post', 'put', 'delete', etc.)
+            url: The full URL
+            headers: The request headers
+            data: The form data to send to the server in the body of the request
+            params: The query parameters
+            timeout: The timeout, in seconds, for the request. If None, the
+                timeout configured on the client is used.
+            stream: Whether the response body should be streamed. The caller
+                is then responsible for reading or closing the response.
+            **kwargs: Additional arguments passed to
+                ``httpx.AsyncClient.build_request`` (``json``, ``content``,
+                ``files``...) and ``auth``
+
+        Returns:
+            An HTTPXResponse wrapping the httpx Response.
+        """
+        auth = kwargs.pop("auth", httpx.USE_CLIENT_DEFAULT)
+        request = self._client.build_request(
+            method=method,
+            url=url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+            **kwargs,
+        )
+        response = await self._client.send(request, auth=auth, stream=stream)
+        self._http_version = response.http_version
+        return HTTPXResponse(response=response)
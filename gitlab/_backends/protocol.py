@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Protocol, Union
+from typing import Any, Protocol, TYPE_CHECKING, Union
 
-import httpx
 import requests
 from requests_toolbelt.multipart.encoder import MultipartEncoder  # type: ignore
 
+if TYPE_CHECKING:
+    import httpx
+
 
 class BackendResponse(Protocol):
     @abc.abstractmethod
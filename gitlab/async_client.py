@@ -1,143 +1,1169 @@
 """Async GitLab client."""
 
-from typing import Any, Dict, Optional, Union
+import contextlib
+import dataclasses
+import urllib.parse
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    cast,
+    Coroutine,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+import anyio
 import httpx
 
+from . import const, utils
+from ._backends import httpx_backend
 from ._backends.httpx_backend import HTTPXBackend
-from .client import Gitlab
-from .exceptions import GitlabAuthenticationError, GitlabHttpError
+from .cache import CacheEntry, CacheStorage, TTLCache
+from .client import _has_header, _JSON_STREAM_CHUNK_SIZE, AsyncGitlabList, Gitlab
+from .exceptions import GitlabHttpError, GitlabParsingError
+from .json_codec import JSONArrayDecoder, JSONCodec
+
+_T = TypeVar("_T")
+
+
+class ConcurrencyLimiter:
+    """Limit the number of requests an async client sends concurrently.
+
+    Requests over a limit wait for a slot in first-in, first-out order, so a
+    large batch of requests is processed fairly instead of opening as many
+    connections as there are pending requests.
+
+    Args:
+        max_concurrency: Maximum number of requests in flight (None for no
+            limit)
+        per_prefix: Maximum number of requests in flight per endpoint
+            prefix, e.g. ``{"/projects": 10, "/groups/1/members": 2}``. A
+            request counts against the longest prefix matching its path.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        per_prefix: Optional[Dict[str, int]] = None,
+    ) -> None:
+        per_prefix = per_prefix or {}
+        limits = list(per_prefix.values())
+        if max_concurrency is not None:
+            limits.append(max_concurrency)
+        if any(limit < 1 for limit in limits):
+            raise ValueError("Concurrency limits must be at least 1")
+
+        self._global = (
+            anyio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        )
+        self._prefixes = {
+            prefix.rstrip("/"): anyio.Semaphore(limit)
+            for prefix, limit in per_prefix.items()
+        }
+        self._waiting: Dict[Optional[str], int] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a slot."""
+        return sum(self._waiting.values())
+
+    def prefix_queue_depth(self, prefix: str) -> int:
+        """Number of requests waiting for a slot of an endpoint prefix."""
+        return self._waiting.get(prefix.rstrip("/"), 0)
+
+    def _match(self, path: str) -> Optional[str]:
+        matches = [
+            prefix
+            for prefix in self._prefixes
+            if path == prefix or path.startswith(f"{prefix}/")
+        ]
+        return max(matches, key=len, default=None)
+
+    async def _acquire(
+        self,
+        stack: contextlib.AsyncExitStack,
+        semaphore: anyio.Semaphore,
+        key: Optional[str],
+    ) -> None:
+        if semaphore.value > 0:
+            await stack.enter_async_context(semaphore)
+            return
+        self._waiting[key] = self._waiting.get(key, 0) + 1
+        try:
+            await stack.enter_async_context(semaphore)
+        finally:
+            self._waiting[key] -= 1
+
+    @contextlib.asynccontextmanager
+    async def slot(self, path: str) -> AsyncIterator[None]:
+        """Hold a slot for a request to ``path``, waiting for one if needed."""
+        async with contextlib.AsyncExitStack() as stack:
+            # Wait on the endpoint first, so that requests queued behind a
+            # busy endpoint do not hold slots of the global limit
+            prefix = self._match(path)
+            if prefix is not None:
+                await self._acquire(stack, self._prefixes[prefix], prefix)
+            if self._global is not None:
+                await self._acquire(stack, self._global, None)
+            yield
+
+
+class _SlotReleasingStream(httpx.AsyncByteStream):
+    """Body of a streamed response, releasing its concurrency slot once it
+    is closed."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, slot: contextlib.AsyncExitStack
+    ) -> None:
+        self._stream = stream
+        self._slot = slot
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            await self._slot.aclose()
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.completed = False
+
+
+class _AsyncSingleFlight:
+    """Share the outcome of identical coroutines running at the same time.
+
+    The first task for a key runs the coroutine, the tasks arriving while it
+    is in flight wait for it and get the same result or exception. If the
+    first task is cancelled, a waiting task runs the coroutine in its place.
+    Nothing is kept once the coroutine completes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[_T]]) -> _T:
+        while key in self._calls:
+            call = self._calls[key]
+            await call.done.wait()
+            if call.error is not None:
+                raise call.error
+            if call.completed:
+                return cast(_T, call.result)
+
+        call = self._calls[key] = _Call()
+        try:
+            call.result = await func()
+            call.completed = True
+            return cast(_T, call.result)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            del self._calls[key]
+            call.done.set()
 
 
 class AsyncGitlab(Gitlab):
-    """Async GitLab client using HTTPX backend."""
+    """Async GitLab client using HTTPX backend.
+
+    All requests share one pooled ``httpx.AsyncClient``, so connections are
+    kept alive and reused. Use the client as an async context manager or call
+    :meth:`aclose` when done to release the pooled connections::
+
+        async with AsyncGitlab(url, private_token=token) as gl:
+            project = await gl.projects.get(1)
+            async for job in project.jobs.list(iterator=True):
+                ...
+
+    The managers and objects are the same as with :class:`~gitlab.Gitlab`, but
+    every method that talks to the server returns an awaitable. Lists requested
+    with ``iterator=True`` are consumed with ``async for``.
+    """
 
     def __init__(
         self,
-        url: str,
+        url: Optional[str] = None,
         private_token: Optional[str] = None,
         oauth_token: Optional[str] = None,
         job_token: Optional[str] = None,
+        ssl_verify: Union[bool, str] = True,
+        http_username: Optional[str] = None,
+        http_password: Optional[str] = None,
+        timeout: Optional[float] = None,
         api_version: str = "4",
+        per_page: Optional[int] = None,
+        pagination: Optional[str] = None,
+        order_by: Optional[str] = None,
+        user_agent: str = const.USER_AGENT,
+        retry_transient_errors: bool = False,
+        keep_base_url: bool = False,
         session: Optional[Any] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        max_connections: Optional[int] = httpx_backend.DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[
+            int
+        ] = httpx_backend.DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = httpx_backend.DEFAULT_KEEPALIVE_EXPIRY,
+        list_prefetch: int = 1,
+        retry_deadline: Optional[float] = None,
+        rate_limiter: Optional[utils.RateLimiter] = None,
+        http2: bool = False,
+        max_concurrency: Optional[int] = None,
+        max_concurrency_per_prefix: Optional[Dict[str, int]] = None,
+        coalesce_requests: bool = False,
+        http_cache: Optional[CacheStorage] = None,
+        response_cache: Optional[TTLCache] = None,
+        json_codec: Union[str, JSONCodec] = "auto",
         **kwargs: Any,
     ) -> None:
         """Initialize the async GitLab client.
-        
+
         Args:
             url: GitLab instance URL
             private_token: Private token for authentication
             oauth_token: OAuth token for authentication
             job_token: Job token for authentication
+            ssl_verify: Whether SSL certificates should be validated. If
+                the value is a string, it is the path to a CA file used for
+                certificate validation.
+            http_username: Username for HTTP authentication
+            http_password: Password for HTTP authentication
+            timeout: Timeout to use for requests to the GitLab server
             api_version: API version to use
+            per_page: Default number of items per page for list requests
+            pagination: Can be set to 'keyset' to use keyset pagination
+            order_by: Set order_by globally
+            user_agent: A custom user agent to use for making HTTP requests
+            retry_transient_errors: Whether to retry after 500, 502, 503, 504
+                or 52x responses
+            keep_base_url: Keep user-provided base URL for pagination if it
+                differs from response headers
             session: Not used in async client (kept for compatibility)
+            client: An existing HTTPX AsyncClient to send requests with. It
+                is closed together with the GitLab client.
+            max_connections: Maximum number of concurrent pooled connections
+            max_keepalive_connections: Maximum number of idle connections
+                kept open for reuse
+            keepalive_expiry: Time, in seconds, an idle connection is kept open
+            list_prefetch: Number of pages fetched in the background, ahead
+                of the page being consumed, when iterating over lists (0 to
+                disable). Can be overridden per call with ``prefetch=``.
+            retry_deadline: Total time, in seconds, after which a request is
+                no longer retried on 429 or transient errors (None for no
+                limit). Can be overridden per call.
+            rate_limiter: A :class:`~gitlab.utils.RateLimiter` pacing requests
+                to the rate limit announced by the server. It can be shared by
+                several clients, threads and tasks using the same token.
+            http2: Whether to enable HTTP/2, which multiplexes concurrent
+                requests over a single connection per host. Requires the
+                ``h2`` package (``pip install httpx[http2]``).
+            max_concurrency: Maximum number of requests sent concurrently,
+                further requests are queued (None for no limit). A streamed
+                response holds its slot until it is read or closed.
+            max_concurrency_per_prefix: Maximum number of requests sent
+                concurrently per endpoint prefix, e.g. ``{"/projects": 10}``
+            coalesce_requests: Whether identical GET requests sent at the
+                same time (same URL, parameters and headers) share a single
+                request to the server
+            http_cache: A :class:`~gitlab.cache.CacheStorage` where responses
+                with an ``ETag`` or ``Last-Modified`` header are stored, to be
+                revalidated with conditional requests
+            response_cache: A :class:`~gitlab.cache.TTLCache` keeping the
+                objects returned by ``get()`` for a time, per manager class
+            json_codec: The :class:`~gitlab.json_codec.JSONCodec` decoding
+                the responses and encoding the request bodies, or its name:
+                "json", "orjson", "msgspec", or "auto" (default) for the
+                fastest installed one
             **kwargs: Additional arguments passed to HTTPX AsyncClient
         """
-        
+
         # Вызываем родительский конструктор
         super().__init__(
             url=url,
             private_token=private_token,
             oauth_token=oauth_token,
             job_token=job_token,
+            ssl_verify=ssl_verify,
+            http_username=http_username,
+            http_password=http_password,
+            timeout=timeout,
             api_version=api_version,
+            per_page=per_page,
+            pagination=pagination,
+            order_by=order_by,
+            user_agent=user_agent,
+            retry_transient_errors=retry_transient_errors,
+            keep_base_url=keep_base_url,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            http_cache=http_cache,
+            response_cache=response_cache,
+            json_codec=json_codec,
             session=session,
         )
 
-        self._backend = HTTPXBackend(**kwargs)
+        self.list_prefetch = list_prefetch
+        self._single_flight = _AsyncSingleFlight()  # type: ignore[assignment]
+        self.retry_deadline = retry_deadline
+        #: Limiter queueing the requests over the concurrency limits
+        self.concurrency_limiter = ConcurrencyLimiter(
+            max_concurrency, max_concurrency_per_prefix
+        )
+
+        # httpx verifies certificates per client, not per request
+        kwargs.setdefault("verify", ssl_verify)
+        self._backend = HTTPXBackend(
+            client=client,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            **kwargs,
+        )
+
+    async def __aenter__(self) -> "AsyncGitlab":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled HTTPX AsyncClient used for all requests."""
+        return self._backend.client
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for the concurrency limits."""
+        return self.concurrency_limiter.queue_depth
+
+    @property
+    def http2_active(self) -> bool:
+        """Whether the last request was sent over HTTP/2.
+
+        HTTP/2 is only used when enabled with ``http2=True`` and negotiated
+        with the server, otherwise requests fall back to HTTP/1.1.
+        """
+        return self._backend.http_version == "HTTP/2"
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections of the client."""
+        await self._backend.aclose()
+        self.session.close()
+
+    async def auth(self) -> None:  # type: ignore[override]
+        """Performs an authentication using private token. Warns the user if a
+        potentially misconfigured URL is detected on the client or server side.
+
+        The `user` attribute will hold a `gitlab.objects.CurrentUser` object on
+        success.
+        """
+        self.user = await self._objects.CurrentUserManager(self).get()
+
+        if hasattr(self.user, "web_url") and hasattr(self.user, "username"):
+            self._check_url(self.user.web_url, path=self.user.username)
+
+    async def version(self) -> tuple[str, str]:  # type: ignore[override]
+        """Returns the version and revision of the gitlab server.
+
+        Returns:
+            The server version and server revision.
+                ('unknown', 'unknown') if the server doesn't perform as expected.
+        """
+        if self._server_version is None:
+            try:
+                data = await self.http_get("/version")
+                if isinstance(data, dict):
+                    self._server_version = data["version"]
+                    self._server_revision = data["revision"]
+                else:
+                    self._server_version = "unknown"
+                    self._server_revision = "unknown"
+            except Exception:
+                self._server_version = "unknown"
+                self._server_revision = "unknown"
+
+        return cast(str, self._server_version), cast(str, self._server_revision)
+
+    def _as_result(self, value: Any) -> Any:
+        async def _result() -> Any:
+            return value
+
+        return _result()
+
+    @staticmethod
+    def _response_from_cache(  # type: ignore[override]
+        entry: CacheEntry, response: httpx.Response
+    ) -> httpx.Response:
+        return httpx.Response(
+            200, headers=entry.headers, content=entry.content, request=response.request
+        )
+
+    def _endpoint_path(self, url: str) -> str:
+        """Return the path of ``url`` relative to the API root."""
+        if url.startswith(self._url):
+            return url[len(self._url) :]
+        return urllib.parse.urlparse(url).path
 
-    async def http_request(
+    def _get_auth_opts(self) -> Dict[str, Any]:
+        """Return the headers and httpx auth matching the configured credentials."""
+        headers: Dict[str, str] = {}
+        auth: Any = httpx.USE_CLIENT_DEFAULT
+        if self.private_token:
+            headers["PRIVATE-TOKEN"] = self.private_token
+        elif self.oauth_token:
+            headers["Authorization"] = f"Bearer {self.oauth_token}"
+        elif self.job_token:
+            headers["JOB-TOKEN"] = self.job_token
+        elif self.http_username and self.http_password:
+            auth = httpx.BasicAuth(self.http_username, self.http_password)
+        return {"headers": headers, "auth": auth}
+
+    async def http_request(  # type: ignore[override]
         self,
-        method: str,
-        url: str,
-        headers: Optional[Dict[str, str]] = None,
-        data: Optional[Union[Dict[str, Any], str]] = None,
-        params: Optional[Dict[str, Any]] = None,
+        verb: str,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        post_data: Optional[Union[Dict[str, Any], bytes, BinaryIO]] = None,
+        raw: bool = False,
+        streamed: bool = False,
+        files: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
+        obey_rate_limit: bool = True,
+        retry_transient_errors: Optional[bool] = None,
+        max_retries: int = 10,
+        retry_deadline: Optional[float] = None,
+        extra_headers: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> httpx.Response:
-        """Make an async HTTP request.
-        
+        """Make an async HTTP request to the Gitlab server.
+
         Args:
-            method: HTTP method
-            url: Request URL
-            headers: Request headers
-            data: Request data
-            params: Query parameters
-            timeout: Request timeout
-            **kwargs: Additional arguments
-            
+            verb: The HTTP method to call ('get', 'post', 'put', 'delete')
+            path: Path or full URL to query ('/projects' or
+                        'http://whatever/v4/api/projecs')
+            query_data: Data to send as query parameters
+            post_data: Data to send in the body (will be converted to
+                              json by default)
+            raw: If True, do not convert post_data to json
+            streamed: Whether the data should be streamed
+            files: The files to send to the server
+            timeout: The timeout, in seconds, for the request
+            obey_rate_limit: Whether to obey 429 Too Many Request
+                                    responses. Defaults to True.
+            retry_transient_errors: Whether to retry after 500, 502, 503, 504
+                or 52x responses and connection errors. Defaults to the value
+                set on the client.
+            max_retries: Max retries after 429 or transient errors,
+                               set to -1 to retry forever. Defaults to 10.
+            retry_deadline: Total time, in seconds, after which the request
+                is no longer retried. Defaults to the value set on the client.
+            extra_headers: Add and override HTTP headers for the request.
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
         Returns:
-            Response dictionary with status_code, headers, content, and text
-            
+            An httpx Response object. If ``streamed`` is True, the body has not
+            been read yet.
+
         Raises:
-            GitlabHttpError: If the request fails
+            GitlabHttpError: When the return code is not 2xx or the request
+                could not be sent
             GitlabAuthenticationError: If authentication fails
         """
-        # Формируем полный URL, если передан относительный путь
-        if not url.startswith("http"):
-            if url.startswith("/"):
-                url = url[1:]
-            url = f"{self.api_url}/{url}"
-        # Добавляем заголовки аутентификации
-        if headers is None:
-            headers = {}
-        
-        if self.private_token:
-            headers["PRIVATE-TOKEN"] = self.private_token
-        elif self.oauth_token:
-            headers["Authorization"] = f"Bearer {self.oauth_token}"
-        elif self.job_token:
-            headers["JOB-TOKEN"] = self.job_token
-        
-        # Добавляем User-Agent
-        headers["User-Agent"] = f"python-gitlab-async/{self.api_version}"
-        
-        try:
-            response = await self._backend.http_request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                params=params,
-                timeout=timeout,
-                **kwargs,
+        url, params = self._prepare_url_and_params(path, query_data, kwargs)
+
+        if timeout is None:
+            timeout = self.timeout
+        if retry_transient_errors is None:
+            retry_transient_errors = self.retry_transient_errors
+        if retry_deadline is None:
+            retry_deadline = self.retry_deadline
+
+        auth_opts = self._get_auth_opts()
+        headers = self.headers.copy()
+        headers.update(auth_opts["headers"])
+
+        # We need to deal with json vs. data when uploading files
+        send_data = self._backend.prepare_send_data(files, post_data, raw)
+        if send_data.content_type is not None:
+            headers["Content-type"] = send_data.content_type
+        if send_data.content_length is not None:
+            headers["Content-Length"] = str(send_data.content_length)
+        if send_data.json is not None and self._encodes_json:
+            send_data = dataclasses.replace(
+                send_data, json=None, content=self.json_codec.dumps(send_data.json)
             )
-            
-            # Проверяем статус код
-            if response.status_code >= 400:
-                if response.status_code == 401:
-                    raise GitlabAuthenticationError(
-                        f"Authentication failed: {response.text}"
+
+        if extra_headers is not None:
+            headers.update(extra_headers)
+
+        request_key = self._request_key(
+            verb,
+            url,
+            params,
+            headers,
+            streamed=streamed,
+            post_data=post_data,
+            files=files,
+        )
+        cache_key, cached = self._cache_lookup(request_key)
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+
+        endpoint = self._endpoint_path(url)
+        retry = utils.AsyncRetry(
+            max_retries=max_retries,
+            obey_rate_limit=obey_rate_limit,
+            retry_transient_errors=retry_transient_errors,
+            deadline=retry_deadline,
+        )
+
+        async def send() -> httpx.Response:
+            while True:
+                if self.rate_limiter is not None and obey_rate_limit:
+                    await self.rate_limiter.async_acquire()
+                utils.rewind_uploads(post_data, files)
+                try:
+                    async with contextlib.AsyncExitStack() as stack:
+                        await stack.enter_async_context(
+                            self.concurrency_limiter.slot(endpoint)
+                        )
+                        result = await self._backend.http_request(
+                            method=verb,
+                            url=url,
+                            headers=headers,
+                            data=send_data.data,
+                            json=send_data.json,
+                            content=send_data.content,
+                            params=params,
+                            timeout=timeout,
+                            stream=streamed,
+                            auth=auth_opts["auth"],
+                        )
+                        if streamed:
+                            # The body is still to be read: hold the slot
+                            # until the response is closed
+                            result.response.stream = _SlotReleasingStream(
+                                result.response.stream, stack.pop_all()
+                            )
+                except (httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                    if await retry.handle_retry():
+                        continue
+                    raise GitlabHttpError(error_message=f"Request failed: {e}") from e
+                except httpx.HTTPError as e:
+                    raise GitlabHttpError(error_message=f"Request failed: {e}") from e
+
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(result.headers)
+
+                if cached is not None and result.status_code == 304:
+                    assert cache_key is not None
+                    return self._revalidated_response(  # type: ignore[no-any-return]
+                        cache_key, cached, result.response
                     )
-                else:
-                    raise GitlabHttpError(
-                        f"HTTP {response.status_code}: {response.text}"
+
+                if 200 <= result.status_code < 300:
+                    if cache_key is not None:
+                        self._store_in_cache(cache_key, result.response)
+                    return result.response
+
+                if streamed:
+                    # Read the body so the error message can be extracted from it,
+                    # which also releases the connection while waiting to retry
+                    await result.response.aread()
+
+                if await retry.handle_retry_on_status(
+                    result.status_code, result.headers, result.reason
+                ):
+                    continue
+
+                self._raise_for_response(result)
+
+        if self.coalesce_requests and request_key is not None:
+            return await self._single_flight.do(request_key, send)
+        return await send()
+
+    async def http_get(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        streamed: bool = False,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        **kwargs: Any,
+    ) -> Union[Dict[str, Any], httpx.Response]:
+        """Make an async GET request to the Gitlab server.
+
+        Returns:
+            An httpx Response object if streamed is True or the content type
+            is not json. The parsed json data otherwise.
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+            GitlabParsingError: If the json data could not be parsed
+        """
+        result = await self.http_request(
+            "get", path, query_data=query_data, streamed=streamed, **kwargs
+        )
+        content_type = utils.get_content_type(result.headers.get("Content-Type"))
+
+        if content_type == "application/json" and not streamed and not raw:
+            json_result: Dict[str, Any] = utils.select_fields(
+                self._parse_json(result), fields
+            )
+            return json_result
+        return result
+
+    async def http_download(  # type: ignore[override]
+        self,
+        path: str,
+        destination: utils.DownloadDestination,
+        query_data: Optional[Dict[str, Any]] = None,
+        *,
+        segments: int = 1,
+        **kwargs: Any,
+    ) -> utils.DownloadStats:
+        """Download a file from the Gitlab server to a path or file object,
+        resuming it after connection errors, and fetching the segments of
+        large downloads from concurrent tasks with ``segments`` (see
+        :meth:`Gitlab.http_download`).
+
+        Returns:
+            The statistics of the download
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx or the download
+                could not be completed
+        """
+        extra_headers = kwargs.pop("extra_headers", None) or {}
+        download = utils.ResumableDownload(
+            destination, resume=not _has_header(extra_headers, "Range")
+        )
+        retry = self._download_retry(kwargs)
+        try:
+            while True:
+                try:
+                    result = await self.http_get(
+                        path,
+                        query_data=query_data,
+                        streamed=True,
+                        raw=True,
+                        extra_headers={**extra_headers, **download.request_headers()},
+                        **kwargs,
                     )
-            
-            return response
-            
-        except Exception as e:
-            if isinstance(e, (GitlabHttpError, GitlabAuthenticationError)):
-                raise
-            raise GitlabHttpError(f"Request failed: {str(e)}")
+                except GitlabHttpError as e:
+                    if e.response_code == 416 and download.offset:
+                        # The data was already written, or does not match anymore
+                        download.restart()
+                        continue
+                    raise
+                assert isinstance(result, httpx.Response)
+
+                try:
+                    if not download.start(result.status_code, result.headers):
+                        download.restart()
+                        continue
+                    bounds = download.split(
+                        result.status_code, result.headers, segments
+                    )
+                    if bounds:
+                        if not await self._download_segments(
+                            path,
+                            query_data,
+                            result,
+                            download,
+                            bounds,
+                            extra_headers,
+                            kwargs,
+                        ):
+                            # The data changed meanwhile
+                            download.restart()
+                            segments = 1
+                            continue
+                    else:
+                        # httpx returns the chunks as they are received
+                        async for chunk in result.aiter_bytes():
+                            download.write(chunk)
+                    if not download.complete:
+                        raise httpx.RemoteProtocolError(
+                            "Connection closed before the download was complete"
+                        )
+                except (httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                    if download.resumable and await retry.handle_retry():
+                        download.stats.retries += 1
+                        continue
+                    raise GitlabHttpError(error_message=f"Download failed: {e}") from e
+                finally:
+                    await result.aclose()
+                return download.finish()
+        except BaseException:
+            download.abort()
+            raise
+
+    def _download_retry(  # type: ignore[override]
+        self, kwargs: Dict[str, Any]
+    ) -> utils.AsyncRetry:
+        retry_transient_errors = kwargs.get("retry_transient_errors")
+        return utils.AsyncRetry(
+            max_retries=kwargs.get("max_retries", 10),
+            retry_transient_errors=(
+                self.retry_transient_errors
+                if retry_transient_errors is None
+                else retry_transient_errors
+            ),
+            deadline=kwargs.get("retry_deadline", self.retry_deadline),
+        )
+
+    async def _download_segments(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]],
+        response: httpx.Response,
+        download: utils.ResumableDownload,
+        bounds: List[Tuple[int, int]],
+        extra_headers: Dict[str, Any],
+        kwargs: Dict[str, Any],
+    ) -> bool:
+        """Fetch the segments of a download from concurrent tasks, the first
+        one being the rest of ``response``.
+
+        The other tasks are cancelled as soon as one fails, and its error is
+        raised as is rather than in an exception group.
+
+        Returns:
+            False if a segment is not part of the same data as ``response``
+        """
+        errors: List[Exception] = []
+        matches = True
+
+        async def fetch(index: int) -> None:
+            nonlocal matches
+            start, end = bounds[index]
+            try:
+                if await self._download_segment(
+                    path,
+                    query_data,
+                    response if index == 0 else None,
+                    download,
+                    start,
+                    end,
+                    extra_headers,
+                    kwargs,
+                ):
+                    return
+                matches = False
+            except Exception as e:
+                errors.append(e)
+            task_group.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            for index in range(len(bounds)):
+                task_group.start_soon(fetch, index)
+        if errors:
+            raise errors[0]
+        return matches
+
+    async def _download_segment(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]],
+        response: Optional[httpx.Response],
+        download: utils.ResumableDownload,
+        start: int,
+        end: int,
+        extra_headers: Dict[str, Any],
+        kwargs: Dict[str, Any],
+    ) -> bool:
+        retry = self._download_retry(kwargs)
+        while start < end:
+            if response is None:
+                result = await self.http_get(
+                    path,
+                    query_data=query_data,
+                    streamed=True,
+                    raw=True,
+                    extra_headers={
+                        **extra_headers,
+                        **download.segment_headers(start, end),
+                    },
+                    **kwargs,
+                )
+                assert isinstance(result, httpx.Response)
+                response = result
+                if not download.segment_matches(
+                    response.status_code, response.headers, start
+                ):
+                    await response.aclose()
+                    return False
+            try:
+                async for chunk in response.aiter_bytes():
+                    chunk = chunk[: end - start]
+                    download.write_at(start, chunk)
+                    start += len(chunk)
+                    if start == end:
+                        break
+                if start < end:
+                    raise httpx.RemoteProtocolError(
+                        "Connection closed before the segment was complete"
+                    )
+            except (httpx.NetworkError, httpx.RemoteProtocolError) as e:
+                if not await retry.handle_retry():
+                    raise GitlabHttpError(error_message=f"Download failed: {e}") from e
+                download.segment_retried()
+            finally:
+                # Close the connection even when the task is cancelled
+                with anyio.CancelScope(shield=True):
+                    await response.aclose()
+                response = None
+        return True
+
+    async def http_head(  # type: ignore[override]
+        self, path: str, query_data: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> httpx.Headers:
+        """Make an async HEAD request to the Gitlab server.
+
+        Returns:
+            The response headers
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+        """
+        result = await self.http_request("head", path, query_data=query_data, **kwargs)
+        return result.headers
+
+    def http_list(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        *,
+        iterator: Optional[bool] = None,
+        message_details: Optional[utils.WarnMessageData] = None,
+        **kwargs: Any,
+    ) -> Union[AsyncGitlabList, Coroutine[Any, Any, List[Dict[str, Any]]]]:
+        """Make an async GET request to the Gitlab server for list-oriented
+        queries.
+
+        Args:
+            path: Path or full URL to query ('/projects' or
+                  'http://whatever/v4/api/projects')
+            query_data: Data to send as query parameters
+            iterator: Indicate if should return an AsyncGitlabList
+            message_details: Details of the warning emitted when only part of
+                the items are returned
+            **kwargs: Extra options to send to the server (e.g. sudo, page,
+                      per_page). ``prefetch`` sets the number of pages fetched
+                      ahead (defaults to ``list_prefetch``). With
+                      ``get_all=True``, ``concurrency`` sets the number of
+                      pages requested in parallel once the total number of
+                      pages is known. ``fields`` drops all the keys of the
+                      items but these, as each page is parsed. ``stream=True``
+                      decodes the items as they are read from the connection
+                      instead of a page at a time (the pages are then
+                      requested one by one).
+
+        Returns:
+            An AsyncGitlabList to consume with ``async for`` if `iterator` is
+            True, otherwise an awaitable returning the list of items.
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+            GitlabParsingError: If the json data could not be parsed
+        """
+        query_data = query_data or {}
+        url, get_all, page = self._prepare_list(path, iterator=iterator, kwargs=kwargs)
+        concurrency = kwargs.pop("concurrency", None)
+        kwargs.setdefault("prefetch", self.list_prefetch)
+
+        if iterator:
+            return AsyncGitlabList(self, url, query_data, **kwargs)
+
+        return self._http_list_items(
+            url,
+            query_data,
+            get_all=get_all,
+            page=page,
+            message_details=message_details,
+            concurrency=concurrency,
+            **kwargs,
+        )
+
+    async def _http_list_items(
+        self,
+        url: str,
+        query_data: Dict[str, Any],
+        *,
+        get_all: Optional[bool],
+        page: Optional[int],
+        message_details: Optional[utils.WarnMessageData],
+        concurrency: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        if get_all is True:
+            if concurrency is not None and concurrency > 1 and not kwargs.get("stream"):
+                kwargs["prefetch"] = 0
+                gl_list = AsyncGitlabList(self, url, query_data, **kwargs)
+                return await self._list_remaining_pages(gl_list, concurrency)
+            gl_list = AsyncGitlabList(self, url, query_data, **kwargs)
+            return [item async for item in gl_list]
+
+        # pagination requested, we return a list
+        kwargs["prefetch"] = 0
+        gl_list = AsyncGitlabList(self, url, query_data, get_next=False, **kwargs)
+        items = [item async for item in gl_list]
+        self._warn_on_partial_list(
+            gl_list, items, get_all=get_all, page=page, message_details=message_details
+        )
+        return items
+
+    async def _list_remaining_pages(  # type: ignore[override]
+        self, gl_list: AsyncGitlabList, concurrency: int
+    ) -> List[Dict[str, Any]]:
+        """Return all the items of a list, requesting the pages in parallel.
+
+        Falls back to following the ``next`` links when the pages can't be
+        addressed by number (keyset pagination, or no ``X-Total-Pages`` header
+        for lists of more than 10,000 items). The first error raised while
+        requesting a page cancels the others, and is raised as is rather than
+        in an exception group.
+        """
+        await gl_list._start()
+        page_urls = gl_list._remaining_page_urls()
+        if page_urls is None:
+            return [item async for item in gl_list]
+
+        items = gl_list._data[gl_list._current :]
+        pages: List[List[Dict[str, Any]]] = [[] for _ in page_urls]
+        errors: List[Exception] = []
+        limiter = anyio.CapacityLimiter(concurrency)
+
+        async def get_page(index: int, page_url: str) -> None:
+            try:
+                async with limiter:
+                    result = await self.http_request("get", page_url, **gl_list._kwargs)
+                pages[index] = utils.select_fields(
+                    self._parse_json(result), gl_list._fields
+                )
+            except Exception as e:
+                errors.append(e)
+                task_group.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            for index, page_url in enumerate(page_urls):
+                task_group.start_soon(get_page, index, page_url)
+        if errors:
+            raise errors[0]
+        for page_items in pages:
+            items.extend(page_items)
+        return items
+
+    async def _stream_json_items(  # type: ignore[override]
+        self, result: httpx.Response, fields: Optional[FrozenSet[str]]
+    ) -> AsyncGenerator[Any, None]:
+        """Decode the items of the JSON array of a streamed response, as they
+        are received.
+
+        Raises:
+            GitlabParsingError: If the json data could not be parsed
+        """
+        decoder = JSONArrayDecoder()
+        try:
+            async for chunk in result.aiter_bytes(chunk_size=_JSON_STREAM_CHUNK_SIZE):
+                for item in utils.select_fields(decoder.feed(chunk), fields):
+                    yield item
+            for item in utils.select_fields(decoder.close(), fields):
+                yield item
+        except ValueError as e:
+            raise GitlabParsingError(
+                error_message="Failed to parse the server message"
+            ) from e
+        finally:
+            await result.aclose()
+
+    async def _map_concurrently(  # type: ignore[override]
+        self, func: Callable[[Any], Any], items: List[Any], concurrency: int
+    ) -> List[Any]:
+        """Await ``func`` for ``items`` from up to ``concurrency`` tasks.
+
+        The results are returned in the order of ``items``.
+        """
+        results: List[Any] = [None] * len(items)
+        limiter = anyio.CapacityLimiter(concurrency)
+
+        async def run(index: int, item: Any) -> None:
+            async with limiter:
+                results[index] = await func(item)
+
+        async with anyio.create_task_group() as task_group:
+            for index, item in enumerate(items):
+                task_group.start_soon(run, index, item)
+        return results
+
+    async def http_post(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        post_data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        files: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Union[Dict[str, Any], httpx.Response]:
+        """Make an async POST request to the Gitlab server.
+
+        Returns:
+            The parsed json returned by the server if json is return, else the
+            raw response
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+            GitlabParsingError: If the json data could not be parsed
+        """
+        result = await self.http_request(
+            "post",
+            path,
+            query_data=query_data,
+            post_data=post_data or {},
+            files=files,
+            raw=raw,
+            **kwargs,
+        )
+        content_type = utils.get_content_type(result.headers.get("Content-Type"))
+
+        if content_type == "application/json":
+            json_result: Dict[str, Any] = self._parse_json(result)
+            return json_result
+        return result
+
+    async def http_put(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        post_data: Optional[Union[Dict[str, Any], bytes, BinaryIO]] = None,
+        raw: bool = False,
+        files: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Union[Dict[str, Any], httpx.Response]:
+        """Make an async PUT request to the Gitlab server.
+
+        Returns:
+            The parsed json returned by the server.
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+            GitlabParsingError: If the json data could not be parsed
+        """
+        result = await self.http_request(
+            "put",
+            path,
+            query_data=query_data,
+            post_data=post_data or {},
+            files=files,
+            raw=raw,
+            **kwargs,
+        )
+        if result.status_code in const.NO_JSON_RESPONSE_CODES:
+            return result
+        json_result: Dict[str, Any] = self._parse_json(result)
+        return json_result
+
+    async def http_patch(  # type: ignore[override]
+        self,
+        path: str,
+        *,
+        query_data: Optional[Dict[str, Any]] = None,
+        post_data: Optional[Union[Dict[str, Any], bytes]] = None,
+        raw: bool = False,
+        **kwargs: Any,
+    ) -> Union[Dict[str, Any], httpx.Response]:
+        """Make an async PATCH request to the Gitlab server.
+
+        Returns:
+            The parsed json returned by the server.
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+            GitlabParsingError: If the json data could not be parsed
+        """
+        result = await self.http_request(
+            "patch",
+            path,
+            query_data=query_data,
+            post_data=post_data or {},
+            raw=raw,
+            **kwargs,
+        )
+        if result.status_code in const.NO_JSON_RESPONSE_CODES:
+            return result
+        json_result: Dict[str, Any] = self._parse_json(result)
+        return json_result
+
+    async def http_delete(  # type: ignore[override]
+        self, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Make an async DELETE request to the Gitlab server.
+
+        Returns:
+            The httpx Response object.
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+        """
+        return await self.http_request("delete", path, **kwargs)
+
+    async def _raw_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        if not url.startswith(("http://", "https://", "/")):
+            url = f"/{url}"
+        return await self.http_request(
+            method,
+            url,
+            query_data=params,
+            post_data=data,
+            extra_headers=headers,
+            **kwargs,
+        )
 
     async def get(self, url: str, **kwargs: Any) -> httpx.Response:
         """Make a GET request."""
-        return await self.http_request("GET", url, **kwargs)
+        return await self._raw_request("GET", url, **kwargs)
 
     async def post(self, url: str, **kwargs: Any) -> httpx.Response:
         """Make a POST request."""
-        return await self.http_request("POST", url, **kwargs)
+        return await self._raw_request("POST", url, **kwargs)
 
     async def put(self, url: str, **kwargs: Any) -> httpx.Response:
         """Make a PUT request."""
-        return await self.http_request("PUT", url, **kwargs)
+        return await self._raw_request("PUT", url, **kwargs)
 
     async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
         """Make a DELETE request."""
-        return await self.http_request("DELETE", url, **kwargs)
+        return await self._raw_request("DELETE", url, **kwargs)
 
     async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
         """Make a PATCH request."""
-        return await self.http_request("PATCH", url, **kwargs)
+        return await self._raw_request("PATCH", url, **kwargs)
@@ -4,6 +4,7 @@ import copy
 import importlib
 import json
 import pprint
+import sys
 import textwrap
 from collections.abc import Iterable
 from types import ModuleType
@@ -11,11 +12,12 @@ from typing import Any, ClassVar, Generic, TYPE_CHECKING, TypeVar
 
 import gitlab
 from gitlab import types as g_types
+from gitlab import utils
 from gitlab.exceptions import GitlabParsingError
 
-from .client import Gitlab, GitlabList
+from .client import AsyncGitlabList, Gitlab, GitlabList
 
-__all__ = ["RESTObject", "RESTObjectList", "RESTManager"]
+__all__ = ["RESTObject", "RESTObjectList", "AsyncRESTObjectList", "RESTManager"]
 
 
 _URL_ATTRIBUTE_ERROR = (
@@ -24,6 +26,35 @@ _URL_ATTRIBUTE_ERROR = (
 )
 
 
+class _ManagerDescriptor:
+    """Create the manager of a RESTObject attribute on first access.
+
+    The manager is then stored in the instance ``__dict__``, which takes
+    precedence over this (non-data) descriptor on later accesses.
+    """
+
+    def __init__(self, attr: str, annotation: type | str, module_name: str) -> None:
+        self._attr = attr
+        self._module_name = module_name
+        self._cls: type[RESTManager[Any]] | None = None
+        if isinstance(annotation, type):
+            self._cls = annotation
+            self._cls_name = annotation.__name__
+        else:
+            self._cls_name = annotation
+
+    def __get__(self, obj: RESTObject | None, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        if self._cls is None:
+            module = importlib.import_module(self._module_name)
+            self._cls = getattr(module, self._cls_name)
+        manager = self._cls(obj.manager.gitlab, parent=obj)
+        # Since we have our own __setattr__ method, we can't use setattr()
+        obj.__dict__[self._attr] = manager
+        return manager
+
+
 class RESTObject:
     """Represents an object built from server data.
 
@@ -41,12 +72,14 @@ class RESTObject:
 
     _id_attr: str | None = "id"
     _attrs: dict[str, Any]
-    _created_from_list: bool  # Indicates if object was created from a list() action
+    # Indicates if object was created from a list() action
+    _created_from_list: bool = False
+    # Module of the class, resolved once per class
     _module: ModuleType
     _parent_attrs: dict[str, Any]
     _repr_attr: str | None = None
     _updated_attrs: dict[str, Any]
-    _lazy: bool
+    _lazy: bool = False
     manager: RESTManager[Any]
 
     def __init__(
@@ -63,29 +96,48 @@ class RESTObject:
                 f"{attrs!r}\nThis likely indicates an incorrect or malformed server "
                 f"response."
             )
-        self.__dict__.update(
-            {
-                "manager": manager,
-                "_attrs": attrs,
-                "_updated_attrs": {},
-                "_module": importlib.import_module(self.__module__),
-                "_created_from_list": created_from_list,
-                "_lazy": lazy,
-            }
-        )
-        self.__dict__["_parent_attrs"] = self.manager.parent_attrs
-        self._create_managers()
+        # Only the per-object state is stored in the instance __dict__, the
+        # flags keep their class defaults unless set.
+        instance_dict = self.__dict__
+        instance_dict["manager"] = manager
+        instance_dict["_attrs"] = attrs
+        instance_dict["_updated_attrs"] = {}
+        instance_dict["_parent_attrs"] = manager.parent_attrs
+        if created_from_list:
+            instance_dict["_created_from_list"] = True
+        if lazy:
+            instance_dict["_lazy"] = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._module = _class_module(cls)
+        # NOTE(jlvillal): We are creating our managers by looking at the class
+        # annotations. If an attribute is annotated as being a *Manager type
+        # then the manager is created and assigned to the attribute when it is
+        # first accessed, so that unused managers cost nothing.
+        for attr, annotation in cls.__dict__.get("__annotations__", {}).items():
+            # We ignore creating a manager for the 'manager' attribute as that
+            # is done in the self.__init__() method
+            if attr in ("manager",):
+                continue
+            if not isinstance(annotation, (type, str)):  # pragma: no cover
+                continue
+            if isinstance(annotation, type):
+                cls_name = annotation.__name__
+            else:
+                cls_name = annotation
+            # All *Manager classes are used except for the base "RESTManager" class
+            if cls_name == "RESTManager" or not cls_name.endswith("Manager"):
+                continue
+            setattr(cls, attr, _ManagerDescriptor(attr, annotation, cls.__module__))
 
     def __getstate__(self) -> dict[str, Any]:
-        state = self.__dict__.copy()
-        module = state.pop("_module")
-        state["_module_name"] = module.__name__
-        return state
+        return self.__dict__.copy()
 
     def __setstate__(self, state: dict[str, Any]) -> None:
-        module_name = state.pop("_module_name")
+        # Objects pickled by older versions carry the name of their module
+        state.pop("_module_name", None)
         self.__dict__.update(state)
-        self.__dict__["_module"] = importlib.import_module(module_name)
 
     def __getattr__(self, name: str) -> Any:
         if name in self.__dict__["_updated_attrs"]:
@@ -196,33 +248,15 @@ class RESTObject:
             return super().__hash__()
         return hash(self.get_id())
 
-    def _create_managers(self) -> None:
-        # NOTE(jlvillal): We are creating our managers by looking at the class
-        # annotations. If an attribute is annotated as being a *Manager type
-        # then we create the manager and assign it to the attribute.
-        for attr, annotation in sorted(self.__class__.__annotations__.items()):
-            # We ignore creating a manager for the 'manager' attribute as that
-            # is done in the self.__init__() method
-            if attr in ("manager",):
-                continue
-            if not isinstance(annotation, (type, str)):  # pragma: no cover
-                continue
-            if isinstance(annotation, type):
-                cls_name = annotation.__name__
-            else:
-                cls_name = annotation
-            # All *Manager classes are used except for the base "RESTManager" class
-            if cls_name == "RESTManager" or not cls_name.endswith("Manager"):
-                continue
-            cls = getattr(self._module, cls_name)
-            manager = cls(self.manager.gitlab, parent=self)
-            # Since we have our own __setattr__ method, we can't use setattr()
-            self.__dict__[attr] = manager
-
     def _update_attrs(self, new_attrs: dict[str, Any]) -> None:
         self.__dict__["_updated_attrs"] = {}
         self.__dict__["_attrs"] = new_attrs
 
+    def _update_and_return(self, new_attrs: dict[str, Any]) -> dict[str, Any]:
+        """Update the object with server data and return that data."""
+        self._update_attrs(new_attrs)
+        return new_attrs
+
     def get_id(self) -> int | str | None:
         """Returns the id of the resource."""
         if self._id_attr is None or not hasattr(self, self._id_attr):
@@ -252,26 +286,30 @@ class RESTObject:
         return obj_id
 
 
-TObjCls = TypeVar("TObjCls", bound=RESTObject)
+def _class_module(cls: type) -> ModuleType:
+    module = sys.modules.get(cls.__module__)
+    if module is None:
+        module = importlib.import_module(cls.__module__)
+    return module
 
 
-class RESTObjectList(Generic[TObjCls]):
-    """Generator object representing a list of RESTObject's.
+RESTObject._module = _class_module(RESTObject)
 
-    This generator uses the Gitlab pagination system to fetch new data when
-    required.
+TObjCls = TypeVar("TObjCls", bound=RESTObject)
 
-    Note: you should not instantiate such objects, they are returned by calls
-    to RESTManager.list()
 
-    Args:
-        manager: Manager to attach to the created objects
-        obj_cls: Type of objects to create from the json data
-        _list: A GitlabList object
-    """
+class _BaseRESTObjectList(Generic[TObjCls]):
+    """Pagination properties shared by RESTObjectList and AsyncRESTObjectList."""
+
+    _list: GitlabList | AsyncGitlabList
 
     def __init__(
-        self, manager: RESTManager[TObjCls], obj_cls: type[TObjCls], _list: GitlabList
+        self,
+        manager: RESTManager[TObjCls],
+        obj_cls: type[TObjCls],
+        _list: GitlabList | AsyncGitlabList,
+        *,
+        as_dicts: bool = False,
     ) -> None:
         """Creates an objects list from a GitlabList.
 
@@ -282,27 +320,24 @@ class RESTObjectList(Generic[TObjCls]):
             manager: the RESTManager to attach to the objects
             obj_cls: the class of the created objects
             _list: the GitlabList holding the data
+            as_dicts: If True, return the items as parsed from the server
+                instead of building objects
         """
         self.manager = manager
         self._obj_cls = obj_cls
         self._list = _list
-
-    def __iter__(self) -> RESTObjectList[TObjCls]:
-        return self
+        self._as_dicts = as_dicts
 
     def __len__(self) -> int:
         return len(self._list)
 
-    def __next__(self) -> TObjCls:
-        return self.next()
-
-    def next(self) -> TObjCls:
-        data = self._list.next()
-        return self._obj_cls(self.manager, data, created_from_list=True)
-
     @property
-    def current_page(self) -> int:
-        """The current page number."""
+    def current_page(self) -> int | None:
+        """The current page number.
+
+        If None, the page number is not known yet (or at all, with keyset
+        pagination).
+        """
         return self._list.current_page
 
     @property
@@ -337,6 +372,105 @@ class RESTObjectList(Generic[TObjCls]):
         return self._list.total
 
 
+class RESTObjectList(_BaseRESTObjectList[TObjCls]):
+    """Generator object representing a list of RESTObject's.
+
+    This generator uses the Gitlab pagination system to fetch new data when
+    required.
+
+    Note: you should not instantiate such objects, they are returned by calls
+    to RESTManager.list()
+
+    Args:
+        manager: Manager to attach to the created objects
+        obj_cls: Type of objects to create from the json data
+        _list: A GitlabList object
+    """
+
+    _list: GitlabList
+
+    def __iter__(self) -> RESTObjectList[TObjCls]:
+        return self
+
+    def __next__(self) -> TObjCls:
+        return self.next()
+
+    def next(self) -> TObjCls:
+        data = self._list.next()
+        if self._as_dicts:
+            return data  # type: ignore[no-any-return]
+        return self._obj_cls(self.manager, data, created_from_list=True)
+
+
+class AsyncRESTObjectList(_BaseRESTObjectList[TObjCls]):
+    """Async generator object representing a list of RESTObject's.
+
+    Returned by RESTManager.list(iterator=True) when using
+    :class:`~gitlab.AsyncGitlab`, and consumed with ``async for``.
+
+    Args:
+        manager: Manager to attach to the created objects
+        obj_cls: Type of objects to create from the json data
+        _list: An AsyncGitlabList object
+    """
+
+    _list: AsyncGitlabList
+
+    def __aiter__(self) -> AsyncRESTObjectList[TObjCls]:
+        return self
+
+    async def __anext__(self) -> TObjCls:
+        return await self.next()
+
+    async def next(self) -> TObjCls:
+        data = await self._list.next()
+        if self._as_dicts:
+            return data  # type: ignore[no-any-return]
+        return self._obj_cls(self.manager, data, created_from_list=True)
+
+    async def aclose(self) -> None:
+        """Cancel the pages being fetched in the background, if any."""
+        await self._list.aclose()
+
+
+def build_object_list(
+    manager: RESTManager[Any],
+    obj_cls: type[TObjCls],
+    result: Any,
+    *,
+    created_from_list: bool = True,
+    as_dicts: bool = False,
+) -> Any:
+    """Build REST objects from the result of ``Gitlab.http_list()``.
+
+    Args:
+        manager: Manager to attach to the created objects
+        obj_cls: Type of objects to create from the json data
+        result: A GitlabList, an AsyncGitlabList, or a list of items (or an
+            awaitable resolving to it)
+        created_from_list: Passed to the objects built from a list of items
+        as_dicts: If True, keep the items as parsed from the server instead
+            of building objects
+
+    Returns:
+        A RESTObjectList or an AsyncRESTObjectList when iterating over pages,
+        otherwise a list of objects (or an awaitable resolving to it)
+    """
+    if isinstance(result, GitlabList):
+        return RESTObjectList(manager, obj_cls, result, as_dicts=as_dicts)
+    if isinstance(result, AsyncGitlabList):
+        return AsyncRESTObjectList(manager, obj_cls, result, as_dicts=as_dicts)
+    if as_dicts:
+        return result
+    return utils.map_result(
+        result,
+        lambda items: [
+            obj_cls(manager, item, created_from_list=created_from_list)
+            for item in items
+        ],
+    )
+
+
 class RESTManager(Generic[TObjCls]):
     """Base class for CRUD operations on objects.
 
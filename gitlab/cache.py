@@ -0,0 +1,378 @@
+"""Caches of the responses sent by the GitLab server.
+
+The storages of the HTTP cache keep responses carrying an ``ETag`` or
+``Last-Modified`` header, sent again with ``If-None-Match``/``If-Modified-Since``.
+When the server answers 304 (Not Modified), the stored body is used instead of
+downloading it again.
+
+:class:`TTLCache` instead keeps the objects returned by ``get()`` for a given
+time, per manager class, without contacting the server at all.
+"""
+
+from __future__ import annotations
+
+import abc
+import base64
+import collections
+import copy
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+__all__ = ["CacheEntry", "CacheStorage", "MemoryCache", "DiskCache", "TTLCache"]
+
+#: Default byte budget of a MemoryCache
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+#: Default number of objects kept by a TTLCache
+DEFAULT_MAX_ENTRIES = 1024
+
+# Headers that describe the transfer rather than the cached (decoded) body
+_TRANSFER_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+@dataclasses.dataclass
+class CacheEntry:
+    """A cached response body and the validators to revalidate it."""
+
+    content: bytes
+    headers: dict[str, str]
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @classmethod
+    def from_response(
+        cls, headers: Mapping[str, str], content: bytes
+    ) -> CacheEntry | None:
+        """Build an entry from a response, None if it has no validator."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return None
+        return cls(
+            content=content,
+            headers=_cacheable_headers(headers),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    @property
+    def size(self) -> int:
+        """Approximate size, in bytes, used by the entry."""
+        return len(self.content) + sum(len(k) + len(v) for k, v in self.headers.items())
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the headers revalidating the entry with the server."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated(self, headers: Mapping[str, str]) -> CacheEntry:
+        """Return the entry updated with the headers of a 304 response.
+
+        The ``Content-*`` headers describe the stored body, so they are kept.
+        """
+        updated = {
+            **self.headers,
+            **{
+                k: v
+                for k, v in _cacheable_headers(headers).items()
+                if not k.lower().startswith("content-")
+            },
+        }
+        return dataclasses.replace(
+            self,
+            headers=updated,
+            etag=headers.get("ETag", self.etag),
+            last_modified=headers.get("Last-Modified", self.last_modified),
+        )
+
+
+def _cacheable_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    return {k: v for k, v in headers.items() if k.lower() not in _TRANSFER_HEADERS}
+
+
+def cache_key(request_key: Any) -> str:
+    """Hash a request key, so that credentials are not stored in clear."""
+    return hashlib.sha256(repr(request_key).encode()).hexdigest()
+
+
+class CacheStorage(abc.ABC):
+    """Storage of cache entries. Implementations must be thread-safe."""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored for ``key``, None if there is none."""
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` for ``key``."""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry stored for ``key``, if any."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all the entries."""
+
+
+class MemoryCache(CacheStorage):
+    """In-memory storage evicting the least recently used entries.
+
+    Args:
+        max_bytes: Total size, in bytes, of the stored entries. Entries
+            larger than this are not stored.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: collections.OrderedDict[str, CacheEntry] = (
+            collections.OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_lock")
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Total size, in bytes, of the stored entries."""
+        return self._size
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._remove(key)
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+
+class DiskCache(CacheStorage):
+    """On-disk storage, one file per entry, shared between processes.
+
+    Args:
+        directory: Directory where the entries are stored, created if needed
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+            return CacheEntry(
+                content=base64.b64decode(data["content"]),
+                headers=data["headers"],
+                etag=data["etag"],
+                last_modified=data["last_modified"],
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        data = {
+            "content": base64.b64encode(entry.content).decode(),
+            "headers": entry.headers,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+        # Write to a temporary file first, so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+@dataclasses.dataclass
+class _TTLEntry:
+    data: dict[str, Any]
+    expires: float
+    paths: tuple[str, ...]
+
+
+class TTLCache:
+    """Cache of the objects returned by ``get()``, kept for a time per manager.
+
+    Cached objects are returned without contacting the server until their
+    time to live expires. Writes made by the same client through ``create()``,
+    ``update()``/``save()``, ``set()`` and ``delete()`` invalidate the objects
+    under the written path. Objects are kept per credentials, so clients
+    authenticated as different users can share a cache.
+
+    Args:
+        policies: Time to live, in seconds, of the objects per manager class
+            (subclasses included). None or 0 disables caching for a class.
+        default_ttl: Time to live of the objects of the other managers (None
+            to not cache them)
+        max_entries: Number of objects kept, the least recently used ones
+            are evicted first
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[type, float | None] | None = None,
+        *,
+        default_ttl: float | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.policies = dict(policies or {})
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        #: Number of lookups answered from the cache
+        self.hits = 0
+        #: Number of lookups not answered from the cache
+        self.misses = 0
+        self._entries: collections.OrderedDict[Any, _TTLEntry] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_lock")
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def ttl(self, manager_cls: type) -> float | None:
+        """Return the time to live of the objects of a manager class, None if
+        they are not cached."""
+        for cls in manager_cls.__mro__:
+            if cls in self.policies:
+                return self.policies[cls] or None
+        return self.default_ttl or None
+
+    @staticmethod
+    def key(path: str, options: Mapping[str, Any], credentials: Any = None) -> Any:
+        """Return the key of the object at ``path`` requested with ``options``
+        and ``credentials``, which are hashed so that they are not stored in
+        clear."""
+        return (path, repr(sorted(options.items())), cache_key(credentials))
+
+    def get(self, key: Any) -> dict[str, Any] | None:
+        """Return a copy of the data stored for ``key``, None if there is none
+        or it expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return copy.deepcopy(entry.data)
+
+    def set(
+        self, key: Any, data: dict[str, Any], ttl: float, paths: Iterable[str] = ()
+    ) -> None:
+        """Store a copy of ``data`` for ``ttl`` seconds.
+
+        Args:
+            key: Key returned by :meth:`key`
+            data: Attributes of the object
+            ttl: Time to live, in seconds
+            paths: Other paths of the object (e.g. with its numeric ID instead
+                of its full path) invalidating it
+        """
+        entry = _TTLEntry(
+            data=copy.deepcopy(data),
+            expires=time.monotonic() + ttl,
+            paths=(_normalize(key[0]), *(_normalize(p) for p in paths)),
+        )
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        """Remove the objects at ``path`` and below it."""
+        path = _normalize(path)
+        prefix = f"{path}/"
+        with self._lock:
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if any(p == path or p.startswith(prefix) for p in entry.paths)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all the objects, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+def _normalize(path: str) -> str:
+    return path.rstrip("/")
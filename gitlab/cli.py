@@ -98,9 +98,10 @@ def die(msg: str, e: Exception | None = None) -> NoReturn:
 def gitlab_resource_to_cls(
     gitlab_resource: str, namespace: ModuleType
 ) -> type[RESTObject]:
-    classes = CaseInsensitiveDict(namespace.__dict__)
+    # dir() also lists the names of lazily imported modules
+    names = CaseInsensitiveDict({name: name for name in dir(namespace)})
     lowercase_class = gitlab_resource.replace("-", "")
-    class_type = classes[lowercase_class]
+    class_type = getattr(namespace, names[lowercase_class])
     if TYPE_CHECKING:
         assert isinstance(class_type, type)
         assert issubclass(class_type, RESTObject)
@@ -283,13 +284,28 @@ def _get_base_parser(add_help: bool = True) -> argparse.ArgumentParser:
     return parser
 
 
-def _get_parser() -> argparse.ArgumentParser:
+def _get_parser(gitlab_resource: str | None = None) -> argparse.ArgumentParser:
     # NOTE: We must delay import of gitlab.v4.cli until now or
     # otherwise it will cause circular import errors
     from gitlab.v4 import cli as v4_cli
 
     parser = _get_base_parser()
-    return v4_cli.extend_parser(parser)
+    return v4_cli.extend_parser(parser, gitlab_resource=gitlab_resource)
+
+
+def _requested_resource(remaining_args: list[str]) -> str | None:
+    """Return the resource named on the command line, if the parser of this
+    resource alone is enough to parse it.
+
+    ``remaining_args`` are the arguments the base parser did not consume,
+    starting with the program name. The whole parser is needed to list the
+    resources (e.g. ``gitlab --help``) and to complete the command line.
+    """
+    if "_ARGCOMPLETE" in os.environ:
+        return None
+    if len(remaining_args) < 2 or remaining_args[1].startswith("-"):
+        return None
+    return remaining_args[1]
 
 
 def _parse_value(v: Any) -> Any:
@@ -334,7 +350,7 @@ def main() -> None:
     # This first parsing step is used to find the gitlab config to use, and
     # load the propermodule (v3 or v4) accordingly. At that point we don't have
     # any subparser setup
-    (options, _) = parser.parse_known_args(sys.argv)
+    options, remaining_args = parser.parse_known_args(sys.argv)
     try:
         config = gitlab.config.GitlabConfigParser(options.gitlab, options.config_file)
     except gitlab.config.ConfigError as e:
@@ -346,8 +362,10 @@ def main() -> None:
     if config.api_version not in ("4",):  # dead code # pragma: no cover
         raise ModuleNotFoundError(f"gitlab.v{config.api_version}.cli")
 
-    # Now we build the entire set of subcommands and do the complete parsing
-    parser = _get_parser()
+    # Now we build the subcommands and do the complete parsing. Only the
+    # subcommands of the requested resource are built when possible, as
+    # building all of them takes most of the start-up time.
+    parser = _get_parser(_requested_resource(remaining_args))
     try:
         import argcomplete  # type: ignore
 
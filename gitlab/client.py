@@ -2,30 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import dataclasses
+import importlib.util
 import os
 import re
-from typing import Any, BinaryIO, cast, TYPE_CHECKING, Union
+import threading
+from typing import (
+    Any,
+    AsyncGenerator,
+    BinaryIO,
+    Callable,
+    cast,
+    Hashable,
+    Iterable,
+    Iterator,
+    NoReturn,
+    TYPE_CHECKING,
+    TypeVar,
+    Union,
+)
 from urllib import parse
 
 import requests
 
 import gitlab
+import gitlab.cache
 import gitlab.config
 import gitlab.const
 import gitlab.exceptions
+import gitlab.json_codec
 from gitlab import _backends, utils
 
-try:
-    import gql
-    import gql.transport.exceptions
+if TYPE_CHECKING:
     import graphql
     import httpx
 
+    from gitlab.v4 import objects
+
     from ._backends.graphql import GitlabAsyncTransport, GitlabTransport
 
-    _GQL_INSTALLED = True
-except ImportError:  # pragma: no cover
-    _GQL_INSTALLED = False
+# gql is slow to import, so the GraphQL clients only import it when created
+_GQL_INSTALLED = all(
+    importlib.util.find_spec(name) is not None for name in ("gql", "graphql", "httpx")
+)
 
 
 REDIRECT_MSG = (
@@ -35,12 +56,84 @@ REDIRECT_MSG = (
 )
 
 
+_T = TypeVar("_T")
+
+
+def _has_header(headers: dict[str, Any], name: str) -> bool:
+    return any(key.lower() == name.lower() for key in headers)
+
+
+class _ManagerDescriptor:
+    """Create a manager of a Gitlab client on first access.
+
+    The manager is then stored in the instance ``__dict__``, which takes
+    precedence over this (non-data) descriptor on later accesses.
+    """
+
+    def __init__(self, attr: str, cls_name: str) -> None:
+        self._attr = attr
+        self._cls_name = cls_name
+
+    def __get__(self, gl: Gitlab | None, objtype: Any = None) -> Any:
+        if gl is None:
+            return self
+        manager = getattr(gl._objects, self._cls_name)(gl)
+        gl.__dict__[self._attr] = manager
+        return manager
+
+
+class _SingleFlight:
+    """Share the outcome of identical calls running at the same time.
+
+    The first caller for a key runs the call, the callers arriving while it
+    is in flight wait for it and get the same result or exception. Nothing
+    is kept once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, concurrent.futures.Future[Any]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: Hashable, func: Callable[[], _T]) -> _T:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                leader = False
+            else:
+                leader = True
+                future = self._calls[key] = concurrent.futures.Future()
+        if not leader:
+            return future.result()  # type: ignore[no-any-return]
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
 # https://docs.gitlab.com/ee/api/#offset-based-pagination
 _PAGINATION_URL = (
     f"https://python-gitlab.readthedocs.io/en/v{gitlab.__version__}/"
     f"api-usage.html#pagination"
 )
 
+# Size of the chunks read from the connection when streaming the items of a list
+_JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class Gitlab:
     """Represents a GitLab server connection.
@@ -64,12 +157,110 @@ class Gitlab:
             or 52x responses. Defaults to False.
         keep_base_url: keep user-provided base URL for pagination if it
             differs from response headers
+        rate_limiter: A :class:`~gitlab.utils.RateLimiter` pacing requests
+            to the rate limit announced by the server. It can be shared by
+            several clients using the same token.
+        coalesce_requests: Whether identical GET requests sent at the same
+            time (same URL, parameters and headers) share a single request
+            to the server.
+        http_cache: A :class:`~gitlab.cache.CacheStorage` where responses
+            with an ``ETag`` or ``Last-Modified`` header are stored, to be
+            revalidated with conditional requests instead of downloaded again.
+        json_codec: The :class:`~gitlab.json_codec.JSONCodec` decoding the
+            responses and encoding the request bodies, or its name: "json"
+            (standard library), "orjson", "msgspec", or "auto" (default) for
+            the fastest installed one.
+        response_cache: A :class:`~gitlab.cache.TTLCache` keeping the objects
+            returned by ``get()`` for a time, per manager class.
 
     Keyword Args:
         requests.Session session: HTTP Requests Session
         RequestsBackend backend: Backend that will be used to make http requests
     """
 
+    broadcastmessages: objects.BroadcastMessageManager
+    """See :class:`~gitlab.v4.objects.BroadcastMessageManager`"""
+    bulk_imports: objects.BulkImportManager
+    """See :class:`~gitlab.v4.objects.BulkImportManager`"""
+    bulk_import_entities: objects.BulkImportAllEntityManager
+    """See :class:`~gitlab.v4.objects.BulkImportAllEntityManager`"""
+    ci_lint: objects.CiLintManager
+    """See :class:`~gitlab.v4.objects.CiLintManager`"""
+    deploykeys: objects.DeployKeyManager
+    """See :class:`~gitlab.v4.objects.DeployKeyManager`"""
+    deploytokens: objects.DeployTokenManager
+    """See :class:`~gitlab.v4.objects.DeployTokenManager`"""
+    geonodes: objects.GeoNodeManager
+    """See :class:`~gitlab.v4.objects.GeoNodeManager`"""
+    gitlabciymls: objects.GitlabciymlManager
+    """See :class:`~gitlab.v4.objects.GitlabciymlManager`"""
+    gitignores: objects.GitignoreManager
+    """See :class:`~gitlab.v4.objects.GitignoreManager`"""
+    groups: objects.GroupManager
+    """See :class:`~gitlab.v4.objects.GroupManager`"""
+    hooks: objects.HookManager
+    """See :class:`~gitlab.v4.objects.HookManager`"""
+    issues: objects.IssueManager
+    """See :class:`~gitlab.v4.objects.IssueManager`"""
+    issues_statistics: objects.IssuesStatisticsManager
+    """See :class:`~gitlab.v4.objects.IssuesStatisticsManager`"""
+    keys: objects.KeyManager
+    """See :class:`~gitlab.v4.objects.KeyManager`"""
+    ldapgroups: objects.LDAPGroupManager
+    """See :class:`~gitlab.v4.objects.LDAPGroupManager`"""
+    licenses: objects.LicenseManager
+    """See :class:`~gitlab.v4.objects.LicenseManager`"""
+    namespaces: objects.NamespaceManager
+    """See :class:`~gitlab.v4.objects.NamespaceManager`"""
+    member_roles: objects.MemberRoleManager
+    """See :class:`~gitlab.v4.objects.MemberRoleManager`"""
+    mergerequests: objects.MergeRequestManager
+    """See :class:`~gitlab.v4.objects.MergeRequestManager`"""
+    notificationsettings: objects.NotificationSettingsManager
+    """See :class:`~gitlab.v4.objects.NotificationSettingsManager`"""
+    projects: objects.ProjectManager
+    """See :class:`~gitlab.v4.objects.ProjectManager`"""
+    registry_repositories: objects.RegistryRepositoryManager
+    """See :class:`~gitlab.v4.objects.RegistryRepositoryManager`"""
+    runners: objects.RunnerManager
+    """See :class:`~gitlab.v4.objects.RunnerManager`"""
+    runners_all: objects.RunnerAllManager
+    """See :class:`~gitlab.v4.objects.RunnerManager`"""
+    settings: objects.ApplicationSettingsManager
+    """See :class:`~gitlab.v4.objects.ApplicationSettingsManager`"""
+    appearance: objects.ApplicationAppearanceManager
+    """See :class:`~gitlab.v4.objects.ApplicationAppearanceManager`"""
+    sidekiq: objects.SidekiqManager
+    """See :class:`~gitlab.v4.objects.SidekiqManager`"""
+    snippets: objects.SnippetManager
+    """See :class:`~gitlab.v4.objects.SnippetManager`"""
+    users: objects.UserManager
+    """See :class:`~gitlab.v4.objects.UserManager`"""
+    todos: objects.TodoManager
+    """See :class:`~gitlab.v4.objects.TodoManager`"""
+    dockerfiles: objects.DockerfileManager
+    """See :class:`~gitlab.v4.objects.DockerfileManager`"""
+    events: objects.EventManager
+    """See :class:`~gitlab.v4.objects.EventManager`"""
+    audit_events: objects.AuditEventManager
+    """See :class:`~gitlab.v4.objects.AuditEventManager`"""
+    features: objects.FeatureManager
+    """See :class:`~gitlab.v4.objects.FeatureManager`"""
+    pagesdomains: objects.PagesDomainManager
+    """See :class:`~gitlab.v4.objects.PagesDomainManager`"""
+    user_activities: objects.UserActivitiesManager
+    """See :class:`~gitlab.v4.objects.UserActivitiesManager`"""
+    applications: objects.ApplicationManager
+    """See :class:`~gitlab.v4.objects.ApplicationManager`"""
+    variables: objects.VariableManager
+    """See :class:`~gitlab.v4.objects.VariableManager`"""
+    personal_access_tokens: objects.PersonalAccessTokenManager
+    """See :class:`~gitlab.v4.objects.PersonalAccessTokenManager`"""
+    topics: objects.TopicManager
+    """See :class:`~gitlab.v4.objects.TopicManager`"""
+    statistics: objects.ApplicationStatisticsManager
+    """See :class:`~gitlab.v4.objects.ApplicationStatisticsManager`"""
+
     def __init__(
         self,
         url: str | None = None,
@@ -87,6 +278,11 @@ class Gitlab:
         user_agent: str = gitlab.const.USER_AGENT,
         retry_transient_errors: bool = False,
         keep_base_url: bool = False,
+        rate_limiter: utils.RateLimiter | None = None,
+        coalesce_requests: bool = False,
+        http_cache: gitlab.cache.CacheStorage | None = None,
+        response_cache: gitlab.cache.TTLCache | None = None,
+        json_codec: str | gitlab.json_codec.JSONCodec = "auto",
         **kwargs: Any,
     ) -> None:
         self._api_version = str(api_version)
@@ -98,6 +294,17 @@ class Gitlab:
         self.timeout = timeout
         self.retry_transient_errors = retry_transient_errors
         self.keep_base_url = keep_base_url
+        #: Limiter pacing requests to the server rate limit
+        self.rate_limiter = rate_limiter
+        #: Whether identical in-flight GET requests share one response
+        self.coalesce_requests = coalesce_requests
+        self._single_flight = _SingleFlight()
+        #: Storage of the responses revalidated with conditional requests
+        self.http_cache = http_cache
+        #: Cache of the objects returned by ``get()``
+        self.response_cache = response_cache
+        #: Codec decoding the responses and encoding the request bodies
+        self.json_codec = gitlab.json_codec.get_codec(json_codec)
         #: Headers that will be used in request to GitLab
         self.headers = {"User-Agent": user_agent}
 
@@ -132,89 +339,6 @@ class Gitlab:
         self._objects = objects
         self.user: objects.CurrentUser | None = None
 
-        self.broadcastmessages = objects.BroadcastMessageManager(self)
-        """See :class:`~gitlab.v4.objects.BroadcastMessageManager`"""
-        self.bulk_imports = objects.BulkImportManager(self)
-        """See :class:`~gitlab.v4.objects.BulkImportManager`"""
-        self.bulk_import_entities = objects.BulkImportAllEntityManager(self)
-        """See :class:`~gitlab.v4.objects.BulkImportAllEntityManager`"""
-        self.ci_lint = objects.CiLintManager(self)
-        """See :class:`~gitlab.v4.objects.CiLintManager`"""
-        self.deploykeys = objects.DeployKeyManager(self)
-        """See :class:`~gitlab.v4.objects.DeployKeyManager`"""
-        self.deploytokens = objects.DeployTokenManager(self)
-        """See :class:`~gitlab.v4.objects.DeployTokenManager`"""
-        self.geonodes = objects.GeoNodeManager(self)
-        """See :class:`~gitlab.v4.objects.GeoNodeManager`"""
-        self.gitlabciymls = objects.GitlabciymlManager(self)
-        """See :class:`~gitlab.v4.objects.GitlabciymlManager`"""
-        self.gitignores = objects.GitignoreManager(self)
-        """See :class:`~gitlab.v4.objects.GitignoreManager`"""
-        self.groups = objects.GroupManager(self)
-        """See :class:`~gitlab.v4.objects.GroupManager`"""
-        self.hooks = objects.HookManager(self)
-        """See :class:`~gitlab.v4.objects.HookManager`"""
-        self.issues = objects.IssueManager(self)
-        """See :class:`~gitlab.v4.objects.IssueManager`"""
-        self.issues_statistics = objects.IssuesStatisticsManager(self)
-        """See :class:`~gitlab.v4.objects.IssuesStatisticsManager`"""
-        self.keys = objects.KeyManager(self)
-        """See :class:`~gitlab.v4.objects.KeyManager`"""
-        self.ldapgroups = objects.LDAPGroupManager(self)
-        """See :class:`~gitlab.v4.objects.LDAPGroupManager`"""
-        self.licenses = objects.LicenseManager(self)
-        """See :class:`~gitlab.v4.objects.LicenseManager`"""
-        self.namespaces = objects.NamespaceManager(self)
-        """See :class:`~gitlab.v4.objects.NamespaceManager`"""
-        self.member_roles = objects.MemberRoleManager(self)
-        """See :class:`~gitlab.v4.objects.MergeRequestManager`"""
-        self.mergerequests = objects.MergeRequestManager(self)
-        """See :class:`~gitlab.v4.objects.MergeRequestManager`"""
-        self.notificationsettings = objects.NotificationSettingsManager(self)
-        """See :class:`~gitlab.v4.objects.NotificationSettingsManager`"""
-        self.projects = objects.ProjectManager(self)
-        """See :class:`~gitlab.v4.objects.ProjectManager`"""
-        self.registry_repositories = objects.RegistryRepositoryManager(self)
-        """See :class:`~gitlab.v4.objects.RegistryRepositoryManager`"""
-        self.runners = objects.RunnerManager(self)
-        """See :class:`~gitlab.v4.objects.RunnerManager`"""
-        self.runners_all = objects.RunnerAllManager(self)
-        """See :class:`~gitlab.v4.objects.RunnerManager`"""
-        self.settings = objects.ApplicationSettingsManager(self)
-        """See :class:`~gitlab.v4.objects.ApplicationSettingsManager`"""
-        self.appearance = objects.ApplicationAppearanceManager(self)
-        """See :class:`~gitlab.v4.objects.ApplicationAppearanceManager`"""
-        self.sidekiq = objects.SidekiqManager(self)
-        """See :class:`~gitlab.v4.objects.SidekiqManager`"""
-        self.snippets = objects.SnippetManager(self)
-        """See :class:`~gitlab.v4.objects.SnippetManager`"""
-        self.users = objects.UserManager(self)
-        """See :class:`~gitlab.v4.objects.UserManager`"""
-        self.todos = objects.TodoManager(self)
-        """See :class:`~gitlab.v4.objects.TodoManager`"""
-        self.dockerfiles = objects.DockerfileManager(self)
-        """See :class:`~gitlab.v4.objects.DockerfileManager`"""
-        self.events = objects.EventManager(self)
-        """See :class:`~gitlab.v4.objects.EventManager`"""
-        self.audit_events = objects.AuditEventManager(self)
-        """See :class:`~gitlab.v4.objects.AuditEventManager`"""
-        self.features = objects.FeatureManager(self)
-        """See :class:`~gitlab.v4.objects.FeatureManager`"""
-        self.pagesdomains = objects.PagesDomainManager(self)
-        """See :class:`~gitlab.v4.objects.PagesDomainManager`"""
-        self.user_activities = objects.UserActivitiesManager(self)
-        """See :class:`~gitlab.v4.objects.UserActivitiesManager`"""
-        self.applications = objects.ApplicationManager(self)
-        """See :class:`~gitlab.v4.objects.ApplicationManager`"""
-        self.variables = objects.VariableManager(self)
-        """See :class:`~gitlab.v4.objects.VariableManager`"""
-        self.personal_access_tokens = objects.PersonalAccessTokenManager(self)
-        """See :class:`~gitlab.v4.objects.PersonalAccessTokenManager`"""
-        self.topics = objects.TopicManager(self)
-        """See :class:`~gitlab.v4.objects.TopicManager`"""
-        self.statistics = objects.ApplicationStatisticsManager(self)
-        """See :class:`~gitlab.v4.objects.ApplicationStatisticsManager`"""
-
     def __enter__(self) -> Gitlab:
         return self
 
@@ -444,7 +568,7 @@ class Gitlab:
         if TYPE_CHECKING:
             assert not isinstance(data, requests.Response)
             assert isinstance(data["html"], str)
-        return data["html"]
+        return utils.map_result(data, lambda data: data["html"])
 
     @gitlab.exceptions.on_http_error(gitlab.exceptions.GitlabLicenseError)
     def get_license(self, **kwargs: Any) -> dict[str, str | dict[str, str]]:
@@ -461,9 +585,9 @@ class Gitlab:
             The current license information
         """
         result = self.http_get("/license", **kwargs)
-        if isinstance(result, dict):
-            return result
-        return {}
+        return utils.map_result(
+            result, lambda result: result if isinstance(result, dict) else {}
+        )
 
     @gitlab.exceptions.on_http_error(gitlab.exceptions.GitlabLicenseError)
     def set_license(self, license: str, **kwargs: Any) -> dict[str, Any]:
@@ -606,6 +730,85 @@ class Gitlab:
         )
         return url
 
+    def _credentials(self) -> tuple[str | None, ...]:
+        """Return the credentials the requests are authenticated with.
+
+        They are part of the keys of cached responses, as the authentication
+        headers are only added when a request is sent.
+        """
+        return (
+            self.private_token,
+            self.oauth_token,
+            self.job_token,
+            self.http_username,
+            self.http_password,
+        )
+
+    def _request_key(
+        self,
+        verb: str,
+        url: str,
+        params: dict[str, Any],
+        headers: dict[str, Any],
+        *,
+        streamed: bool,
+        post_data: Any,
+        files: Any,
+    ) -> Hashable | None:
+        """Return the key identifying a plain GET request, None for others.
+
+        Responses to GET requests without a body can be shared between
+        identical requests with the same credentials, and revalidated from
+        the HTTP cache.
+        """
+        if verb.lower() != "get" or streamed or post_data is not None or files:
+            return None
+        return (
+            url,
+            repr(sorted(params.items())),
+            repr(sorted(headers.items())),
+            self._credentials(),
+        )
+
+    def _cache_lookup(
+        self, request_key: Hashable | None
+    ) -> tuple[str | None, gitlab.cache.CacheEntry | None]:
+        if self.http_cache is None or request_key is None:
+            return None, None
+        key = gitlab.cache.cache_key(request_key)
+        return key, self.http_cache.get(key)
+
+    def _store_in_cache(self, key: str, response: Any) -> None:
+        assert self.http_cache is not None
+        entry = gitlab.cache.CacheEntry.from_response(
+            response.headers, response.content
+        )
+        if entry is not None:
+            self.http_cache.set(key, entry)
+
+    def _revalidated_response(
+        self, key: str, entry: gitlab.cache.CacheEntry, response: Any
+    ) -> Any:
+        """Return the cached response, confirmed fresh by a 304 ``response``."""
+        assert self.http_cache is not None
+        entry = entry.revalidated(response.headers)
+        self.http_cache.set(key, entry)
+        return self._response_from_cache(entry, response)
+
+    @staticmethod
+    def _response_from_cache(
+        entry: gitlab.cache.CacheEntry, response: requests.Response
+    ) -> requests.Response:
+        cached = requests.Response()
+        cached.status_code = 200
+        cached.reason = "OK"
+        cached.headers = requests.structures.CaseInsensitiveDict(entry.headers)
+        cached._content = entry.content
+        cached.encoding = requests.utils.get_encoding_from_headers(cached.headers)
+        cached.url = response.url
+        cached.request = response.request
+        return cached
+
     @staticmethod
     def _check_redirects(result: requests.Response) -> None:
         # Check the requests history to detect 301/302 redirections.
@@ -632,6 +835,118 @@ class Gitlab:
                 )
             )
 
+    def _prepare_url_and_params(
+        self, path: str, query_data: dict[str, Any] | None, kwargs: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the request URL (without query string) and query parameters.
+
+        Returns:
+            A tuple of the URL and the query parameters to send
+        """
+        query_data = query_data or {}
+        raw_url = self._build_url(path)
+
+        # parse user-provided URL params to ensure we don't add our own duplicates
+        parsed = parse.urlparse(raw_url)
+        params = parse.parse_qs(parsed.query)
+        utils.copy_dict(src=query_data, dest=params)
+
+        url = parse.urlunparse(parsed._replace(query=""))
+
+        # Deal with kwargs: by default a user uses kwargs to send data to the
+        # gitlab server, but this generates problems (python keyword conflicts
+        # and python-gitlab/gitlab conflicts).
+        # So we provide a `query_parameters` key: if it's there we use its dict
+        # value as arguments for the gitlab server, and ignore the other
+        # arguments, except pagination ones (per_page and page)
+        if "query_parameters" in kwargs:
+            utils.copy_dict(src=kwargs["query_parameters"], dest=params)
+            for arg in ("per_page", "page"):
+                if arg in kwargs:
+                    params[arg] = kwargs[arg]
+        else:
+            utils.copy_dict(src=kwargs, dest=params)
+
+        return url, params
+
+    @staticmethod
+    def _raise_for_response(result: _backends.protocol.BackendResponse) -> NoReturn:
+        """Raise the exception matching an unsuccessful response.
+
+        Raises:
+            GitlabAuthenticationError: If the response code is 401
+            GitlabHttpError: For any other response code
+        """
+        error_message = result.content
+        try:
+            error_json = result.json()
+            for k in ("message", "error"):
+                if k in error_json:
+                    error_message = error_json[k]
+        except (KeyError, ValueError, TypeError):
+            pass
+
+        if result.status_code == 401:
+            raise gitlab.exceptions.GitlabAuthenticationError(
+                response_code=result.status_code,
+                error_message=error_message,
+                response_body=result.content,
+            )
+
+        raise gitlab.exceptions.GitlabHttpError(
+            response_code=result.status_code,
+            error_message=error_message,
+            response_body=result.content,
+        )
+
+    def _parse_json(self, result: Any) -> Any:
+        """Decode the JSON body of a response.
+
+        Raises:
+            GitlabParsingError: If the json data could not be parsed
+        """
+        try:
+            return self.json_codec.loads(result.content)
+        except Exception as e:
+            raise gitlab.exceptions.GitlabParsingError(
+                error_message="Failed to parse the server message"
+            ) from e
+
+    def _stream_json_items(
+        self, result: requests.Response, fields: frozenset[str] | None
+    ) -> Iterator[Any]:
+        """Decode the items of the JSON array of a streamed response, as they
+        are received.
+
+        Raises:
+            GitlabParsingError: If the json data could not be parsed
+        """
+        decoder = gitlab.json_codec.JSONArrayDecoder()
+        try:
+            for chunk in result.iter_content(chunk_size=_JSON_STREAM_CHUNK_SIZE):
+                yield from utils.select_fields(decoder.feed(chunk), fields)
+            yield from utils.select_fields(decoder.close(), fields)
+        except ValueError as e:
+            raise gitlab.exceptions.GitlabParsingError(
+                error_message="Failed to parse the server message"
+            ) from e
+        finally:
+            result.close()
+
+    @property
+    def _encodes_json(self) -> bool:
+        """Whether JSON request bodies are encoded with ``json_codec`` rather
+        than by the HTTP library, which uses the standard library."""
+        return not isinstance(self.json_codec, gitlab.json_codec.StdlibCodec)
+
+    def _as_result(self, value: Any) -> Any:
+        """Return a value computed without a request the way request results are
+        returned, so that callers can handle both alike.
+
+        The async client returns an awaitable instead.
+        """
+        return value
+
     def http_request(
         self,
         verb: str,
@@ -676,29 +991,7 @@ class Gitlab:
         Raises:
             GitlabHttpError: When the return code is not 2xx
         """
-        query_data = query_data or {}
-        raw_url = self._build_url(path)
-
-        # parse user-provided URL params to ensure we don't add our own duplicates
-        parsed = parse.urlparse(raw_url)
-        params = parse.parse_qs(parsed.query)
-        utils.copy_dict(src=query_data, dest=params)
-
-        url = parse.urlunparse(parsed._replace(query=""))
-
-        # Deal with kwargs: by default a user uses kwargs to send data to the
-        # gitlab server, but this generates problems (python keyword conflicts
-        # and python-gitlab/gitlab conflicts).
-        # So we provide a `query_parameters` key: if it's there we use its dict
-        # value as arguments for the gitlab server, and ignore the other
-        # arguments, except pagination ones (per_page and page)
-        if "query_parameters" in kwargs:
-            utils.copy_dict(src=kwargs["query_parameters"], dest=params)
-            for arg in ("per_page", "page"):
-                if arg in kwargs:
-                    params[arg] = kwargs[arg]
-        else:
-            utils.copy_dict(src=kwargs, dest=params)
+        url, params = self._prepare_url_and_params(path, query_data, kwargs)
 
         opts = self._get_session_opts()
 
@@ -713,65 +1006,89 @@ class Gitlab:
         # We need to deal with json vs. data when uploading files
         send_data = self._backend.prepare_send_data(files, post_data, raw)
         opts["headers"]["Content-type"] = send_data.content_type
+        if send_data.json is not None and self._encodes_json:
+            send_data = dataclasses.replace(
+                send_data, json=None, data=self.json_codec.dumps(send_data.json)
+            )
 
         if extra_headers is not None:
             opts["headers"].update(extra_headers)
 
+        request_key = self._request_key(
+            verb,
+            url,
+            params,
+            opts["headers"],
+            streamed=streamed,
+            post_data=post_data,
+            files=files,
+        )
+        cache_key, cached = self._cache_lookup(request_key)
+        if cached is not None:
+            opts["headers"].update(cached.conditional_headers())
+
         retry = utils.Retry(
             max_retries=max_retries,
             obey_rate_limit=obey_rate_limit,
             retry_transient_errors=retry_transient_errors,
         )
 
-        while True:
-            try:
-                result = self._backend.http_request(
-                    method=verb,
-                    url=url,
-                    json=send_data.json,
-                    data=send_data.data,
-                    params=params,
-                    timeout=timeout,
-                    verify=verify,
-                    stream=streamed,
-                    **opts,
-                )
-            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
-                if retry.handle_retry():
-                    continue
-                raise
-
-            self._check_redirects(result.response)
-
-            if 200 <= result.status_code < 300:
-                return result.response
+        def send() -> requests.Response:
+            nonlocal send_data
+            while True:
+                if self.rate_limiter is not None and obey_rate_limit:
+                    self.rate_limiter.acquire()
+                utils.rewind_uploads(post_data, files)
+                if files and retry.cur_retries:
+                    # A multipart body is consumed while it is sent, build a
+                    # new one from the rewound files to send it again.
+                    send_data = self._backend.prepare_send_data(files, post_data, raw)
+                    opts["headers"]["Content-type"] = send_data.content_type
+                try:
+                    result = self._backend.http_request(
+                        method=verb,
+                        url=url,
+                        json=send_data.json,
+                        data=send_data.data,
+                        params=params,
+                        timeout=timeout,
+                        verify=verify,
+                        stream=streamed,
+                        **opts,
+                    )
+                except (
+                    requests.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError,
+                ):
+                    if retry.handle_retry():
+                        continue
+                    raise
+
+                self._check_redirects(result.response)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(result.headers)
+
+                if cached is not None and result.status_code == 304:
+                    assert cache_key is not None
+                    return self._revalidated_response(  # type: ignore[no-any-return]
+                        cache_key, cached, result.response
+                    )
 
-            if retry.handle_retry_on_status(
-                result.status_code, result.headers, result.reason
-            ):
-                continue
+                if 200 <= result.status_code < 300:
+                    if cache_key is not None:
+                        self._store_in_cache(cache_key, result.response)
+                    return result.response
 
-            error_message = result.content
-            try:
-                error_json = result.json()
-                for k in ("message", "error"):
-                    if k in error_json:
-                        error_message = error_json[k]
-            except (KeyError, ValueError, TypeError):
-                pass
+                if retry.handle_retry_on_status(
+                    result.status_code, result.headers, result.reason
+                ):
+                    continue
 
-            if result.status_code == 401:
-                raise gitlab.exceptions.GitlabAuthenticationError(
-                    response_code=result.status_code,
-                    error_message=error_message,
-                    response_body=result.content,
-                )
+                self._raise_for_response(result)
 
-            raise gitlab.exceptions.GitlabHttpError(
-                response_code=result.status_code,
-                error_message=error_message,
-                response_body=result.content,
-            )
+        if self.coalesce_requests and request_key is not None:
+            return self._single_flight.do(request_key, send)
+        return send()
 
     def http_get(
         self,
@@ -779,6 +1096,7 @@ class Gitlab:
         query_data: dict[str, Any] | None = None,
         streamed: bool = False,
         raw: bool = False,
+        fields: Iterable[str] | None = None,
         **kwargs: Any,
     ) -> dict[str, Any] | requests.Response:
         """Make a GET request to the Gitlab server.
@@ -789,6 +1107,7 @@ class Gitlab:
             query_data: Data to send as query parameters
             streamed: Whether the data should be streamed
             raw: If True do not try to parse the output as json
+            fields: If set, only keep these keys of the parsed json data
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Returns:
@@ -807,17 +1126,220 @@ class Gitlab:
         content_type = utils.get_content_type(result.headers.get("Content-Type"))
 
         if content_type == "application/json" and not streamed and not raw:
+            json_result = utils.select_fields(self._parse_json(result), fields)
+            if TYPE_CHECKING:
+                assert isinstance(json_result, dict)
+            return json_result
+        return result
+
+    def http_download(
+        self,
+        path: str,
+        destination: utils.DownloadDestination,
+        query_data: dict[str, Any] | None = None,
+        *,
+        segments: int = 1,
+        **kwargs: Any,
+    ) -> utils.DownloadStats:
+        """Download a file from the Gitlab server to a path or file object.
+
+        Interrupted downloads are resumed with ``Range`` requests: right away
+        after a connection error if ``retry_transient_errors`` is enabled,
+        else by the next download to the same path (see
+        :class:`gitlab.utils.ResumableDownload`).
+
+        With ``segments``, large downloads to a path are split in byte ranges
+        fetched concurrently, each on its own connection, when the server
+        sends ``Accept-Ranges: bytes``. The first response provides the first
+        segment, so that servers which do not accept ranges are only queried
+        once. The download is started over as a single stream if the data
+        changes meanwhile.
+
+        Args:
+            path: Path or full URL to query ('/projects' or
+                        'http://whatever/v4/api/projecs')
+            destination: Path or binary file object to write the data to
+            query_data: Data to send as query parameters
+            segments: Maximum number of segments to fetch concurrently
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Returns:
+            The statistics of the download
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+        """
+        extra_headers = kwargs.pop("extra_headers", None) or {}
+        download = utils.ResumableDownload(
+            destination, resume=not _has_header(extra_headers, "Range")
+        )
+        retry = self._download_retry(kwargs)
+        try:
+            while True:
+                try:
+                    result = self.http_get(
+                        path,
+                        query_data=query_data,
+                        streamed=True,
+                        raw=True,
+                        extra_headers={**extra_headers, **download.request_headers()},
+                        **kwargs,
+                    )
+                except gitlab.exceptions.GitlabHttpError as e:
+                    if e.response_code == 416 and download.offset:
+                        # The data was already written, or does not match anymore
+                        download.restart()
+                        continue
+                    raise
+                if TYPE_CHECKING:
+                    assert isinstance(result, requests.Response)
+
+                try:
+                    if not download.start(result.status_code, result.headers):
+                        download.restart()
+                        continue
+                    bounds = download.split(
+                        result.status_code, result.headers, segments
+                    )
+                    if bounds:
+                        if not self._download_segments(
+                            path,
+                            query_data,
+                            result,
+                            download,
+                            bounds,
+                            extra_headers,
+                            kwargs,
+                        ):
+                            # The data changed meanwhile
+                            download.restart()
+                            segments = 1
+                            continue
+                    else:
+                        for chunk in utils.iter_response_chunks(result):
+                            download.write(chunk)
+                    if not download.complete:
+                        raise requests.exceptions.ChunkedEncodingError(
+                            "Connection closed before the download was complete"
+                        )
+                except (
+                    requests.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError,
+                ):
+                    if download.resumable and retry.handle_retry():
+                        download.stats.retries += 1
+                        continue
+                    raise
+                finally:
+                    result.close()
+                return download.finish()
+        except BaseException:
+            download.abort()
+            raise
+
+    def _download_retry(self, kwargs: dict[str, Any]) -> utils.Retry:
+        retry_transient_errors = kwargs.get("retry_transient_errors")
+        return utils.Retry(
+            max_retries=kwargs.get("max_retries", 10),
+            retry_transient_errors=(
+                self.retry_transient_errors
+                if retry_transient_errors is None
+                else retry_transient_errors
+            ),
+        )
+
+    def _download_segments(
+        self,
+        path: str,
+        query_data: dict[str, Any] | None,
+        response: requests.Response,
+        download: utils.ResumableDownload,
+        bounds: list[tuple[int, int]],
+        extra_headers: dict[str, Any],
+        kwargs: dict[str, Any],
+    ) -> bool:
+        """Fetch the segments of a download from concurrent threads, the
+        first one being the rest of ``response``.
+
+        Returns:
+            False if a segment is not part of the same data as ``response``
+        """
+        stop = threading.Event()
+
+        def fetch(index: int) -> bool:
+            start, end = bounds[index]
             try:
-                json_result = result.json()
+                return self._download_segment(
+                    path,
+                    query_data,
+                    response if index == 0 else None,
+                    download,
+                    start,
+                    end,
+                    stop,
+                    extra_headers,
+                    kwargs,
+                )
+            except BaseException:
+                stop.set()
+                raise
+
+        return all(self._map_concurrently(fetch, list(range(len(bounds))), len(bounds)))
+
+    def _download_segment(
+        self,
+        path: str,
+        query_data: dict[str, Any] | None,
+        response: requests.Response | None,
+        download: utils.ResumableDownload,
+        start: int,
+        end: int,
+        stop: threading.Event,
+        extra_headers: dict[str, Any],
+        kwargs: dict[str, Any],
+    ) -> bool:
+        retry = self._download_retry(kwargs)
+        while start < end and not stop.is_set():
+            if response is None:
+                result = self.http_get(
+                    path,
+                    query_data=query_data,
+                    streamed=True,
+                    raw=True,
+                    extra_headers={
+                        **extra_headers,
+                        **download.segment_headers(start, end),
+                    },
+                    **kwargs,
+                )
                 if TYPE_CHECKING:
-                    assert isinstance(json_result, dict)
-                return json_result
-            except Exception as e:
-                raise gitlab.exceptions.GitlabParsingError(
-                    error_message="Failed to parse the server message"
-                ) from e
-        else:
-            return result
+                    assert isinstance(result, requests.Response)
+                response = result
+                if not download.segment_matches(
+                    response.status_code, response.headers, start
+                ):
+                    response.close()
+                    stop.set()
+                    return False
+            try:
+                for chunk in utils.iter_response_chunks(response):
+                    chunk = chunk[: end - start]
+                    download.write_at(start, chunk)
+                    start += len(chunk)
+                    if start == end or stop.is_set():
+                        break
+                if start < end and not stop.is_set():
+                    raise requests.exceptions.ChunkedEncodingError(
+                        "Connection closed before the segment was complete"
+                    )
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                if not retry.handle_retry():
+                    raise
+                download.segment_retried()
+            finally:
+                response.close()
+                response = None
+        return True
 
     def http_head(
         self, path: str, query_data: dict[str, Any] | None = None, **kwargs: Any
@@ -857,7 +1379,13 @@ class Gitlab:
             query_data: Data to send as query parameters
             iterator: Indicate if should return a generator (True)
             **kwargs: Extra options to send to the server (e.g. sudo, page,
-                      per_page)
+                      per_page). With `get_all=True`, `concurrency` sets the
+                      number of pages requested in parallel once the total
+                      number of pages is known. `fields` drops all the keys
+                      of the items but these, as each page is parsed.
+                      `stream=True` decodes the items as they are read from
+                      the connection instead of a page at a time (the pages
+                      are then requested one by one).
 
         Returns:
             A list of the objects returned by the server. If `iterator` is
@@ -871,7 +1399,74 @@ class Gitlab:
             GitlabParsingError: If the json data could not be parsed
         """
         query_data = query_data or {}
+        url, get_all, page = self._prepare_list(path, iterator=iterator, kwargs=kwargs)
+        concurrency = kwargs.pop("concurrency", None)
+
+        if iterator:
+            # Generator requested
+            return GitlabList(self, url, query_data, **kwargs)
 
+        if get_all is True:
+            gl_list = GitlabList(self, url, query_data, **kwargs)
+            if concurrency is not None and concurrency > 1 and not gl_list._stream:
+                return self._list_remaining_pages(gl_list, concurrency)
+            return list(gl_list)
+
+        # pagination requested, we return a list
+        gl_list = GitlabList(self, url, query_data, get_next=False, **kwargs)
+        items = list(gl_list)
+        self._warn_on_partial_list(
+            gl_list, items, get_all=get_all, page=page, message_details=message_details
+        )
+        return items
+
+    def _list_remaining_pages(
+        self, gl_list: GitlabList, concurrency: int
+    ) -> list[dict[str, Any]]:
+        """Return all the items of a list, requesting the pages in parallel.
+
+        Falls back to following the ``next`` links when the pages can't be
+        addressed by number (keyset pagination, or no ``X-Total-Pages`` header
+        for lists of more than 10,000 items).
+        """
+        page_urls = gl_list._remaining_page_urls()
+        if page_urls is None:
+            return list(gl_list)
+
+        items = gl_list._data[gl_list._current :]
+
+        def get_page(page_url: str) -> list[dict[str, Any]]:
+            result = self.http_request("get", page_url, **gl_list._kwargs)
+            return utils.select_fields(  # type: ignore[no-any-return]
+                self._parse_json(result), gl_list._fields
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            # map() returns the pages in order, whatever order they complete in
+            for page_items in pool.map(get_page, page_urls):
+                items.extend(page_items)
+        return items
+
+    def _map_concurrently(
+        self, func: Callable[[Any], Any], items: list[Any], concurrency: int
+    ) -> list[Any]:
+        """Apply ``func`` to ``items`` from up to ``concurrency`` threads.
+
+        The results are returned in the order of ``items``.
+        """
+        if concurrency <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(func, items))
+
+    def _prepare_list(
+        self, path: str, *, iterator: bool | None, kwargs: dict[str, Any]
+    ) -> tuple[str, bool | None, int | None]:
+        """Pop the list-only arguments from ``kwargs``.
+
+        Returns:
+            A tuple of the full URL, the ``get_all`` value and the requested page
+        """
         # Provide a `get_all`` param to avoid clashes with `all` API attributes.
         get_all = kwargs.pop("get_all", None)
 
@@ -883,25 +1478,27 @@ class Gitlab:
 
         page = kwargs.get("page")
 
-        if iterator:
-            if page is not None:
-                utils.warn(
-                    message=(
-                        f"`{iterator=}` and `{page=}` were both specified. "
-                        f"`{page=}` will be ignored."
-                    ),
-                    category=UserWarning,
-                )
-
-            # Generator requested
-            return GitlabList(self, url, query_data, **kwargs)
+        if iterator and page is not None:
+            utils.warn(
+                message=(
+                    f"`{iterator=}` and `{page=}` were both specified. "
+                    f"`{page=}` will be ignored."
+                ),
+                category=UserWarning,
+            )
 
-        if get_all is True:
-            return list(GitlabList(self, url, query_data, **kwargs))
+        return url, get_all, page
 
-        # pagination requested, we return a list
-        gl_list = GitlabList(self, url, query_data, get_next=False, **kwargs)
-        items = list(gl_list)
+    @staticmethod
+    def _warn_on_partial_list(
+        gl_list: GitlabList | AsyncGitlabList,
+        items: list[dict[str, Any]],
+        *,
+        get_all: bool | None,
+        page: int | None,
+        message_details: utils.WarnMessageData | None,
+    ) -> None:
+        """Warn the user if only the first page of a list was returned."""
 
         def should_emit_warning() -> bool:
             # No warning is emitted if any of the following conditions apply:
@@ -923,7 +1520,7 @@ class Gitlab:
             return True
 
         if not should_emit_warning():
-            return items
+            return
 
         # Warn the user that they are only going to retrieve `per_page`
         # maximum items. This is a common cause of issues filed.
@@ -948,7 +1545,6 @@ class Gitlab:
             )
             show_caller = True
         utils.warn(message=message, category=UserWarning, show_caller=show_caller)
-        return items
 
     def http_post(
         self,
@@ -993,16 +1589,11 @@ class Gitlab:
         )
         content_type = utils.get_content_type(result.headers.get("Content-Type"))
 
-        try:
-            if content_type == "application/json":
-                json_result = result.json()
-                if TYPE_CHECKING:
-                    assert isinstance(json_result, dict)
-                return json_result
-        except Exception as e:
-            raise gitlab.exceptions.GitlabParsingError(
-                error_message="Failed to parse the server message"
-            ) from e
+        if content_type == "application/json":
+            json_result = self._parse_json(result)
+            if TYPE_CHECKING:
+                assert isinstance(json_result, dict)
+            return json_result
         return result
 
     def http_put(
@@ -1047,15 +1638,10 @@ class Gitlab:
         )
         if result.status_code in gitlab.const.NO_JSON_RESPONSE_CODES:
             return result
-        try:
-            json_result = result.json()
-            if TYPE_CHECKING:
-                assert isinstance(json_result, dict)
-            return json_result
-        except Exception as e:
-            raise gitlab.exceptions.GitlabParsingError(
-                error_message="Failed to parse the server message"
-            ) from e
+        json_result = self._parse_json(result)
+        if TYPE_CHECKING:
+            assert isinstance(json_result, dict)
+        return json_result
 
     def http_patch(
         self,
@@ -1092,15 +1678,10 @@ class Gitlab:
         )
         if result.status_code in gitlab.const.NO_JSON_RESPONSE_CODES:
             return result
-        try:
-            json_result = result.json()
-            if TYPE_CHECKING:
-                assert isinstance(json_result, dict)
-            return json_result
-        except Exception as e:
-            raise gitlab.exceptions.GitlabParsingError(
-                error_message="Failed to parse the server message"
-            ) from e
+        json_result = self._parse_json(result)
+        if TYPE_CHECKING:
+            assert isinstance(json_result, dict)
+        return json_result
 
     def http_delete(self, path: str, **kwargs: Any) -> requests.Response:
         """Make a DELETE request to the Gitlab server.
@@ -1140,65 +1721,64 @@ class Gitlab:
         return self.http_list("/search", query_data=data, **kwargs)
 
 
-class GitlabList:
-    """Generator representing a list of remote objects.
+def _add_managers(cls: type[Gitlab]) -> None:
+    """Create the managers of the client attributes annotated with a
+    ``*Manager`` class when they are first accessed, so that the object
+    modules are only imported when needed."""
+    for attr, annotation in cls.__dict__["__annotations__"].items():
+        module, _, cls_name = annotation.rpartition(".")
+        if module == "objects" and cls_name.endswith("Manager"):
+            setattr(cls, attr, _ManagerDescriptor(attr, cls_name))
 
-    The object handles the links returned by a query to the API, and will call
-    the API again when needed.
-    """
 
-    def __init__(
-        self,
-        gl: Gitlab,
-        url: str,
-        query_data: dict[str, Any],
-        get_next: bool = True,
-        **kwargs: Any,
-    ) -> None:
-        self._gl = gl
+_add_managers(Gitlab)
 
-        # Preserve kwargs for subsequent queries
-        self._kwargs = kwargs.copy()
 
-        self._query(url, query_data, **self._kwargs)
-        self._get_next = get_next
+class _BaseGitlabList:
+    """Pagination state shared by :class:`GitlabList` and :class:`AsyncGitlabList`."""
 
-        # Remove query_parameters from kwargs, which are saved via the `next` URL
-        self._kwargs.pop("query_parameters", None)
+    _gl: Gitlab
+    _next_url: str | None
+    _current_page: str | None
+    _prev_page: str | None
+    _next_page: str | None
+    _per_page: str | None
+    _total_pages: str | None
+    _total: str | None
+    _data: list[dict[str, Any]]
+    _current: int
+    _fields: frozenset[str] | None
 
-    def _query(
-        self, url: str, query_data: dict[str, Any] | None = None, **kwargs: Any
-    ) -> None:
-        query_data = query_data or {}
-        result = self._gl.http_request("get", url, query_data=query_data, **kwargs)
+    def _update_page(self, result: requests.Response | httpx.Response) -> None:
+        self._update_headers(result)
+        # Drop the unwanted keys right away, so they are not kept with the page
+        self._data = utils.select_fields(self._gl._parse_json(result), self._fields)
+        self._current = 0
+
+    def _update_headers(self, result: requests.Response | httpx.Response) -> None:
         try:
             next_url = result.links["next"]["url"]
         except KeyError:
             next_url = None
 
         self._next_url = self._gl._check_url(next_url)
-        self._current_page: str | None = result.headers.get("X-Page")
-        self._prev_page: str | None = result.headers.get("X-Prev-Page")
-        self._next_page: str | None = result.headers.get("X-Next-Page")
-        self._per_page: str | None = result.headers.get("X-Per-Page")
-        self._total_pages: str | None = result.headers.get("X-Total-Pages")
-        self._total: str | None = result.headers.get("X-Total")
-
-        try:
-            self._data: list[dict[str, Any]] = result.json()
-        except Exception as e:
-            raise gitlab.exceptions.GitlabParsingError(
-                error_message="Failed to parse the server message"
-            ) from e
-
+        self._current_page = result.headers.get("X-Page")
+        self._prev_page = result.headers.get("X-Prev-Page")
+        self._next_page = result.headers.get("X-Next-Page")
+        self._per_page = result.headers.get("X-Per-Page")
+        self._total_pages = result.headers.get("X-Total-Pages")
+        self._total = result.headers.get("X-Total")
+        self._data = []
         self._current = 0
 
     @property
-    def current_page(self) -> int:
-        """The current page number."""
-        if TYPE_CHECKING:
-            assert self._current_page is not None
-        return int(self._current_page)
+    def current_page(self) -> int | None:
+        """The current page number.
+
+        If None, the page number is not known yet (or at all, with keyset
+        pagination).
+        """
+        return int(self._current_page) if self._current_page else None
 
     @property
     def prev_page(self) -> int | None:
@@ -1238,18 +1818,97 @@ class GitlabList:
             return int(self._total)
         return None
 
-    def __iter__(self) -> GitlabList:
-        return self
-
     def __len__(self) -> int:
         if self._total is None:
             return 0
         return int(self._total)
 
+    def _remaining_page_urls(self) -> list[str] | None:
+        """Build the URLs of the pages following the current one.
+
+        The URLs are derived from the ``next`` link by changing its ``page``
+        parameter, up to the ``X-Total-Pages`` value.
+
+        Returns:
+            The list of URLs, or None if the pages can't be addressed by
+            number (keyset pagination or unknown number of pages)
+        """
+        if not (self._next_url and self._current_page and self._total_pages):
+            return None
+
+        next_url = parse.urlsplit(self._next_url)
+        query = parse.parse_qsl(next_url.query, keep_blank_values=True)
+        if "page" not in dict(query):
+            return None
+
+        urls = []
+        for page in range(int(self._current_page) + 1, int(self._total_pages) + 1):
+            page_query = [(k, str(page) if k == "page" else v) for k, v in query]
+            urls.append(next_url._replace(query=parse.urlencode(page_query)).geturl())
+        return urls
+
+
+class GitlabList(_BaseGitlabList):
+    """Generator representing a list of remote objects.
+
+    The object handles the links returned by a query to the API, and will call
+    the API again when needed.
+
+    With ``stream=True``, the items of each page are decoded as they are read
+    from the connection, so only one item is kept in memory at a time rather
+    than the whole page.
+    """
+
+    def __init__(
+        self,
+        gl: Gitlab,
+        url: str,
+        query_data: dict[str, Any],
+        get_next: bool = True,
+        fields: Iterable[str] | None = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        self._gl = gl
+        self._fields = frozenset(fields) if fields is not None else None
+        self._stream = stream
+        self._items: Iterator[dict[str, Any]] | None = None
+
+        # Preserve kwargs for subsequent queries
+        self._kwargs = kwargs.copy()
+
+        self._query(url, query_data, **self._kwargs)
+        self._get_next = get_next
+
+        # Remove query_parameters from kwargs, which are saved via the `next` URL
+        self._kwargs.pop("query_parameters", None)
+
+    def _query(
+        self, url: str, query_data: dict[str, Any] | None = None, **kwargs: Any
+    ) -> None:
+        query_data = query_data or {}
+        result = self._gl.http_request(
+            "get", url, query_data=query_data, streamed=self._stream, **kwargs
+        )
+        if self._stream:
+            self._update_headers(result)
+            self._items = self._gl._stream_json_items(result, self._fields)
+        else:
+            self._update_page(result)
+
+    def __iter__(self) -> GitlabList:
+        return self
+
     def __next__(self) -> dict[str, Any]:
         return self.next()
 
     def next(self) -> dict[str, Any]:
+        if self._items is not None:
+            try:
+                return next(self._items)
+            except StopIteration:
+                self._items = None
+
         try:
             item = self._data[self._current]
             self._current += 1
@@ -1264,7 +1923,198 @@ class GitlabList:
         raise StopIteration
 
 
+class AsyncGitlabList(_BaseGitlabList):
+    """Async generator representing a list of remote objects.
+
+    This is the :class:`GitlabList` counterpart returned by
+    :class:`~gitlab.AsyncGitlab`. It is consumed with ``async for``. The first
+    page is requested on first iteration and the following pages when needed,
+    so the pagination properties are None until iteration started.
+
+    When running on asyncio, the pages following the current one are fetched
+    in the background (following the ``next`` link) while the current page is
+    being consumed, so the network round-trips overlap with the processing of
+    the items. If the iteration is stopped before the last page, call
+    :meth:`aclose` to cancel the pending requests.
+
+    Args:
+        gl: The AsyncGitlab client
+        url: The URL of the first page
+        query_data: The query parameters of the first page
+        get_next: Whether to follow the ``next`` links
+        prefetch: Maximum number of pages fetched ahead of the page being
+            consumed (0 to fetch each page only when needed)
+        fields: If set, only keep these keys of the items
+        stream: If True, decode the items as they are read from the
+            connection, rather than a page at a time. The pages are then not
+            fetched ahead.
+        **kwargs: Extra options passed to ``http_request()``
+    """
+
+    def __init__(
+        self,
+        gl: Gitlab,
+        url: str,
+        query_data: dict[str, Any],
+        get_next: bool = True,
+        prefetch: int = 1,
+        fields: Iterable[str] | None = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        if prefetch < 0:
+            raise ValueError("prefetch must be a positive integer or 0")
+
+        self._gl = gl
+        self._fields = frozenset(fields) if fields is not None else None
+        self._stream = stream
+        # Pagination state, set from the headers of the first page
+        self._next_url = None
+        self._current_page = None
+        self._prev_page = None
+        self._next_page = None
+        self._per_page = None
+        self._total_pages = None
+        self._total = None
+        self._data = []
+        self._current = 0
+        self._items: AsyncGenerator[dict[str, Any], None] | None = None
+        self._url = url
+        self._query_data = query_data
+        self._get_next = get_next
+        self._prefetch = prefetch
+        self._kwargs = kwargs.copy()
+        self._started = False
+        self._pages: asyncio.Queue[httpx.Response | Exception] | None = None
+        self._prefetch_slots: asyncio.Semaphore | None = None
+        self._prefetch_task: asyncio.Task[None] | None = None
+
+    async def _request(
+        self, url: str, query_data: dict[str, Any] | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        query_data = query_data or {}
+        return await self._gl.http_request(  # type: ignore[misc,no-any-return]
+            "get", url, query_data=query_data, streamed=self._stream, **kwargs
+        )
+
+    async def _query(
+        self, url: str, query_data: dict[str, Any] | None = None, **kwargs: Any
+    ) -> None:
+        result = await self._request(url, query_data, **kwargs)
+        if self._stream:
+            self._update_headers(result)
+            self._items = self._gl._stream_json_items(  # type: ignore[assignment]
+                result, self._fields
+            )
+        else:
+            self._update_page(result)
+
+    async def _start(self) -> None:
+        if self._started:
+            return
+        await self._query(self._url, self._query_data, **self._kwargs)
+        self._started = True
+
+        # Remove query_parameters from kwargs, which are saved via the `next` URL
+        self._kwargs.pop("query_parameters", None)
+        self._start_prefetch()
+
+    def _start_prefetch(self) -> None:
+        if not (self._prefetch and self._get_next is True and self._next_url):
+            return
+        if self._stream:
+            # The current page is still being read from its connection
+            return
+        if not utils.running_on_asyncio():
+            # The pages are fetched when needed
+            return
+
+        self._pages = asyncio.Queue()
+        self._prefetch_slots = asyncio.Semaphore(self._prefetch)
+        self._prefetch_task = asyncio.create_task(self._prefetch_pages(self._next_url))
+
+    async def _prefetch_pages(self, url: str | None) -> None:
+        if TYPE_CHECKING:
+            assert self._pages is not None
+            assert self._prefetch_slots is not None
+
+        while url:
+            await self._prefetch_slots.acquire()
+            try:
+                result = await self._request(url, **self._kwargs)
+            except Exception as e:
+                self._pages.put_nowait(e)
+                return
+            self._pages.put_nowait(result)
+            try:
+                url = self._gl._check_url(result.links["next"]["url"])
+            except KeyError:
+                url = None
+
+    async def _fetch_next_page(self) -> None:
+        if self._pages is None:
+            if TYPE_CHECKING:
+                assert self._next_url is not None
+            await self._query(self._next_url, **self._kwargs)
+            return
+
+        if TYPE_CHECKING:
+            assert self._prefetch_slots is not None
+        result = await self._pages.get()
+        self._prefetch_slots.release()
+        if isinstance(result, Exception):
+            # Fetch the following pages on demand if the iteration goes on
+            self._pages = None
+            self._prefetch_task = None
+            raise result
+        self._update_page(result)
+
+    async def aclose(self) -> None:
+        """Cancel the pages being fetched in the background, if any, and close
+        the page being streamed."""
+        items, self._items = self._items, None
+        if items is not None:
+            await items.aclose()
+        task, self._prefetch_task = self._prefetch_task, None
+        self._pages = None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def __aiter__(self) -> AsyncGitlabList:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        return await self.next()
+
+    async def next(self) -> dict[str, Any]:
+        await self._start()
+        while True:
+            if self._items is not None:
+                try:
+                    return await self._items.__anext__()
+                except StopAsyncIteration:
+                    self._items = None
+
+            try:
+                item = self._data[self._current]
+                self._current += 1
+                return item
+            except IndexError:
+                pass
+
+            if not (self._next_url and self._get_next is True):
+                raise StopAsyncIteration
+            await self._fetch_next_page()
+
+
 class _BaseGraphQL:
+    _transport: GitlabTransport | GitlabAsyncTransport
+
     def __init__(
         self,
         url: str | None = None,
@@ -1277,6 +2127,7 @@ class _BaseGraphQL:
         max_retries: int = 10,
         obey_rate_limit: bool = True,
         retry_transient_errors: bool = False,
+        http2: bool = False,
     ) -> None:
         if not _GQL_INSTALLED:
             raise ImportError(
@@ -1293,6 +2144,7 @@ class _BaseGraphQL:
         self._max_retries = max_retries
         self._obey_rate_limit = obey_rate_limit
         self._retry_transient_errors = retry_transient_errors
+        self._http2 = http2
         self._client_opts = self._get_client_opts()
         self._fetch_schema_from_transport = fetch_schema_from_transport
 
@@ -1306,8 +2158,14 @@ class _BaseGraphQL:
             "headers": headers,
             "timeout": self._timeout,
             "verify": self._ssl_verify,
+            "http2": self._http2,
         }
 
+    @property
+    def http2_active(self) -> bool:
+        """Whether the last request was sent over HTTP/2."""
+        return self._transport.http_version == "HTTP/2"
+
 
 class GraphQL(_BaseGraphQL):
     def __init__(
@@ -1323,6 +2181,7 @@ class GraphQL(_BaseGraphQL):
         max_retries: int = 10,
         obey_rate_limit: bool = True,
         retry_transient_errors: bool = False,
+        http2: bool = False,
     ) -> None:
         super().__init__(
             url=url,
@@ -1334,8 +2193,14 @@ class GraphQL(_BaseGraphQL):
             max_retries=max_retries,
             obey_rate_limit=obey_rate_limit,
             retry_transient_errors=retry_transient_errors,
+            http2=http2,
         )
 
+        import gql
+        import httpx
+
+        from ._backends.graphql import GitlabTransport
+
         self._http_client = client or httpx.Client(**self._client_opts)
         self._transport = GitlabTransport(self._url, client=self._http_client)
         self._client = gql.Client(
@@ -1351,6 +2216,8 @@ class GraphQL(_BaseGraphQL):
         self._http_client.close()
 
     def execute(self, request: str | graphql.Source, *args: Any, **kwargs: Any) -> Any:
+        import gql.transport.exceptions
+
         parsed_document = self._gql(request)
         retry = utils.Retry(
             max_retries=self._max_retries,
@@ -1393,6 +2260,8 @@ class AsyncGraphQL(_BaseGraphQL):
         max_retries: int = 10,
         obey_rate_limit: bool = True,
         retry_transient_errors: bool = False,
+        retry_deadline: float | None = None,
+        http2: bool = False,
     ) -> None:
         super().__init__(
             url=url,
@@ -1404,8 +2273,15 @@ class AsyncGraphQL(_BaseGraphQL):
             max_retries=max_retries,
             obey_rate_limit=obey_rate_limit,
             retry_transient_errors=retry_transient_errors,
+            http2=http2,
         )
 
+        import gql
+        import httpx
+
+        from ._backends.graphql import GitlabAsyncTransport
+
+        self._retry_deadline = retry_deadline
         self._http_client = client or httpx.AsyncClient(**self._client_opts)
         self._transport = GitlabAsyncTransport(self._url, client=self._http_client)
         self._client = gql.Client(
@@ -1423,11 +2299,14 @@ class AsyncGraphQL(_BaseGraphQL):
     async def execute(
         self, request: str | graphql.Source, *args: Any, **kwargs: Any
     ) -> Any:
+        import gql.transport.exceptions
+
         parsed_document = self._gql(request)
-        retry = utils.Retry(
+        retry = utils.AsyncRetry(
             max_retries=self._max_retries,
             obey_rate_limit=self._obey_rate_limit,
             retry_transient_errors=self._retry_transient_errors,
+            deadline=self._retry_deadline,
         )
 
         while True:
@@ -1436,7 +2315,7 @@ class AsyncGraphQL(_BaseGraphQL):
                     parsed_document, *args, **kwargs
                 )
             except gql.transport.exceptions.TransportServerError as e:
-                if retry.handle_retry_on_status(
+                if await retry.handle_retry_on_status(
                     status_code=e.code, headers=self._transport.response_headers
                 ):
                     continue
@@ -169,3 +169,28 @@ __all__ = [
     "VISIBILITY_PRIVATE",
     "VISIBILITY_PUBLIC",
 ]
+
+# Attributes of the projects returned by project listings with `simple=True`
+SIMPLE_PROJECT_FIELDS = frozenset(
+    {
+        "id",
+        "description",
+        "name",
+        "name_with_namespace",
+        "path",
+        "path_with_namespace",
+        "created_at",
+        "default_branch",
+        "tag_list",
+        "topics",
+        "ssh_url_to_repo",
+        "http_url_to_repo",
+        "web_url",
+        "readme_url",
+        "avatar_url",
+        "forks_count",
+        "star_count",
+        "last_activity_at",
+        "namespace",
+    }
+)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import inspect
 from typing import Any, Callable, cast, TYPE_CHECKING, TypeVar
 
 
@@ -333,7 +334,8 @@ def on_http_error(error: type[Exception]) -> Callable[[__F], __F]:
     """Manage GitlabHttpError exceptions.
 
     This decorator function can be used to catch GitlabHttpError exceptions
-    raise specialized exceptions instead.
+    raise specialized exceptions instead. Awaitables returned by the wrapped
+    function (when using the async client) are wrapped as well.
 
     Args:
         The exception type to raise -- must inherit from GitlabError
@@ -343,7 +345,16 @@ def on_http_error(error: type[Exception]) -> Callable[[__F], __F]:
         @functools.wraps(f)
         def wrapped_f(*args: Any, **kwargs: Any) -> Any:
             try:
-                return f(*args, **kwargs)
+                result = f(*args, **kwargs)
+            except GitlabHttpError as e:
+                raise error(e.error_message, e.response_code, e.response_body) from e
+            if inspect.isawaitable(result):
+                return _await_on_http_error(result)
+            return result
+
+        async def _await_on_http_error(result: Any) -> Any:
+            try:
+                return await result
             except GitlabHttpError as e:
                 raise error(e.error_message, e.response_code, e.response_body) from e
 
@@ -0,0 +1,255 @@
+"""JSON codecs decoding the responses and encoding the request bodies.
+
+The standard library ``json`` module is always available. Faster codecs are
+used when their package is installed: ``orjson`` (``pip install
+python-gitlab[orjson]``) or ``msgspec`` (``pip install python-gitlab[msgspec]``).
+"""
+
+from __future__ import annotations
+
+import abc
+import codecs
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+
+    _ORJSON_INSTALLED = True
+except ImportError:  # pragma: no cover
+    _ORJSON_INSTALLED = False
+
+try:
+    import msgspec
+
+    _MSGSPEC_INSTALLED = True
+except ImportError:  # pragma: no cover
+    _MSGSPEC_INSTALLED = False
+
+__all__ = [
+    "JSONCodec",
+    "StdlibCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "JSONArrayDecoder",
+    "get_codec",
+]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_START = frozenset("-0123456789")
+_NUMBER_END = frozenset(" \t\n\r,]")
+
+
+class JSONCodec(abc.ABC):
+    """Decodes and encodes JSON documents."""
+
+    #: Name of the codec, as accepted by :func:`get_codec`
+    name: str
+
+    @abc.abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` as a UTF-8 JSON document."""
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}>"
+
+
+class StdlibCodec(JSONCodec):
+    """Codec based on the standard library ``json`` module."""
+
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+
+_stdlib = StdlibCodec()
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec based on ``orjson``.
+
+    Documents ``orjson`` does not support (e.g. integers beyond 64 bits, or
+    objects of unknown types) are handled by the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not _ORJSON_INSTALLED:
+            raise ImportError("The orjson JSON codec requires the orjson package")
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return _stdlib.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _stdlib.dumps(obj)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec based on ``msgspec``.
+
+    Documents ``msgspec`` does not support are handled by the standard
+    library.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if not _MSGSPEC_INSTALLED:
+            raise ImportError("The msgspec JSON codec requires the msgspec package")
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError:
+            return _stdlib.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return msgspec.json.encode(obj)
+        except (TypeError, msgspec.EncodeError):
+            return _stdlib.dumps(obj)
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    codec.name: codec for codec in (StdlibCodec, OrjsonCodec, MsgspecCodec)
+}
+
+
+def get_codec(codec: str | JSONCodec = "auto") -> JSONCodec:
+    """Return a JSON codec.
+
+    Args:
+        codec: A codec, or the name of one: ``"json"``, ``"orjson"``,
+            ``"msgspec"``, or ``"auto"`` for the fastest installed one
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the package of the codec is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        if _ORJSON_INSTALLED:
+            return OrjsonCodec()
+        if _MSGSPEC_INSTALLED:
+            return MsgspecCodec()
+        return _stdlib
+    try:
+        codec_cls = _CODECS[codec]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON codec {codec!r}, expected one of "
+            f"{', '.join(['auto', *_CODECS])}"
+        ) from None
+    return codec_cls()
+
+
+class JSONArrayDecoder:
+    """Decode the items of a JSON array received in chunks.
+
+    Each item is returned as soon as it is complete, so only the item being
+    received is kept in memory rather than the whole document. Items are
+    decoded with the standard library, as the other codecs can't decode part
+    of a document.
+
+    Raises:
+        ValueError: If the document is not a valid JSON array
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        # "start", "first" (after "["), "item" (after ","), "comma" or "done"
+        self._state = "start"
+        # Length the buffer must reach before decoding an incomplete item
+        # again, so that large items are not decoded once per chunk
+        self._retry_at = 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk of the document, and return the items completed by it."""
+        self._buffer += self._text.decode(chunk)
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._decode_items(final=False)
+
+    def close(self) -> list[Any]:
+        """Return the last items, once the whole document was fed.
+
+        Raises:
+            ValueError: If the array is incomplete
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._decode_items(final=True)
+        if self._state != "done":
+            raise ValueError("Incomplete JSON array")
+        return items
+
+    def _decode_items(self, final: bool) -> list[Any]:
+        items = []
+        buffer = self._buffer
+        pos = 0
+        self._retry_at = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if self._state == "done":
+                raise ValueError(f"Extra data after the JSON array at char {pos}")
+            if self._state == "start":
+                if char != "[":
+                    raise ValueError("Expecting a JSON array")
+                self._state = "first"
+                pos += 1
+            elif char == "]" and self._state in ("first", "comma"):
+                self._state = "done"
+                pos += 1
+            elif self._state == "comma":
+                if char != ",":
+                    raise ValueError(f"Expecting ',' delimiter at char {pos}")
+                self._state = "item"
+                pos += 1
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except ValueError:
+                    if final:
+                        raise
+                    # Most likely an incomplete item, wait for twice its data
+                    self._retry_at = 2 * (len(buffer) - pos)
+                    break
+                if not final and (
+                    end == len(buffer)
+                    or (char in _NUMBER_START and buffer[end] not in _NUMBER_END)
+                ):
+                    # A number may continue in the next chunk
+                    self._retry_at = len(buffer) - pos + 1
+                    break
+                items.append(item)
+                self._state = "comma"
+                pos = end
+        self._buffer = buffer[pos:]
+        return items
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import enum
-from collections.abc import Iterator
+import inspect
+import io
+from collections.abc import Iterable, Iterator
 from types import ModuleType
-from typing import Any, Callable, Literal, overload, TYPE_CHECKING
+from typing import Any, Callable, cast, Literal, overload, TYPE_CHECKING
 
 import requests
 
@@ -43,6 +45,62 @@ else:
     _RestObjectBase = object
 
 
+def _cached_get(
+    manager: base.RESTManager[Any],
+    path: str,
+    build: Callable[[dict[str, Any]], Any],
+    **kwargs: Any,
+) -> Any:
+    """GET the object at ``path`` and ``build`` it, unless the response cache
+    of the client still holds it."""
+    cache = manager.gitlab.response_cache
+    ttl = None if cache is None else cache.ttl(type(manager))
+    if cache is None or ttl is None:
+        return utils.map_result(manager.gitlab.http_get(path, **kwargs), build)
+
+    key = cache.key(path, kwargs, manager.gitlab._credentials())
+    data = cache.get(key)
+    if data is not None:
+        return manager.gitlab._as_result(build(data))
+
+    def store(data: dict[str, Any]) -> Any:
+        paths = []
+        id_attr = manager._obj_cls._id_attr if manager._obj_cls else None
+        if id_attr is not None and data.get(id_attr) is not None:
+            # Writes address the object by its ID attribute
+            paths.append(f"{manager.path}/{utils.EncodedId(data[id_attr])}")
+        cache.set(key, data, ttl, paths=paths)
+        return build(data)
+
+    return utils.map_result(manager.gitlab.http_get(path, **kwargs), store)
+
+
+def _fields_with_id(
+    manager: base.RESTManager[Any], fields: Iterable[str]
+) -> tuple[str, ...]:
+    """Return the fields to keep, including the ID attribute of the objects."""
+    if isinstance(fields, str):
+        raise TypeError("fields must be a list of attribute names, not a string")
+    keep = set(fields)
+    id_attr = manager._obj_cls._id_attr if manager._obj_cls else None
+    if id_attr is not None:
+        keep.add(id_attr)
+    return tuple(sorted(keep))
+
+
+def _invalidate_cached(manager: base.RESTManager[Any], path: str, result: Any) -> Any:
+    """Drop the cached objects under ``path`` once ``result`` is received."""
+    cache = manager.gitlab.response_cache
+    if cache is None:
+        return result
+
+    def invalidate(value: Any) -> Any:
+        cache.invalidate(path)
+        return value
+
+    return utils.map_result(result, invalidate)
+
+
 class HeadMixin(base.RESTManager[base.TObjCls]):
     @exc.on_http_error(exc.GitlabHeadError)
     def head(
@@ -80,6 +138,8 @@ class GetMixin(HeadMixin[base.TObjCls]):
             lazy: If True, don't request the server, but create a
                          shallow object giving access to the managers. This is
                          useful if you want to avoid useless calls to the API.
+            fields: If set, only keep these attributes (and the ID attribute)
+                of the object
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Returns:
@@ -96,10 +156,108 @@ class GetMixin(HeadMixin[base.TObjCls]):
             if TYPE_CHECKING:
                 assert self._obj_cls._id_attr is not None
             return self._obj_cls(self, {self._obj_cls._id_attr: id}, lazy=lazy)
-        server_data = self.gitlab.http_get(path, **kwargs)
-        if TYPE_CHECKING:
-            assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data, lazy=lazy)
+        if kwargs.get("fields") is not None:
+            kwargs["fields"] = _fields_with_id(self, kwargs["fields"])
+        return _cached_get(
+            self, path, lambda data: self._obj_cls(self, data, lazy=lazy), **kwargs
+        )
+
+    def get_many(
+        self,
+        ids: Iterable[str | int],
+        concurrency: int = 10,
+        *,
+        list_threshold: int | None = None,
+        **kwargs: Any,
+    ) -> list[base.TObjCls | exc.GitlabError]:
+        """Retrieve several objects, sending the requests concurrently.
+
+        The requests are sent from a pool of threads with
+        :class:`~gitlab.Gitlab`, and from tasks with :class:`~gitlab.AsyncGitlab`.
+        A failed request does not abort the others: the error is returned in
+        place of the object.
+
+        Args:
+            ids: IDs of the objects to retrieve
+            concurrency: Maximum number of requests sent at the same time
+            list_threshold: If set and at least that many integer IDs are
+                requested, and the objects can be listed with the
+                ``id_after`` and ``id_before`` filters, retrieve them by
+                listing the range of IDs instead. The range is only listed
+                if it spans at most twice as many IDs as requested, as every
+                object in it is fetched. Listed objects may have fewer
+                attributes.
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Returns:
+            The generated RESTObjects, or the errors raised while retrieving
+            them, in the order of ``ids``.
+
+        Raises:
+            ValueError: If ``concurrency`` is lower than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        ids = list(ids)
+
+        if (
+            list_threshold is not None
+            and len(ids) >= list_threshold
+            and isinstance(self, ListMixin)
+            and {"id_after", "id_before"}.issubset(self._list_filters)
+            and all(isinstance(id, int) for id in ids)
+            and max(cast(list[int], ids)) - min(cast(list[int], ids)) < 2 * len(ids)
+        ):
+            int_ids = cast(list[int], ids)
+            objects = self.list(
+                get_all=True,
+                id_after=min(int_ids) - 1,
+                id_before=max(int_ids) + 1,
+                concurrency=concurrency,
+                **kwargs,
+            )
+            return utils.map_result(
+                objects, lambda objects: self._pick_objects(ids, objects)
+            )
+
+        return self.gitlab._map_concurrently(
+            lambda id: self._get_or_error(id, **kwargs), ids, concurrency
+        )
+
+    def _get_or_error(self, id: str | int, **kwargs: Any) -> Any:
+        try:
+            result = self.get(id, **kwargs)
+        except exc.GitlabError as e:
+            return e
+        except requests.RequestException as e:
+            # Report transport errors like the async client does
+            error = exc.GitlabGetError(f"Request failed: {e}")
+            error.__cause__ = e
+            return error
+        if not inspect.isawaitable(result):
+            return result
+
+        async def _awaited() -> Any:
+            try:
+                return await result
+            except exc.GitlabError as e:
+                return e
+
+        return _awaited()
+
+    @staticmethod
+    def _pick_objects(
+        ids: list[str | int], objects: Iterable[base.TObjCls]
+    ) -> list[base.TObjCls | exc.GitlabError]:
+        by_id = {obj.get_id(): obj for obj in objects}
+        return [
+            (
+                by_id[id]
+                if id in by_id
+                else exc.GitlabGetError("404 Not found", response_code=404)
+            )
+            for id in ids
+        ]
 
 
 class GetWithoutIdMixin(HeadMixin[base.TObjCls]):
@@ -119,10 +277,9 @@ class GetWithoutIdMixin(HeadMixin[base.TObjCls]):
             GitlabAuthenticationError: If authentication is not correct
             GitlabGetError: If the server cannot perform the request
         """
-        server_data = self.gitlab.http_get(self.path, **kwargs)
-        if TYPE_CHECKING:
-            assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data)
+        return _cached_get(
+            self, self.path, lambda data: self._obj_cls(self, data), **kwargs
+        )
 
 
 class RefreshMixin(_RestObjectBase):
@@ -155,11 +312,13 @@ class RefreshMixin(_RestObjectBase):
         server_data = self.manager.gitlab.http_get(path, **kwargs)
         if TYPE_CHECKING:
             assert not isinstance(server_data, requests.Response)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
 
 class ListMixin(HeadMixin[base.TObjCls]):
     _list_filters: tuple[str, ...] = ()
+    # Attributes still returned by the server with ``simple=True``
+    _simple_fields: frozenset[str] = frozenset()
 
     @overload
     def list(
@@ -188,6 +347,14 @@ class ListMixin(HeadMixin[base.TObjCls]):
             page: ID of the page to return (starts with page 1)
             iterator: If set to True and no pagination option is
                 defined, return a generator instead of a list
+            as_dicts: If True, return the items as dicts parsed from the
+                server instead of building RESTObjects, which is faster
+                for read-only use
+            fields: If set, only keep these attributes (and the ID
+                attribute) of the items, dropped as each page is parsed
+            stream: If True, decode the items as they are read from the
+                connection rather than a page at a time, so that only one
+                item of a large page is kept in memory
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Returns:
@@ -197,6 +364,13 @@ class ListMixin(HeadMixin[base.TObjCls]):
             GitlabAuthenticationError: If authentication is not correct
             GitlabListError: If the server cannot perform the request
         """
+        as_dicts = kwargs.pop("as_dicts", False)
+        fields = kwargs.pop("fields", None)
+        if fields is not None:
+            fields = _fields_with_id(self, fields)
+            if self._simple_fields.issuperset(fields):
+                # Let the server leave out the other attributes too
+                kwargs.setdefault("simple", True)
 
         data, _ = utils._transform_types(
             data=kwargs,
@@ -218,10 +392,8 @@ class ListMixin(HeadMixin[base.TObjCls]):
         # Allow to overwrite the path, handy for custom listings
         path = data.pop("path", self.path)
 
-        obj = self.gitlab.http_list(path, iterator=iterator, **data)
-        if isinstance(obj, list):
-            return [self._obj_cls(self, item, created_from_list=True) for item in obj]
-        return base.RESTObjectList(self, self._obj_cls, obj)
+        obj = self.gitlab.http_list(path, iterator=iterator, fields=fields, **data)
+        return base.build_object_list(self, self._obj_cls, obj, as_dicts=as_dicts)
 
 
 class RetrieveMixin(ListMixin[base.TObjCls], GetMixin[base.TObjCls]): ...
@@ -258,7 +430,8 @@ class CreateMixin(base.RESTManager[base.TObjCls]):
         server_data = self.gitlab.http_post(path, post_data=data, files=files, **kwargs)
         if TYPE_CHECKING:
             assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data)
+        server_data = _invalidate_cached(self, path, server_data)
+        return utils.map_result(server_data, lambda data: self._obj_cls(self, data))
 
 
 @enum.unique
@@ -327,7 +500,7 @@ class UpdateMixin(base.RESTManager[base.TObjCls]):
         result = http_method(path, post_data=new_data, files=files, **kwargs)
         if TYPE_CHECKING:
             assert not isinstance(result, requests.Response)
-        return result
+        return _invalidate_cached(self, path, result)
 
 
 class SetMixin(base.RESTManager[base.TObjCls]):
@@ -352,7 +525,8 @@ class SetMixin(base.RESTManager[base.TObjCls]):
         server_data = self.gitlab.http_put(path, post_data=data, **kwargs)
         if TYPE_CHECKING:
             assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data)
+        server_data = _invalidate_cached(self, path, server_data)
+        return utils.map_result(server_data, lambda data: self._obj_cls(self, data))
 
 
 class DeleteMixin(base.RESTManager[base.TObjCls]):
@@ -373,7 +547,8 @@ class DeleteMixin(base.RESTManager[base.TObjCls]):
         else:
             path = f"{self.path}/{utils.EncodedId(id)}"
 
-        self.gitlab.http_delete(path, **kwargs)
+        result = self.gitlab.http_delete(path, **kwargs)
+        return utils.discard_result(_invalidate_cached(self, path, result))
 
 
 class CRUDMixin(
@@ -431,15 +606,14 @@ class SaveMixin(_RestObjectBase):
         updated_data = self._get_updated_data()
         # Nothing to update. Server fails if sent an empty dict.
         if not updated_data:
-            return None
+            return self.manager.gitlab._as_result(None)
 
         # call the manager
         obj_id = self.encoded_id
         if TYPE_CHECKING:
             assert isinstance(self.manager, UpdateMixin)
         server_data = self.manager.update(obj_id, updated_data, **kwargs)
-        self._update_attrs(server_data)
-        return server_data
+        return utils.map_result(server_data, self._update_and_return)
 
 
 class ObjectDeleteMixin(_RestObjectBase):
@@ -465,7 +639,7 @@ class ObjectDeleteMixin(_RestObjectBase):
         if TYPE_CHECKING:
             assert isinstance(self.manager, DeleteMixin)
             assert self.encoded_id is not None
-        self.manager.delete(self.encoded_id, **kwargs)
+        return self.manager.delete(self.encoded_id, **kwargs)
 
 
 class UserAgentDetailMixin(_RestObjectBase):
@@ -527,7 +701,7 @@ class AccessRequestMixin(_RestObjectBase):
         server_data = self.manager.gitlab.http_put(path, post_data=data, **kwargs)
         if TYPE_CHECKING:
             assert not isinstance(server_data, requests.Response)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
 
 class DownloadMixin(_RestObjectBase):
@@ -538,6 +712,19 @@ class DownloadMixin(_RestObjectBase):
     _updated_attrs: dict[str, Any]
     manager: base.RESTManager[Any]
 
+    @overload
+    def download(
+        self,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        segments: int = 1,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
+
     @overload
     def download(
         self,
@@ -580,8 +767,10 @@ class DownloadMixin(_RestObjectBase):
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
+        segments: int = 1,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Download the archive of a resource export.
 
         Args:
@@ -590,6 +779,14 @@ class DownloadMixin(_RestObjectBase):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
+            segments: With `download_to` a path, the maximum number of
+                byte ranges of the data to fetch concurrently when the
+                server accepts ranges.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -603,6 +800,10 @@ class DownloadMixin(_RestObjectBase):
             The blob content if streamed is False, None otherwise
         """
         path = f"{self.manager.path}/download"
+        if download_to is not None:
+            return self.manager.gitlab.http_download(
+                path, download_to, segments=segments, **kwargs
+            )
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
@@ -676,8 +877,7 @@ class ObjectRotateMixin(_RestObjectBase):
             assert self.encoded_id is not None
         token_id = "self" if self_rotate else self.encoded_id
         server_data = self.manager.rotate(token_id, **kwargs)
-        self._update_attrs(server_data)
-        return server_data
+        return utils.map_result(server_data, self._update_and_return)
 
 
 class SubscribableMixin(_RestObjectBase):
@@ -706,7 +906,7 @@ class SubscribableMixin(_RestObjectBase):
         server_data = self.manager.gitlab.http_post(path, **kwargs)
         if TYPE_CHECKING:
             assert not isinstance(server_data, requests.Response)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(
         cls_names=("ProjectIssue", "ProjectMergeRequest", "ProjectLabel", "GroupLabel")
@@ -726,7 +926,7 @@ class SubscribableMixin(_RestObjectBase):
         server_data = self.manager.gitlab.http_post(path, **kwargs)
         if TYPE_CHECKING:
             assert not isinstance(server_data, requests.Response)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
 
 class TodoMixin(_RestObjectBase):
@@ -750,7 +950,7 @@ class TodoMixin(_RestObjectBase):
             GitlabTodoError: If the todo cannot be set
         """
         path = f"{self.manager.path}/{self.encoded_id}/todo"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
 
 
 class TimeTrackingMixin(_RestObjectBase):
@@ -779,7 +979,7 @@ class TimeTrackingMixin(_RestObjectBase):
             time_stats = self.attributes["time_stats"]
             if TYPE_CHECKING:
                 assert isinstance(time_stats, dict)
-            return time_stats
+            return self.manager.gitlab._as_result(time_stats)
 
         path = f"{self.manager.path}/{self.encoded_id}/time_stats"
         result = self.manager.gitlab.http_get(path, **kwargs)
@@ -1007,6 +1207,7 @@ class UploadMixin(_RestObjectBase):
         filename: str,
         filedata: bytes | None = None,
         filepath: str | None = None,
+        progress: utils.UploadProgress | None = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Upload the specified file.
@@ -1018,7 +1219,10 @@ class UploadMixin(_RestObjectBase):
         Args:
             filename: The name of the file being uploaded
             filedata: The raw data of the file being uploaded
-            filepath: The path to a local file to upload (optional)
+            filepath: The path to a local file to upload (optional), streamed
+                by chunks rather than loaded into memory
+            progress: Called after each chunk read with the number of bytes
+                uploaded so far and the size of the file
 
         Raises:
             GitlabAuthenticationError: If authentication is not correct
@@ -1037,11 +1241,15 @@ class UploadMixin(_RestObjectBase):
         if filedata is not None and filepath is not None:
             raise exc.GitlabUploadError("File contents and file path specified")
 
+        file: bytes | utils.UploadStream | None = filedata
         if filepath is not None:
-            with open(filepath, "rb") as f:
-                filedata = f.read()
+            file = utils.UploadStream(filepath, progress=progress)
+        elif progress is not None:
+            if TYPE_CHECKING:
+                assert filedata is not None
+            file = utils.UploadStream(io.BytesIO(filedata), progress=progress)
 
-        file_info = {"file": (filename, filedata)}
+        file_info = {"file": (filename, file)}
         path = self._get_upload_path()
         server_data = self.manager.gitlab.http_post(path, files=file_info, **kwargs)
 
@@ -1,20 +1,53 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import email.message
+import email.utils
+import inspect
+import json
 import logging
+import math
+import os
 import pathlib
+import random
+import re
+import threading
 import time
 import traceback
 import urllib.parse
 import warnings
-from collections.abc import Iterator, MutableMapping
-from typing import Any, Callable, Literal
+from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator, MutableMapping
+from typing import Any, BinaryIO, Callable, Literal, TypeVar, Union
 
 import requests
+import urllib3
 
 from gitlab import const, types
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+#: Where ``download_to`` writes a download: a path or a binary file object
+DownloadDestination = Union[str, "os.PathLike[str]", BinaryIO]
+
+#: Bounds of the size of the chunks a download is read by
+DOWNLOAD_MIN_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_MAX_CHUNK_SIZE = 8 * 1024 * 1024
+# The chunks grow while reads are faster than this (in seconds), and shrink
+# when reads are slower than _DOWNLOAD_SLOW_READ
+_DOWNLOAD_FAST_READ = 0.01
+_DOWNLOAD_SLOW_READ = 0.5
+#: Smallest segment of a download fetched on its own connection with
+#: ``segments``
+DOWNLOAD_MIN_SEGMENT_SIZE = 1024 * 1024
+#: Size of the chunks an upload is read from its file by
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+#: Called with the number of bytes of an upload read so far, and its size if
+#: known
+UploadProgress = Callable[[int, Union[int, None]], Any]
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
 
 class _StdoutStream:
     def __call__(self, chunk: Any) -> None:
@@ -66,6 +99,73 @@ class MaskingFormatter(logging.Formatter):
         return self._filter(original)
 
 
+def running_on_asyncio() -> bool:
+    """Whether the caller runs in an asyncio event loop (and not e.g. trio)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+async def async_sleep(seconds: float) -> None:
+    """Sleep without blocking the event loop the caller runs in."""
+    if running_on_asyncio():
+        await asyncio.sleep(seconds)
+    else:
+        # Other event loops (e.g. trio) are supported by httpx through anyio
+        import anyio
+
+        await anyio.sleep(seconds)
+
+
+def map_result(result: _T | Awaitable[_T], func: Callable[[_T], _R]) -> Any:
+    """Apply ``func`` to the result of a request.
+
+    Requests made through :class:`~gitlab.AsyncGitlab` return awaitables. In
+    that case an awaitable is returned as well, which applies ``func`` to the
+    awaited value (and awaits the outcome of ``func`` if needed). Otherwise
+    ``func`` is applied directly.
+    """
+    if not inspect.isawaitable(result):
+        return func(result)
+
+    async def _map_awaited() -> Any:
+        value = func(await result)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    return _map_awaited()
+
+
+def discard_result(result: Any) -> Any:
+    """Drop the result of a request, awaiting it first for the async client."""
+    return map_result(result, lambda _: None)
+
+
+@dataclasses.dataclass
+class DownloadStats:
+    """Statistics of a download written with ``download_to``."""
+
+    #: Number of bytes downloaded and written
+    size: int = 0
+    #: Duration of the download, in seconds
+    elapsed: float = 0.0
+    #: Number of bytes of an interrupted download that were not downloaded
+    #: again, as the download was resumed after them
+    resumed_from: int = 0
+    #: Number of times the download was resumed after a connection error
+    retries: int = 0
+    #: Number of segments the data was fetched in concurrently
+    segments: int = 1
+
+    @property
+    def throughput(self) -> float:
+        """Average throughput, in bytes per second."""
+        return self.size / self.elapsed if self.elapsed > 0 else 0.0
+
+
 def response_content(
     response: requests.Response,
     streamed: bool,
@@ -74,6 +174,21 @@ def response_content(
     *,
     iterator: bool,
 ) -> bytes | Iterator[Any] | None:
+    if inspect.isawaitable(response):
+        # pending request of the async client
+        return map_result(
+            response,
+            lambda response: response_content(
+                response, streamed, action, chunk_size, iterator=iterator
+            ),
+        )
+
+    if hasattr(response, "aiter_bytes"):
+        # httpx response returned by the async client
+        return _async_response_content(
+            response, streamed, action, chunk_size, iterator=iterator
+        )
+
     if iterator:
         return response.iter_content(chunk_size=chunk_size)
 
@@ -89,6 +204,458 @@ def response_content(
     return None
 
 
+def _async_response_content(
+    response: Any,
+    streamed: bool,
+    action: Callable[[bytes], Any] | None,
+    chunk_size: int,
+    *,
+    iterator: bool,
+) -> Any:
+    if iterator:
+        iterated: AsyncIterator[bytes] = response.aiter_bytes(chunk_size=chunk_size)
+        return iterated
+
+    if streamed is False:
+        return response.content
+
+    if action is None:
+        action = _StdoutStream()
+
+    async def _stream() -> None:
+        try:
+            async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                if chunk:
+                    result = action(chunk)
+                    if inspect.isawaitable(result):
+                        await result
+        finally:
+            await response.aclose()
+
+    return _stream()
+
+
+def _next_chunk_size(size: int, read: int, elapsed: float) -> int:
+    if read == size and elapsed < _DOWNLOAD_FAST_READ:
+        return min(size * 2, DOWNLOAD_MAX_CHUNK_SIZE)
+    if elapsed > _DOWNLOAD_SLOW_READ:
+        return max(size // 2, DOWNLOAD_MIN_CHUNK_SIZE)
+    return size
+
+
+def iter_response_chunks(response: requests.Response) -> Iterator[bytes]:
+    """Iterate over the decoded body of a streamed response.
+
+    The body is read by chunks growing while the data arrives quickly, up to
+    DOWNLOAD_MAX_CHUNK_SIZE, so that large downloads take few reads.
+    """
+    raw = response.raw
+    chunk_size = DOWNLOAD_MIN_CHUNK_SIZE
+    while True:
+        start = time.perf_counter()
+        # urllib3's readinto() copies what read() returns, so reading into a
+        # reused buffer would be slower
+        chunk = _read_raw(raw, chunk_size)
+        if not chunk:
+            return
+        elapsed = time.perf_counter() - start
+        yield chunk
+        chunk_size = _next_chunk_size(chunk_size, len(chunk), elapsed)
+
+
+def _read_raw(raw: Any, size: int) -> bytes:
+    """Read decoded data from a urllib3 response, raising the exceptions
+    requests' iter_content() raises."""
+    try:
+        data: bytes = raw.read(size, decode_content=True)
+    except urllib3.exceptions.ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except urllib3.exceptions.DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e) from e
+    except urllib3.exceptions.ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+    except urllib3.exceptions.SSLError as e:
+        raise requests.exceptions.SSLError(e) from e
+    return data
+
+
+class ResumableDownload:
+    """A download written to a destination, resumed with ``Range`` requests
+    after it was interrupted.
+
+    When the destination is a path, the data is written to a ``.<name>.part``
+    file next to it, renamed once the download is complete. If the download
+    fails, the part file is kept along with the validators of the data
+    (``ETag``, ``Last-Modified`` and size) in a ``.<name>.part.json`` file, so
+    that a later download to the same path only requests the missing data.
+    The download is started over if the server does not answer with the
+    same validators.
+
+    Data compressed with a ``Content-Encoding`` is not resumed, as ranges
+    apply to the compressed data. Neither is data written to a file object
+    that is not seekable.
+
+    The rest of the data can also be fetched in segments written concurrently
+    at their offsets of the part file (see :meth:`split`). Such a download is
+    started over rather than resumed, as the segments leave holes.
+
+    Args:
+        destination: Path or binary file object to write the data to
+        resume: Whether to resume the download (False when the request asks
+            for a range itself)
+    """
+
+    def __init__(self, destination: DownloadDestination, resume: bool = True) -> None:
+        self.stats = DownloadStats()
+        #: Number of bytes written to the destination
+        self.offset = 0
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        #: Size of the data, if known
+        self.size: int | None = None
+        self.resumable = resume
+        self._start = time.perf_counter()
+        self._file: BinaryIO | None = None
+        self._segmented = False
+        self._lock = threading.Lock()
+        self._file_start = 0
+        self.path: pathlib.Path | None = None
+        if isinstance(destination, (str, os.PathLike)):
+            self.path = pathlib.Path(destination)
+            self.part_path = self.path.with_name(f".{self.path.name}.part")
+            self._state_path = self.path.with_name(f".{self.path.name}.part.json")
+            if resume:
+                self._load_state()
+        else:
+            self._file = destination
+            if destination.seekable():
+                self._file_start = destination.tell()
+            else:
+                self.resumable = False
+
+    def _load_state(self) -> None:
+        try:
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+            offset = self.part_path.stat().st_size
+        except (OSError, ValueError):
+            return
+        self.etag = state.get("etag")
+        self.last_modified = state.get("last_modified")
+        self.size = state.get("size")
+        self.offset = self.stats.resumed_from = offset
+
+    def request_headers(self) -> dict[str, str]:
+        """Return the headers requesting the missing data."""
+        if not self.resumable or not self.offset:
+            return {}
+        headers = {"Range": f"bytes={self.offset}-"}
+        # The server sends the whole data instead if it changed
+        if self.etag is not None and not self.etag.startswith("W/"):
+            headers["If-Range"] = self.etag
+        elif self.last_modified is not None:
+            headers["If-Range"] = self.last_modified
+        return headers
+
+    def start(self, status_code: int, headers: MutableMapping[str, str]) -> bool:
+        """Prepare writing the body of a response.
+
+        Returns:
+            False if the response is part of data that does not match the
+            data already written, and the download must be started over
+        """
+        if status_code == 206 and self.resumable:
+            if not self._resumes(headers):
+                return False
+        else:
+            self.offset = self.stats.resumed_from = 0
+            self.etag = headers.get("ETag")
+            self.last_modified = headers.get("Last-Modified")
+            encoded = headers.get("Content-Encoding", "identity") != "identity"
+            length = headers.get("Content-Length")
+            self.size = int(length) if length is not None and not encoded else None
+            if encoded:
+                self.resumable = False
+            self._save_state()
+
+        # Drop what was written after the offset, e.g. by a failed attempt
+        if self.path is not None:
+            if self._file is None:
+                self._file = open(self.part_path, "ab")
+            self._file.truncate(self.offset)
+        elif self.resumable:
+            assert self._file is not None
+            self._file.seek(self._file_start + self.offset)
+            self._file.truncate()
+        return True
+
+    def _resumes(self, headers: MutableMapping[str, str]) -> bool:
+        return self._matches(headers, self.offset)
+
+    def _matches(self, headers: MutableMapping[str, str], offset: int) -> bool:
+        match = _CONTENT_RANGE.fullmatch(headers.get("Content-Range", ""))
+        if match is None or int(match[1]) != offset:
+            return False
+        size = None if match[3] == "*" else int(match[3])
+        etag = headers.get("ETag")
+        if self.etag is not None and etag is not None and etag != self.etag:
+            return False
+        if self.size is not None and size is not None and size != self.size:
+            return False
+        if self.size is None:
+            self.size = size
+        return True
+
+    def _save_state(self) -> None:
+        if self.path is None:
+            return
+        if not self.resumable:
+            self._state_path.unlink(missing_ok=True)
+            return
+        state = {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "size": self.size,
+        }
+        self._state_path.write_text(json.dumps(state), encoding="utf-8")
+
+    def split(
+        self, status_code: int, headers: MutableMapping[str, str], segments: int
+    ) -> list[tuple[int, int]]:
+        """Prepare writing the rest of the data in up to ``segments``
+        segments, once :meth:`start` accepted a response.
+
+        The data is only split when it is written to a path, its size is
+        known and the server accepts ranges, in segments of at least
+        DOWNLOAD_MIN_SEGMENT_SIZE bytes. The part file is then extended to
+        the size of the data, to be written with :meth:`write_at`.
+
+        Returns:
+            The ``(start, end)`` offsets of the segments, the first one being
+            the rest of the response; an empty list if the data is not split
+        """
+        if self.path is None or self.size is None or not self.resumable:
+            return []
+        ranges = status_code == 206 or (
+            headers.get("Accept-Ranges", "").lower() == "bytes"
+        )
+        remaining = self.size - self.offset
+        segments = min(segments, remaining // DOWNLOAD_MIN_SEGMENT_SIZE)
+        if not ranges or segments < 2:
+            return []
+
+        assert self._file is not None
+        self._file.close()
+        self._file = open(self.part_path, "r+b")
+        self._file.truncate(self.size)
+        self._segmented = True
+        self.resumable = False
+        self.stats.segments = segments
+        bounds = [self.offset + remaining * i // segments for i in range(segments)]
+        return list(zip(bounds, bounds[1:] + [self.size]))
+
+    def segment_headers(self, start: int, end: int) -> dict[str, str]:
+        """Return the headers requesting the segment from ``start`` to
+        ``end`` (excluded)."""
+        headers = {"Range": f"bytes={start}-{end - 1}"}
+        if self.etag is not None and not self.etag.startswith("W/"):
+            headers["If-Range"] = self.etag
+        elif self.last_modified is not None:
+            headers["If-Range"] = self.last_modified
+        return headers
+
+    def segment_matches(
+        self, status_code: int, headers: MutableMapping[str, str], start: int
+    ) -> bool:
+        """Whether a response is the part of the data starting at ``start``."""
+        return status_code == 206 and self._matches(headers, start)
+
+    def write_at(self, offset: int, chunk: bytes) -> None:
+        """Write a chunk of a segment at its offset, from any thread."""
+        assert self._file is not None
+        if hasattr(os, "pwrite"):
+            fd = self._file.fileno()
+            view = memoryview(chunk)
+            while view:
+                written = os.pwrite(fd, view, offset)
+                view = view[written:]
+                offset += written
+            with self._lock:
+                self.offset += len(chunk)
+                self.stats.size += len(chunk)
+            return
+        with self._lock:
+            self._file.seek(offset)
+            self._file.write(chunk)
+            self.offset += len(chunk)
+            self.stats.size += len(chunk)
+
+    def segment_retried(self) -> None:
+        with self._lock:
+            self.stats.retries += 1
+
+    def restart(self) -> None:
+        """Start the download over, the data written not being valid."""
+        if self._segmented:
+            # Write the whole data again as a single stream
+            assert self._file is not None
+            self._file.close()
+            self._file = None
+            self._segmented = False
+            self.resumable = True
+            self.stats.segments = 1
+        self.offset = self.stats.resumed_from = 0
+        self.etag = self.last_modified = None
+        self.size = None
+
+    def write(self, chunk: bytes) -> None:
+        assert self._file is not None
+        self._file.write(chunk)
+        self.offset += len(chunk)
+        self.stats.size += len(chunk)
+
+    @property
+    def complete(self) -> bool:
+        """Whether all the data was written, when its size is known."""
+        return self.size is None or self.offset >= self.size
+
+    def finish(self) -> DownloadStats:
+        """Move the data to the destination, and return the statistics."""
+        if self.path is not None:
+            assert self._file is not None
+            self._file.close()
+            os.replace(self.part_path, self.path)
+            self._state_path.unlink(missing_ok=True)
+        self.stats.elapsed = time.perf_counter() - self._start
+        return self.stats
+
+    def abort(self) -> None:
+        """Keep the data written to resume the download later, if possible."""
+        if self.path is None:
+            return
+        if self._file is not None:
+            self._file.close()
+        if not self.resumable or not self.offset:
+            self.part_path.unlink(missing_ok=True)
+            self._state_path.unlink(missing_ok=True)
+
+
+class UploadStream:
+    """The data of an upload read from a file by chunks, rather than all
+    at once into memory.
+
+    The stream is read like a binary file by the HTTP clients, or iterated
+    over by chunks of ``chunk_size``. When the size of the data is known,
+    from the size of the file, it is sent as the ``Content-Length`` of the
+    request; otherwise the data is sent with chunked transfer encoding.
+
+    A path is opened when the data is first read, and closed once it was
+    read completely. A file object is read from its current position.
+
+    Args:
+        file: Path or binary file object to read the data from
+        chunk_size: Size of the chunks the data is iterated over by
+        progress: Called after each read with the number of bytes read so
+            far, and the size of the data if known
+
+    Raises:
+        OSError: If the path does not exist
+    """
+
+    def __init__(
+        self,
+        file: str | os.PathLike[str] | BinaryIO,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        progress: UploadProgress | None = None,
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.progress = progress
+        #: Number of bytes read since the start of the data
+        self.sent = 0
+        #: Size of the data, None if unknown
+        self.size: int | None = None
+        self._path: pathlib.Path | None = None
+        self._file: BinaryIO | None = None
+        self._start = 0
+        self._eof = False
+        if isinstance(file, (str, os.PathLike)):
+            self._path = pathlib.Path(file)
+            self.size = self._path.stat().st_size
+        else:
+            self._file = file
+            if file.seekable():
+                self._start = file.tell()
+                self.size = file.seek(0, os.SEEK_END) - self._start
+                file.seek(self._start)
+
+    @property
+    def len(self) -> int | None:
+        """Number of bytes left to read, as expected by requests and
+        requests-toolbelt."""
+        return None if self.size is None else self.size - self.sent
+
+    def read(self, size: int = -1) -> bytes:
+        if self._eof:
+            return b""
+        if self._file is None:
+            assert self._path is not None
+            self._file = open(self._path, "rb")
+        remaining = self.len
+        if remaining is not None:
+            # Data appended to the file meanwhile is not sent
+            size = remaining if size < 0 else min(size, remaining)
+        data = self._file.read(size)
+        self.sent += len(data)
+        if not data or size < 0 or self.sent == self.size:
+            self._eof = True
+            self.close()
+        if self.progress is not None and data:
+            self.progress(self.sent, self.size)
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(self.chunk_size):
+            yield chunk
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Iterate over the chunks of the data, read from a worker thread so
+        that the event loop is not blocked by the disk."""
+        import anyio.to_thread
+
+        while chunk := await anyio.to_thread.run_sync(self.read, self.chunk_size):
+            yield chunk
+
+    def rewind(self) -> None:
+        """Read the data from its start again, e.g. to send it again."""
+        self.sent = 0
+        self._eof = False
+        if self._path is not None:
+            self.close()
+        elif self._file is not None and self._file.seekable():
+            self._file.seek(self._start)
+
+    def close(self) -> None:
+        """Close the file opened from the path, if any."""
+        if self._path is not None and self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def rewind_uploads(*data: Any) -> None:
+    """Rewind the upload streams in the body of a request, before sending it
+    (again).
+
+    Args:
+        *data: The body data and files of the request
+    """
+    for value in data:
+        items = value.values() if isinstance(value, dict) else [value]
+        for item in items:
+            if isinstance(item, tuple) and len(item) > 1:
+                item = item[1]
+            if isinstance(item, UploadStream):
+                item.rewind()
+
+
 class Retry:
     def __init__(
         self,
@@ -152,6 +719,205 @@ class Retry:
         return False
 
 
+def _retry_after_seconds(value: str) -> float | None:
+    """Parse a ``Retry-After`` header, given in seconds or as an HTTP date."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return date.timestamp() - time.time()
+
+
+class AsyncRetry(Retry):
+    """Non-blocking counterpart of :class:`Retry` for async clients.
+
+    Waits are done with ``asyncio.sleep()`` so other tasks keep running, and
+    the exponential backoff is randomized ("full jitter") so that concurrent
+    requests hitting the same limit do not retry in lockstep.
+
+    Args:
+        max_retries: Maximum number of retries, -1 for no limit
+        obey_rate_limit: Whether to retry on 429 responses
+        retry_transient_errors: Whether to retry on 5xx responses and
+            connection errors
+        deadline: Total time, in seconds, after which no more retries are
+            attempted (counted from the creation of the object)
+        jitter: Whether to randomize the exponential backoff
+    """
+
+    def __init__(
+        self,
+        max_retries: int,
+        obey_rate_limit: bool | None = True,
+        retry_transient_errors: bool | None = False,
+        *,
+        deadline: float | None = None,
+        jitter: bool = True,
+    ) -> None:
+        super().__init__(max_retries, obey_rate_limit, retry_transient_errors)
+        self.deadline = deadline
+        self.jitter = jitter
+        self._start = time.monotonic()
+
+    def _backoff(self) -> float:
+        wait_time = 2**self.cur_retries * 0.1
+        if self.jitter:
+            wait_time = random.uniform(0, wait_time)
+        return wait_time
+
+    def _can_retry(self, wait_time: float) -> bool:
+        if self.max_retries != -1 and self.cur_retries >= self.max_retries:
+            return False
+        if self.deadline is None:
+            return True
+        return time.monotonic() - self._start + wait_time <= self.deadline
+
+    @staticmethod
+    async def _sleep(seconds: float) -> None:
+        await async_sleep(seconds)
+
+    async def _wait(self, wait_time: float) -> bool:
+        wait_time = max(wait_time, 0.0)
+        if not self._can_retry(wait_time):
+            return False
+        self.cur_retries += 1
+        await self._sleep(wait_time)
+        return True
+
+    async def handle_retry_on_status(  # type: ignore[override]
+        self,
+        status_code: int | None,
+        headers: MutableMapping[str, str] | None = None,
+        reason: str = "",
+    ) -> bool:
+        if not self._retryable_status_code(status_code, reason):
+            return False
+
+        if headers is None:
+            headers = {}
+
+        wait_time: float | None = None
+        if "Retry-After" in headers:
+            wait_time = _retry_after_seconds(headers["Retry-After"])
+        elif "RateLimit-Reset" in headers:
+            try:
+                wait_time = float(headers["RateLimit-Reset"]) - time.time()
+            except ValueError:
+                pass
+        if wait_time is None:
+            wait_time = self._backoff()
+        return await self._wait(wait_time)
+
+    async def handle_retry(self) -> bool:  # type: ignore[override]
+        if not self.retry_transient_errors:
+            return False
+        return await self._wait(self._backoff())
+
+
+class RateLimiter:
+    """Client-side token bucket following the GitLab rate limit headers.
+
+    The bucket holds the number of requests left in the current rate limit
+    window, as announced by the ``RateLimit-Limit``, ``RateLimit-Remaining``
+    and ``RateLimit-Reset`` response headers, and is refilled when the window
+    resets. Requests made once it is empty wait for the next window instead
+    of being answered with 429 and retried.
+
+    A single limiter can be shared by several clients, threads and tasks that
+    use the same token. Until the first response with rate limit headers has
+    been seen, requests are not delayed.
+
+    Args:
+        period: Length, in seconds, of a rate limit window, used to schedule
+            requests waiting beyond the next reset
+    """
+
+    def __init__(self, period: float = 60.0) -> None:
+        self.period = period
+        self._lock = threading.Lock()
+        self._limit: int | None = None
+        self._tokens = 0.0
+        self._reset = 0.0
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_lock")
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int | None:
+        """Number of requests allowed per window, None if not known yet."""
+        return self._limit
+
+    @property
+    def remaining(self) -> float:
+        """Number of requests that can be sent right away."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(self._tokens, 0.0) if self._limit is not None else math.inf
+
+    def _refill(self, now: float) -> None:
+        if self._limit is None or now < self._reset:
+            return
+        windows = math.floor((now - self._reset) / self.period) + 1
+        self._tokens = min(self._tokens + windows * self._limit, self._limit)
+        self._reset += windows * self.period
+
+    def _reserve(self) -> float:
+        """Take a token and return the time to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._limit is None:
+                return 0.0
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # Requests beyond the quota are spread over the next windows
+            windows = math.ceil(-self._tokens / self._limit) - 1
+            return self._reset - now + windows * self.period
+
+    def acquire(self) -> None:
+        """Wait until a request can be sent."""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def async_acquire(self) -> None:
+        """Wait, without blocking the event loop, until a request can be sent."""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            await async_sleep(wait_time)
+
+    def update(self, headers: MutableMapping[str, str]) -> None:
+        """Synchronize the bucket with the rate limit headers of a response."""
+        try:
+            limit = int(headers["RateLimit-Limit"])
+            remaining = int(headers["RateLimit-Remaining"])
+            reset = float(headers["RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._limit is None:
+                self._tokens = remaining
+            else:
+                # Requests still in flight are not counted by the server yet
+                self._tokens = min(self._tokens, remaining)
+            self._limit = limit
+            self._reset = now + max(reset - time.time(), 0.0)
+
+
 def _transform_types(
     data: dict[str, Any],
     custom_types: dict[str, Any],
@@ -250,6 +1016,26 @@ class EncodedId(str):
         return super().__new__(cls, value)
 
 
+def select_fields(data: Any, fields: Iterable[str] | None) -> Any:
+    """Keep only ``fields`` of a decoded JSON object, or of each object of a
+    list. ``data`` is returned unchanged if ``fields`` is None."""
+    if fields is None:
+        return data
+    keep = frozenset(fields)
+    if isinstance(data, dict):
+        return {k: v for k, v in data.items() if k in keep}
+    if isinstance(data, list):
+        return [
+            (
+                {k: v for k, v in item.items() if k in keep}
+                if isinstance(item, dict)
+                else item
+            )
+            for item in data
+        ]
+    return data
+
+
 def remove_none_from_dict(data: dict[str, Any]) -> dict[str, Any]:
     return {k: v for k, v in data.items() if v is not None}
 
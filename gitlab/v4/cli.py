@@ -8,6 +8,7 @@ from typing import Any, TYPE_CHECKING
 
 import gitlab
 import gitlab.base
+import gitlab.mixins
 import gitlab.v4.objects
 from gitlab import cli
 from gitlab.exceptions import GitlabCiLintError
@@ -385,7 +386,51 @@ def _populate_sub_parser_by_class(
                     )
 
 
-def extend_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+def _resource_cls(gitlab_resource: str) -> type[gitlab.base.RESTObject] | None:
+    """Return the class of a resource, importing only its module, or None if
+    there is no resource with this exact name."""
+    try:
+        cls = cli.gitlab_resource_to_cls(gitlab_resource, namespace=gitlab.v4.objects)
+    except (KeyError, AttributeError):
+        return None
+    if not isinstance(cls, type) or not issubclass(cls, gitlab.base.RESTObject):
+        return None
+    mgr_cls = getattr(gitlab.v4.objects, f"{cls.__name__}Manager", None)
+    if getattr(mgr_cls, "_obj_cls", None) is not cls:
+        return None
+    if cli.cls_to_gitlab_resource(cls) != gitlab_resource:
+        return None
+    return cls
+
+
+def _add_resource_parser(
+    subparsers: _SubparserType, cls: type[gitlab.base.RESTObject]
+) -> None:
+    arg_name = cli.cls_to_gitlab_resource(cls)
+    mgr_cls_name = f"{cls.__name__}Manager"
+    mgr_cls = getattr(gitlab.v4.objects, mgr_cls_name)
+    object_group = subparsers.add_parser(
+        arg_name, help=f"API endpoint: {mgr_cls._path}"
+    )
+
+    object_subparsers = object_group.add_subparsers(
+        title="action",
+        dest="resource_action",
+        help="Action to execute on the GitLab resource.",
+    )
+    _populate_sub_parser_by_class(cls, object_subparsers)
+    object_subparsers.required = True
+
+
+def extend_parser(
+    parser: argparse.ArgumentParser, gitlab_resource: str | None = None
+) -> argparse.ArgumentParser:
+    """Add the subparsers of the resources and their actions to ``parser``.
+
+    If ``gitlab_resource`` is the name of a resource, only its subparser is
+    added, which avoids importing and describing every other resource.
+    Otherwise the subparsers of all the resources are added.
+    """
     subparsers = parser.add_subparsers(
         title="resource",
         dest="gitlab_resource",
@@ -393,9 +438,17 @@ def extend_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     )
     subparsers.required = True
 
+    if gitlab_resource is not None:
+        resource_cls = _resource_cls(gitlab_resource)
+        if resource_cls is not None:
+            _add_resource_parser(subparsers, resource_cls)
+            return parser
+
     # populate argparse for all Gitlab Object
     classes: set[type[gitlab.base.RESTObject]] = set()
-    for cls in gitlab.v4.objects.__dict__.values():
+    # dir() also lists the names of the lazily imported modules
+    for name in dir(gitlab.v4.objects):
+        cls = getattr(gitlab.v4.objects, name)
         if not isinstance(cls, type):
             continue
         if issubclass(cls, gitlab.base.RESTManager):
@@ -408,20 +461,7 @@ def extend_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
             # can only be used to calls specific API paths.
             continue
 
-        arg_name = cli.cls_to_gitlab_resource(cls)
-        mgr_cls_name = f"{cls.__name__}Manager"
-        mgr_cls = getattr(gitlab.v4.objects, mgr_cls_name)
-        object_group = subparsers.add_parser(
-            arg_name, help=f"API endpoint: {mgr_cls._path}"
-        )
-
-        object_subparsers = object_group.add_subparsers(
-            title="action",
-            dest="resource_action",
-            help="Action to execute on the GitLab resource.",
-        )
-        _populate_sub_parser_by_class(cls, object_subparsers)
-        object_subparsers.required = True
+        _add_resource_parser(subparsers, cls)
 
     return parser
 
@@ -1,82 +1,656 @@
-from .access_requests import *
-from .appearance import *
-from .applications import *
-from .artifacts import *
-from .audit_events import *
-from .award_emojis import *
-from .badges import *
-from .boards import *
-from .branches import *
-from .broadcast_messages import *
-from .bulk_imports import *
-from .ci_lint import *
-from .cluster_agents import *
-from .clusters import *
-from .commits import *
-from .container_registry import *
-from .custom_attributes import *
-from .deploy_keys import *
-from .deploy_tokens import *
-from .deployments import *
-from .discussions import *
-from .draft_notes import *
-from .environments import *
-from .epics import *
-from .events import *
-from .export_import import *
-from .features import *
-from .files import *
-from .geo_nodes import *
-from .group_access_tokens import *
-from .groups import *
-from .hooks import *
-from .integrations import *
-from .invitations import *
-from .issues import *
-from .iterations import *
-from .job_token_scope import *
-from .jobs import *
-from .keys import *
-from .labels import *
-from .ldap import *
-from .member_roles import *
-from .members import *
-from .merge_request_approvals import *
-from .merge_requests import *
-from .merge_trains import *
-from .milestones import *
-from .namespaces import *
-from .notes import *
-from .notification_settings import *
-from .package_protection_rules import *
-from .packages import *
-from .pages import *
-from .personal_access_tokens import *
-from .pipelines import *
-from .project_access_tokens import *
-from .projects import *
-from .push_rules import *
-from .registry_protection_repository_rules import *
-from .registry_protection_rules import *
-from .releases import *
-from .repositories import *
-from .resource_groups import *
-from .reviewers import *
-from .runners import *
-from .secure_files import *
-from .service_accounts import *
-from .settings import *
-from .sidekiq import *
-from .snippets import *
-from .statistics import *
-from .status_checks import *
-from .tags import *
-from .templates import *
-from .todos import *
-from .topics import *
-from .triggers import *
-from .users import *
-from .variables import *
-from .wikis import *
+"""Objects of the GitLab API v4.
 
-__all__ = [name for name in dir() if not name.startswith("_")]
+The modules defining the objects are imported when one of their names is first
+accessed, rather than all at once with the package.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .access_requests import *
+    from .appearance import *
+    from .applications import *
+    from .artifacts import *
+    from .audit_events import *
+    from .award_emojis import *
+    from .badges import *
+    from .boards import *
+    from .branches import *
+    from .broadcast_messages import *
+    from .bulk_imports import *
+    from .ci_lint import *
+    from .cluster_agents import *
+    from .clusters import *
+    from .commits import *
+    from .container_registry import *
+    from .custom_attributes import *
+    from .deploy_keys import *
+    from .deploy_tokens import *
+    from .deployments import *
+    from .discussions import *
+    from .draft_notes import *
+    from .environments import *
+    from .epics import *
+    from .events import *
+    from .export_import import *
+    from .features import *
+    from .files import *
+    from .geo_nodes import *
+    from .group_access_tokens import *
+    from .groups import *
+    from .hooks import *
+    from .integrations import *
+    from .invitations import *
+    from .issues import *
+    from .iterations import *
+    from .job_token_scope import *
+    from .jobs import *
+    from .keys import *
+    from .labels import *
+    from .ldap import *
+    from .member_roles import *
+    from .members import *
+    from .merge_request_approvals import *
+    from .merge_requests import *
+    from .merge_trains import *
+    from .milestones import *
+    from .namespaces import *
+    from .notes import *
+    from .notification_settings import *
+    from .package_protection_rules import *
+    from .packages import *
+    from .pages import *
+    from .personal_access_tokens import *
+    from .pipelines import *
+    from .project_access_tokens import *
+    from .projects import *
+    from .push_rules import *
+    from .registry_protection_repository_rules import *
+    from .registry_protection_rules import *
+    from .releases import *
+    from .repositories import *
+    from .resource_groups import *
+    from .reviewers import *
+    from .runners import *
+    from .secure_files import *
+    from .service_accounts import *
+    from .settings import *
+    from .sidekiq import *
+    from .snippets import *
+    from .statistics import *
+    from .status_checks import *
+    from .tags import *
+    from .templates import *
+    from .todos import *
+    from .topics import *
+    from .triggers import *
+    from .users import *
+    from .variables import *
+    from .wikis import *
+
+# Names defined by each module, kept in sync with their __all__
+_MODULE_NAMES: dict[str, tuple[str, ...]] = {
+    "access_requests": (
+        "GroupAccessRequest",
+        "GroupAccessRequestManager",
+        "ProjectAccessRequest",
+        "ProjectAccessRequestManager",
+    ),
+    "appearance": ("ApplicationAppearance", "ApplicationAppearanceManager"),
+    "applications": ("Application", "ApplicationManager"),
+    "artifacts": ("ProjectArtifact", "ProjectArtifactManager"),
+    "audit_events": (
+        "AuditEvent",
+        "AuditEventManager",
+        "GroupAuditEvent",
+        "GroupAuditEventManager",
+        "ProjectAuditEvent",
+        "ProjectAuditEventManager",
+        "ProjectAudit",
+        "ProjectAuditManager",
+    ),
+    "award_emojis": (
+        "GroupEpicAwardEmoji",
+        "GroupEpicAwardEmojiManager",
+        "GroupEpicNoteAwardEmoji",
+        "GroupEpicNoteAwardEmojiManager",
+        "ProjectIssueAwardEmoji",
+        "ProjectIssueAwardEmojiManager",
+        "ProjectIssueNoteAwardEmoji",
+        "ProjectIssueNoteAwardEmojiManager",
+        "ProjectMergeRequestAwardEmoji",
+        "ProjectMergeRequestAwardEmojiManager",
+        "ProjectMergeRequestNoteAwardEmoji",
+        "ProjectMergeRequestNoteAwardEmojiManager",
+        "ProjectSnippetAwardEmoji",
+        "ProjectSnippetAwardEmojiManager",
+        "ProjectSnippetNoteAwardEmoji",
+        "ProjectSnippetNoteAwardEmojiManager",
+    ),
+    "badges": (
+        "GroupBadge",
+        "GroupBadgeManager",
+        "ProjectBadge",
+        "ProjectBadgeManager",
+    ),
+    "boards": (
+        "GroupBoardList",
+        "GroupBoardListManager",
+        "GroupBoard",
+        "GroupBoardManager",
+        "ProjectBoardList",
+        "ProjectBoardListManager",
+        "ProjectBoard",
+        "ProjectBoardManager",
+    ),
+    "branches": (
+        "ProjectBranch",
+        "ProjectBranchManager",
+        "ProjectProtectedBranch",
+        "ProjectProtectedBranchManager",
+    ),
+    "broadcast_messages": ("BroadcastMessage", "BroadcastMessageManager"),
+    "bulk_imports": (
+        "BulkImport",
+        "BulkImportManager",
+        "BulkImportAllEntity",
+        "BulkImportAllEntityManager",
+        "BulkImportEntity",
+        "BulkImportEntityManager",
+    ),
+    "ci_lint": ("CiLint", "CiLintManager", "ProjectCiLint", "ProjectCiLintManager"),
+    "cluster_agents": ("ProjectClusterAgent", "ProjectClusterAgentManager"),
+    "clusters": (
+        "GroupCluster",
+        "GroupClusterManager",
+        "ProjectCluster",
+        "ProjectClusterManager",
+    ),
+    "commits": (
+        "ProjectCommit",
+        "ProjectCommitManager",
+        "ProjectCommitComment",
+        "ProjectCommitCommentManager",
+        "ProjectCommitStatus",
+        "ProjectCommitStatusManager",
+    ),
+    "container_registry": (
+        "GroupRegistryRepositoryManager",
+        "ProjectRegistryRepository",
+        "ProjectRegistryRepositoryManager",
+        "ProjectRegistryTag",
+        "ProjectRegistryTagManager",
+        "RegistryRepository",
+        "RegistryRepositoryManager",
+    ),
+    "custom_attributes": (
+        "GroupCustomAttribute",
+        "GroupCustomAttributeManager",
+        "ProjectCustomAttribute",
+        "ProjectCustomAttributeManager",
+        "UserCustomAttribute",
+        "UserCustomAttributeManager",
+    ),
+    "deploy_keys": ("DeployKey", "DeployKeyManager", "ProjectKey", "ProjectKeyManager"),
+    "deploy_tokens": (
+        "DeployToken",
+        "DeployTokenManager",
+        "GroupDeployToken",
+        "GroupDeployTokenManager",
+        "ProjectDeployToken",
+        "ProjectDeployTokenManager",
+    ),
+    "deployments": ("ProjectDeployment", "ProjectDeploymentManager"),
+    "discussions": (
+        "ProjectCommitDiscussion",
+        "ProjectCommitDiscussionManager",
+        "ProjectIssueDiscussion",
+        "ProjectIssueDiscussionManager",
+        "ProjectMergeRequestDiscussion",
+        "ProjectMergeRequestDiscussionManager",
+        "ProjectSnippetDiscussion",
+        "ProjectSnippetDiscussionManager",
+    ),
+    "draft_notes": (
+        "ProjectMergeRequestDraftNote",
+        "ProjectMergeRequestDraftNoteManager",
+    ),
+    "environments": (
+        "ProjectEnvironment",
+        "ProjectEnvironmentManager",
+        "ProjectProtectedEnvironment",
+        "ProjectProtectedEnvironmentManager",
+    ),
+    "epics": (
+        "GroupEpic",
+        "GroupEpicManager",
+        "GroupEpicIssue",
+        "GroupEpicIssueManager",
+    ),
+    "events": (
+        "Event",
+        "EventManager",
+        "GroupEpicResourceLabelEvent",
+        "GroupEpicResourceLabelEventManager",
+        "ProjectEvent",
+        "ProjectEventManager",
+        "ProjectIssueResourceLabelEvent",
+        "ProjectIssueResourceLabelEventManager",
+        "ProjectIssueResourceMilestoneEvent",
+        "ProjectIssueResourceMilestoneEventManager",
+        "ProjectIssueResourceStateEvent",
+        "ProjectIssueResourceIterationEventManager",
+        "ProjectIssueResourceWeightEventManager",
+        "ProjectIssueResourceIterationEvent",
+        "ProjectIssueResourceWeightEvent",
+        "ProjectIssueResourceStateEventManager",
+        "ProjectMergeRequestResourceLabelEvent",
+        "ProjectMergeRequestResourceLabelEventManager",
+        "ProjectMergeRequestResourceMilestoneEvent",
+        "ProjectMergeRequestResourceMilestoneEventManager",
+        "ProjectMergeRequestResourceStateEvent",
+        "ProjectMergeRequestResourceStateEventManager",
+        "UserEvent",
+        "UserEventManager",
+    ),
+    "export_import": (
+        "GroupExport",
+        "GroupExportManager",
+        "GroupImport",
+        "GroupImportManager",
+        "ProjectExport",
+        "ProjectExportManager",
+        "ProjectImport",
+        "ProjectImportManager",
+    ),
+    "features": ("Feature", "FeatureManager"),
+    "files": ("ProjectFile", "ProjectFileManager"),
+    "geo_nodes": ("GeoNode", "GeoNodeManager"),
+    "group_access_tokens": ("GroupAccessToken", "GroupAccessTokenManager"),
+    "groups": (
+        "Group",
+        "GroupManager",
+        "GroupDescendantGroup",
+        "GroupDescendantGroupManager",
+        "GroupLDAPGroupLink",
+        "GroupLDAPGroupLinkManager",
+        "GroupSubgroup",
+        "GroupSubgroupManager",
+        "GroupSAMLGroupLink",
+        "GroupSAMLGroupLinkManager",
+    ),
+    "hooks": (
+        "Hook",
+        "HookManager",
+        "ProjectHook",
+        "ProjectHookManager",
+        "GroupHook",
+        "GroupHookManager",
+    ),
+    "integrations": (
+        "ProjectIntegration",
+        "ProjectIntegrationManager",
+        "ProjectService",
+        "ProjectServiceManager",
+    ),
+    "invitations": (
+        "ProjectInvitation",
+        "ProjectInvitationManager",
+        "GroupInvitation",
+        "GroupInvitationManager",
+    ),
+    "issues": (
+        "Issue",
+        "IssueManager",
+        "GroupIssue",
+        "GroupIssueManager",
+        "ProjectIssue",
+        "ProjectIssueManager",
+        "ProjectIssueLink",
+        "ProjectIssueLinkManager",
+    ),
+    "iterations": (
+        "ProjectIterationManager",
+        "GroupIteration",
+        "GroupIterationManager",
+    ),
+    "job_token_scope": ("ProjectJobTokenScope", "ProjectJobTokenScopeManager"),
+    "jobs": ("ProjectJob", "ProjectJobManager"),
+    "keys": ("Key", "KeyManager"),
+    "labels": (
+        "GroupLabel",
+        "GroupLabelManager",
+        "ProjectLabel",
+        "ProjectLabelManager",
+    ),
+    "ldap": ("LDAPGroup", "LDAPGroupManager"),
+    "member_roles": (
+        "MemberRole",
+        "MemberRoleManager",
+        "GroupMemberRole",
+        "GroupMemberRoleManager",
+    ),
+    "members": (
+        "GroupBillableMember",
+        "GroupBillableMemberManager",
+        "GroupBillableMemberMembership",
+        "GroupBillableMemberMembershipManager",
+        "GroupMember",
+        "GroupMemberAll",
+        "GroupMemberManager",
+        "GroupMemberAllManager",
+        "ProjectMember",
+        "ProjectMemberAll",
+        "ProjectMemberManager",
+        "ProjectMemberAllManager",
+    ),
+    "merge_request_approvals": (
+        "GroupApprovalRule",
+        "GroupApprovalRuleManager",
+        "ProjectApproval",
+        "ProjectApprovalManager",
+        "ProjectApprovalRule",
+        "ProjectApprovalRuleManager",
+        "ProjectMergeRequestApproval",
+        "ProjectMergeRequestApprovalManager",
+        "ProjectMergeRequestApprovalRule",
+        "ProjectMergeRequestApprovalRuleManager",
+        "ProjectMergeRequestApprovalState",
+        "ProjectMergeRequestApprovalStateManager",
+    ),
+    "merge_requests": (
+        "MergeRequest",
+        "MergeRequestManager",
+        "GroupMergeRequest",
+        "GroupMergeRequestManager",
+        "ProjectMergeRequest",
+        "ProjectMergeRequestManager",
+        "ProjectDeploymentMergeRequest",
+        "ProjectDeploymentMergeRequestManager",
+        "ProjectMergeRequestDiff",
+        "ProjectMergeRequestDiffManager",
+    ),
+    "merge_trains": ("ProjectMergeTrain", "ProjectMergeTrainManager"),
+    "milestones": (
+        "GroupMilestone",
+        "GroupMilestoneManager",
+        "ProjectMilestone",
+        "ProjectMilestoneManager",
+    ),
+    "namespaces": ("Namespace", "NamespaceManager"),
+    "notes": (
+        "GroupEpicNote",
+        "GroupEpicNoteManager",
+        "GroupEpicDiscussionNote",
+        "GroupEpicDiscussionNoteManager",
+        "ProjectNote",
+        "ProjectNoteManager",
+        "ProjectCommitDiscussionNote",
+        "ProjectCommitDiscussionNoteManager",
+        "ProjectIssueNote",
+        "ProjectIssueNoteManager",
+        "ProjectIssueDiscussionNote",
+        "ProjectIssueDiscussionNoteManager",
+        "ProjectMergeRequestNote",
+        "ProjectMergeRequestNoteManager",
+        "ProjectMergeRequestDiscussionNote",
+        "ProjectMergeRequestDiscussionNoteManager",
+        "ProjectSnippetNote",
+        "ProjectSnippetNoteManager",
+        "ProjectSnippetDiscussionNote",
+        "ProjectSnippetDiscussionNoteManager",
+    ),
+    "notification_settings": (
+        "NotificationSettings",
+        "NotificationSettingsManager",
+        "GroupNotificationSettings",
+        "GroupNotificationSettingsManager",
+        "ProjectNotificationSettings",
+        "ProjectNotificationSettingsManager",
+    ),
+    "package_protection_rules": (
+        "ProjectPackageProtectionRule",
+        "ProjectPackageProtectionRuleManager",
+    ),
+    "packages": (
+        "GenericPackage",
+        "GenericPackageManager",
+        "GroupPackage",
+        "GroupPackageManager",
+        "ProjectPackage",
+        "ProjectPackageManager",
+        "ProjectPackageFile",
+        "ProjectPackageFileManager",
+        "ProjectPackagePipeline",
+        "ProjectPackagePipelineManager",
+    ),
+    "pages": (
+        "PagesDomain",
+        "PagesDomainManager",
+        "ProjectPagesDomain",
+        "ProjectPagesDomainManager",
+        "ProjectPages",
+        "ProjectPagesManager",
+    ),
+    "personal_access_tokens": (
+        "PersonalAccessToken",
+        "PersonalAccessTokenManager",
+        "UserPersonalAccessToken",
+        "UserPersonalAccessTokenManager",
+    ),
+    "pipelines": (
+        "ProjectMergeRequestPipeline",
+        "ProjectMergeRequestPipelineManager",
+        "ProjectPipeline",
+        "ProjectPipelineManager",
+        "ProjectPipelineJob",
+        "ProjectPipelineJobManager",
+        "ProjectPipelineBridge",
+        "ProjectPipelineBridgeManager",
+        "ProjectPipelineVariable",
+        "ProjectPipelineVariableManager",
+        "ProjectPipelineScheduleVariable",
+        "ProjectPipelineScheduleVariableManager",
+        "ProjectPipelineSchedulePipeline",
+        "ProjectPipelineSchedulePipelineManager",
+        "ProjectPipelineSchedule",
+        "ProjectPipelineScheduleManager",
+        "ProjectPipelineTestReport",
+        "ProjectPipelineTestReportManager",
+        "ProjectPipelineTestReportSummary",
+        "ProjectPipelineTestReportSummaryManager",
+    ),
+    "project_access_tokens": ("ProjectAccessToken", "ProjectAccessTokenManager"),
+    "projects": (
+        "GroupProject",
+        "GroupProjectManager",
+        "Project",
+        "ProjectManager",
+        "ProjectFork",
+        "ProjectForkManager",
+        "ProjectRemoteMirror",
+        "ProjectRemoteMirrorManager",
+        "ProjectPullMirror",
+        "ProjectPullMirrorManager",
+        "ProjectStorage",
+        "ProjectStorageManager",
+        "SharedProject",
+        "SharedProjectManager",
+    ),
+    "push_rules": (
+        "GroupPushRules",
+        "GroupPushRulesManager",
+        "ProjectPushRules",
+        "ProjectPushRulesManager",
+    ),
+    "registry_protection_repository_rules": (
+        "ProjectRegistryRepositoryProtectionRule",
+        "ProjectRegistryRepositoryProtectionRuleManager",
+    ),
+    "registry_protection_rules": (
+        "ProjectRegistryProtectionRule",
+        "ProjectRegistryProtectionRuleManager",
+    ),
+    "releases": (
+        "ProjectRelease",
+        "ProjectReleaseManager",
+        "ProjectReleaseLink",
+        "ProjectReleaseLinkManager",
+    ),
+    "repositories": ("RepositoryMixin",),
+    "resource_groups": (
+        "ProjectResourceGroup",
+        "ProjectResourceGroupManager",
+        "ProjectResourceGroupUpcomingJob",
+        "ProjectResourceGroupUpcomingJobManager",
+    ),
+    "reviewers": (
+        "ProjectMergeRequestReviewerDetail",
+        "ProjectMergeRequestReviewerDetailManager",
+    ),
+    "runners": (
+        "RunnerJob",
+        "RunnerJobManager",
+        "Runner",
+        "RunnerManager",
+        "RunnerAll",
+        "RunnerAllManager",
+        "GroupRunner",
+        "GroupRunnerManager",
+        "ProjectRunner",
+        "ProjectRunnerManager",
+    ),
+    "secure_files": ("ProjectSecureFile", "ProjectSecureFileManager"),
+    "service_accounts": ("GroupServiceAccount", "GroupServiceAccountManager"),
+    "settings": ("ApplicationSettings", "ApplicationSettingsManager"),
+    "sidekiq": ("SidekiqManager",),
+    "snippets": (
+        "Snippet",
+        "SnippetManager",
+        "ProjectSnippet",
+        "ProjectSnippetManager",
+    ),
+    "statistics": (
+        "GroupIssuesStatistics",
+        "GroupIssuesStatisticsManager",
+        "ProjectAdditionalStatistics",
+        "ProjectAdditionalStatisticsManager",
+        "IssuesStatistics",
+        "IssuesStatisticsManager",
+        "ProjectIssuesStatistics",
+        "ProjectIssuesStatisticsManager",
+        "ApplicationStatistics",
+        "ApplicationStatisticsManager",
+    ),
+    "status_checks": (
+        "ProjectExternalStatusCheck",
+        "ProjectExternalStatusCheckManager",
+        "ProjectMergeRequestStatusCheck",
+        "ProjectMergeRequestStatusCheckManager",
+    ),
+    "tags": (
+        "ProjectTag",
+        "ProjectTagManager",
+        "ProjectProtectedTag",
+        "ProjectProtectedTagManager",
+    ),
+    "templates": (
+        "Dockerfile",
+        "DockerfileManager",
+        "Gitignore",
+        "GitignoreManager",
+        "Gitlabciyml",
+        "GitlabciymlManager",
+        "License",
+        "LicenseManager",
+        "ProjectDockerfileTemplate",
+        "ProjectDockerfileTemplateManager",
+        "ProjectGitignoreTemplate",
+        "ProjectGitignoreTemplateManager",
+        "ProjectGitlabciymlTemplate",
+        "ProjectGitlabciymlTemplateManager",
+        "ProjectIssueTemplate",
+        "ProjectIssueTemplateManager",
+        "ProjectLicenseTemplate",
+        "ProjectLicenseTemplateManager",
+        "ProjectMergeRequestTemplate",
+        "ProjectMergeRequestTemplateManager",
+    ),
+    "todos": ("Todo", "TodoManager"),
+    "topics": ("Topic", "TopicManager"),
+    "triggers": ("ProjectTrigger", "ProjectTriggerManager"),
+    "users": (
+        "CurrentUserEmail",
+        "CurrentUserEmailManager",
+        "CurrentUserGPGKey",
+        "CurrentUserGPGKeyManager",
+        "CurrentUserKey",
+        "CurrentUserKeyManager",
+        "CurrentUserRunner",
+        "CurrentUserRunnerManager",
+        "CurrentUserStatus",
+        "CurrentUserStatusManager",
+        "CurrentUser",
+        "CurrentUserManager",
+        "User",
+        "UserManager",
+        "ProjectUser",
+        "ProjectUserManager",
+        "StarredProject",
+        "StarredProjectManager",
+        "UserEmail",
+        "UserEmailManager",
+        "UserActivities",
+        "UserStatus",
+        "UserStatusManager",
+        "UserActivitiesManager",
+        "UserGPGKey",
+        "UserGPGKeyManager",
+        "UserKey",
+        "UserKeyManager",
+        "UserIdentityProviderManager",
+        "UserImpersonationToken",
+        "UserImpersonationTokenManager",
+        "UserMembership",
+        "UserMembershipManager",
+        "UserProject",
+        "UserProjectManager",
+        "UserContributedProject",
+        "UserContributedProjectManager",
+    ),
+    "variables": (
+        "Variable",
+        "VariableManager",
+        "GroupVariable",
+        "GroupVariableManager",
+        "ProjectVariable",
+        "ProjectVariableManager",
+    ),
+    "wikis": ("ProjectWiki", "ProjectWikiManager", "GroupWiki", "GroupWikiManager"),
+}
+
+_NAME_MODULES = {
+    name: module for module, names in _MODULE_NAMES.items() for name in names
+}
+
+__all__ = sorted(_NAME_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MODULE_NAMES:
+        return importlib.import_module(f".{name}", __name__)
+    try:
+        module_name = _NAME_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Later accesses find the name without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULE_NAMES, *_NAME_MODULES})
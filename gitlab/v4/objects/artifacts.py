@@ -43,7 +43,22 @@ class ProjectArtifactManager(RESTManager[ProjectArtifact]):
 
         if TYPE_CHECKING:
             assert path is not None
-        self.gitlab.http_delete(path, **kwargs)
+        return utils.discard_result(self.gitlab.http_delete(path, **kwargs))
+
+    @overload
+    def download(
+        self,
+        ref_name: str,
+        job: str,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        segments: int = 1,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
 
     @overload
     def download(
@@ -99,8 +114,10 @@ class ProjectArtifactManager(RESTManager[ProjectArtifact]):
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
+        segments: int = 1,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Get the job artifacts archive from a specific tag or branch.
 
         Args:
@@ -113,6 +130,14 @@ class ProjectArtifactManager(RESTManager[ProjectArtifact]):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
+            segments: With `download_to` a path, the maximum number of
+                byte ranges of the data to fetch concurrently when the
+                server accepts ranges.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -126,6 +151,10 @@ class ProjectArtifactManager(RESTManager[ProjectArtifact]):
             The artifacts if `streamed` is False, None otherwise.
         """
         path = f"{self.path}/{ref_name}/download"
+        if download_to is not None:
+            return self.gitlab.http_download(
+                path, download_to, job=job, segments=segments, **kwargs
+            )
         result = self.gitlab.http_get(
             path, job=job, streamed=streamed, raw=True, **kwargs
         )
@@ -135,6 +164,21 @@ class ProjectArtifactManager(RESTManager[ProjectArtifact]):
             result, streamed, action, chunk_size, iterator=iterator
         )
 
+    @overload
+    def raw(
+        self,
+        ref_name: str,
+        artifact_path: str,
+        job: str,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
+
     @overload
     def raw(
         self,
@@ -192,8 +236,9 @@ class ProjectArtifactManager(RESTManager[ProjectArtifact]):
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Download a single artifact file from a specific tag or branch from
         within the job's artifacts archive.
 
@@ -207,6 +252,11 @@ class ProjectArtifactManager(RESTManager[ProjectArtifact]):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -220,6 +270,8 @@ class ProjectArtifactManager(RESTManager[ProjectArtifact]):
             The artifact if `streamed` is False, None otherwise.
         """
         path = f"{self.path}/{ref_name}/raw/{artifact_path}"
+        if download_to is not None:
+            return self.gitlab.http_download(path, download_to, job=job, **kwargs)
         result = self.gitlab.http_get(
             path, streamed=streamed, raw=True, job=job, **kwargs
         )
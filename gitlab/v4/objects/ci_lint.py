@@ -5,6 +5,7 @@ https://docs.gitlab.com/ee/api/lint.html
 
 from typing import Any
 
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.cli import register_custom_action
 from gitlab.exceptions import GitlabCiLintError
@@ -34,11 +35,13 @@ class CiLintManager(CreateMixin[CiLint]):
         """Raise an error if the CI Lint results are not valid.
 
         This is a custom python-gitlab method to wrap lint endpoints."""
-        result = self.create(*args, **kwargs)
 
-        if result.status != "valid":
-            message = ",\n".join(result.errors)
-            raise GitlabCiLintError(message)
+        def check(result: CiLint) -> None:
+            if result.status != "valid":
+                message = ",\n".join(result.errors)
+                raise GitlabCiLintError(message)
+
+        return utils.map_result(self.create(*args, **kwargs), check)
 
 
 class ProjectCiLint(RESTObject):
@@ -65,8 +68,10 @@ class ProjectCiLintManager(
         """Raise an error if the Project CI Lint results are not valid.
 
         This is a custom python-gitlab method to wrap lint endpoints."""
-        result = self.create(*args, **kwargs)
 
-        if not result.valid:
-            message = ",\n".join(result.errors)
-            raise GitlabCiLintError(message)
+        def check(result: ProjectCiLint) -> None:
+            if not result.valid:
+                message = ",\n".join(result.errors)
+                raise GitlabCiLintError(message)
+
+        return utils.map_result(self.create(*args, **kwargs), check)
@@ -4,6 +4,7 @@ from typing import Any
 
 from gitlab import cli
 from gitlab import exceptions as exc
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.mixins import (
     DeleteMixin,
@@ -72,7 +73,9 @@ class ProjectRegistryTagManager(
         valid_attrs = ["keep_n", "name_regex_keep", "older_than"]
         data = {"name_regex_delete": name_regex_delete}
         data.update({k: v for k, v in kwargs.items() if k in valid_attrs})
-        self.gitlab.http_delete(self.path, query_data=data, **kwargs)
+        return utils.discard_result(
+            self.gitlab.http_delete(self.path, query_data=data, **kwargs)
+        )
 
 
 class GroupRegistryRepositoryManager(ListMixin[ProjectRegistryRepository]):
@@ -1,5 +1,6 @@
 from typing import Any
 
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.mixins import CRUDMixin, ObjectDeleteMixin, SaveMixin
 from gitlab.types import RequiredOptional
@@ -10,7 +11,7 @@ __all__ = ["ProjectMergeRequestDraftNote", "ProjectMergeRequestDraftNoteManager"
 class ProjectMergeRequestDraftNote(ObjectDeleteMixin, SaveMixin, RESTObject):
     def publish(self, **kwargs: Any) -> None:
         path = f"{self.manager.path}/{self.encoded_id}/publish"
-        self.manager.gitlab.http_put(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_put(path, **kwargs))
 
 
 class ProjectMergeRequestDraftNoteManager(CRUDMixin[ProjectMergeRequestDraftNote]):
@@ -30,4 +31,4 @@ class ProjectMergeRequestDraftNoteManager(CRUDMixin[ProjectMergeRequestDraftNote
 
     def bulk_publish(self, **kwargs: Any) -> None:
         path = f"{self.path}/bulk_publish"
-        self.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.gitlab.http_post(path, **kwargs))
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 
 from gitlab import exceptions as exc
-from gitlab import types
+from gitlab import types, utils
 from gitlab.base import RESTObject
 from gitlab.mixins import (
     CreateMixin,
@@ -66,11 +66,11 @@ class GroupEpicIssue(ObjectDeleteMixin, SaveMixin, RESTObject):
         updated_data = self._get_updated_data()
         # Nothing to update. Server fails if sent an empty dict.
         if not updated_data:
-            return
+            return self.manager.gitlab._as_result(None)
 
         # call the manager
         obj_id = self.encoded_id
-        self.manager.update(obj_id, updated_data, **kwargs)
+        return utils.discard_result(self.manager.update(obj_id, updated_data, **kwargs))
 
 
 class GroupEpicIssueManager(
@@ -109,10 +109,12 @@ class GroupEpicIssueManager(
         self._create_attrs.validate_attrs(data=data)
         path = f"{self.path}/{data.pop('issue_id')}"
         server_data = self.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        # The epic_issue_id attribute doesn't exist when creating the resource,
-        # but is used everywhere elese. Let's create it to be consistent client
-        # side
-        server_data["epic_issue_id"] = server_data["id"]
-        return self._obj_cls(self, server_data)
+
+        def build(server_data: dict[str, Any]) -> GroupEpicIssue:
+            # The epic_issue_id attribute doesn't exist when creating the
+            # resource, but is used everywhere elese. Let's create it to be
+            # consistent client side
+            server_data["epic_issue_id"] = server_data["id"]
+            return self._obj_cls(self, server_data)
+
+        return utils.map_result(server_data, build)
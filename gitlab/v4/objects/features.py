@@ -5,7 +5,7 @@ https://docs.gitlab.com/ee/api/features.html
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from typing import Any
 
 from gitlab import exceptions as exc
 from gitlab import utils
@@ -63,6 +63,4 @@ class FeatureManager(ListMixin[Feature], DeleteMixin[Feature]):
         }
         data = utils.remove_none_from_dict(data)
         server_data = self.gitlab.http_post(path, post_data=data, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        return self._obj_cls(self, server_data)
+        return utils.map_result(server_data, lambda data: self._obj_cls(self, data))
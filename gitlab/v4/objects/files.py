@@ -59,7 +59,7 @@ class ProjectFile(SaveMixin, ObjectDeleteMixin, RESTObject):
         self.branch = branch
         self.commit_message = commit_message
         self.file_path = utils.EncodedId(self.file_path)
-        super().save(**kwargs)
+        return utils.discard_result(super().save(**kwargs))
 
     @exc.on_http_error(exc.GitlabDeleteError)
     # NOTE(jlvillal): Signature doesn't match DeleteMixin.delete() so ignore
@@ -81,7 +81,7 @@ class ProjectFile(SaveMixin, ObjectDeleteMixin, RESTObject):
         file_path = self.encoded_id
         if TYPE_CHECKING:
             assert isinstance(file_path, str)
-        self.manager.delete(file_path, branch, commit_message, **kwargs)
+        return self.manager.delete(file_path, branch, commit_message, **kwargs)
 
 
 class ProjectFileManager(
@@ -137,9 +137,7 @@ class ProjectFileManager(
         file_path = utils.EncodedId(file_path)
         path = f"{self.path}/{file_path}"
         server_data = self.gitlab.http_get(path, ref=ref, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        return self._obj_cls(self, server_data)
+        return utils.map_result(server_data, lambda data: self._obj_cls(self, data))
 
     @exc.on_http_error(exc.GitlabHeadError)
     def head(
@@ -201,9 +199,7 @@ class ProjectFileManager(
         file_path = utils.EncodedId(new_data.pop("file_path"))
         path = f"{self.path}/{file_path}"
         server_data = self.gitlab.http_post(path, post_data=new_data, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        return self._obj_cls(self, server_data)
+        return utils.map_result(server_data, lambda data: self._obj_cls(self, data))
 
     @exc.on_http_error(exc.GitlabUpdateError)
     # NOTE(jlvillal): Signature doesn't match UpdateMixin.update() so ignore
@@ -261,7 +257,23 @@ class ProjectFileManager(
         file_path = utils.EncodedId(file_path)
         path = f"{self.path}/{file_path}"
         data = {"branch": branch, "commit_message": commit_message}
-        self.gitlab.http_delete(path, query_data=data, **kwargs)
+        return utils.discard_result(
+            self.gitlab.http_delete(path, query_data=data, **kwargs)
+        )
+
+    @overload
+    def raw(
+        self,
+        file_path: str,
+        ref: str | None = None,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
 
     @overload
     def raw(
@@ -315,8 +327,9 @@ class ProjectFileManager(
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Return the content of a file for a commit.
 
         Args:
@@ -330,6 +343,11 @@ class ProjectFileManager(
             chunk_size: Size of each chunk
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Raises:
@@ -345,6 +363,10 @@ class ProjectFileManager(
             query_data = {"ref": ref}
         else:
             query_data = None
+        if download_to is not None:
+            return self.gitlab.http_download(
+                path, download_to, query_data=query_data, **kwargs
+            )
         result = self.gitlab.http_get(
             path, query_data=query_data, streamed=streamed, raw=True, **kwargs
         )
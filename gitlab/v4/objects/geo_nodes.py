@@ -2,6 +2,7 @@ from typing import Any, Dict, List, TYPE_CHECKING
 
 from gitlab import cli
 from gitlab import exceptions as exc
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.mixins import (
     DeleteMixin,
@@ -30,9 +31,7 @@ class GeoNode(SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         path = f"/geo_nodes/{self.encoded_id}/repair"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(cls_names="GeoNode")
     @exc.on_http_error(exc.GitlabGetError)
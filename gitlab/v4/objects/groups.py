@@ -7,7 +7,7 @@ import requests
 import gitlab
 from gitlab import cli
 from gitlab import exceptions as exc
-from gitlab import types
+from gitlab import types, utils
 from gitlab.base import RESTObject, TObjCls
 from gitlab.mixins import (
     CreateMixin,
@@ -127,7 +127,7 @@ class Group(SaveMixin, ObjectDeleteMixin, RESTObject):
             GitlabTransferProjectError: If the project could not be transferred
         """
         path = f"/groups/{self.encoded_id}/projects/{project_id}"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
 
     @cli.register_custom_action(cls_names="Group", required=(), optional=("group_id",))
     @exc.on_http_error(exc.GitlabGroupTransferError)
@@ -149,7 +149,9 @@ class Group(SaveMixin, ObjectDeleteMixin, RESTObject):
         post_data = {}
         if group_id is not None:
             post_data["group_id"] = group_id
-        self.manager.gitlab.http_post(path, post_data=post_data, **kwargs)
+        return utils.discard_result(
+            self.manager.gitlab.http_post(path, post_data=post_data, **kwargs)
+        )
 
     @cli.register_custom_action(cls_names="Group", required=("scope", "search"))
     @exc.on_http_error(exc.GitlabSearchError)
@@ -187,7 +189,7 @@ class Group(SaveMixin, ObjectDeleteMixin, RESTObject):
             GitlabCreateError: If the server cannot perform the request
         """
         path = f"/groups/{self.encoded_id}/ldap_sync"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
 
     @cli.register_custom_action(
         cls_names="Group",
@@ -223,9 +225,7 @@ class Group(SaveMixin, ObjectDeleteMixin, RESTObject):
             "expires_at": expires_at,
         }
         server_data = self.manager.gitlab.http_post(path, post_data=data, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(cls_names="Group", required=("group_id",))
     @exc.on_http_error(exc.GitlabDeleteError)
@@ -241,7 +241,7 @@ class Group(SaveMixin, ObjectDeleteMixin, RESTObject):
             GitlabDeleteError: If the server failed to perform the request
         """
         path = f"/groups/{self.encoded_id}/share/{group_id}"
-        self.manager.gitlab.http_delete(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_delete(path, **kwargs))
 
     @cli.register_custom_action(cls_names="Group")
     @exc.on_http_error(exc.GitlabRestoreError)
@@ -256,7 +256,7 @@ class Group(SaveMixin, ObjectDeleteMixin, RESTObject):
             GitlabRestoreError: If the server failed to perform the request
         """
         path = f"/groups/{self.encoded_id}/restore"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
 
 
 class GroupManager(CRUDMixin[Group]):
@@ -427,7 +427,7 @@ class GroupLDAPGroupLink(RESTObject):
         """
         if TYPE_CHECKING:
             assert isinstance(self.manager, DeleteMixin)
-        self.manager.delete(
+        return self.manager.delete(
             self.encoded_id, query_data=self._get_link_attrs(), **kwargs
         )
 
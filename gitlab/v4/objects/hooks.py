@@ -1,4 +1,5 @@
 from gitlab import exceptions as exc
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.mixins import CRUDMixin, NoUpdateMixin, ObjectDeleteMixin, SaveMixin
 from gitlab.types import RequiredOptional
@@ -39,7 +40,7 @@ class ProjectHook(SaveMixin, ObjectDeleteMixin, RESTObject):
             GitlabHookTestError: If the hook test attempt failed
         """
         path = f"{self.manager.path}/{self.encoded_id}/test/{trigger}"
-        self.manager.gitlab.http_post(path)
+        return utils.discard_result(self.manager.gitlab.http_post(path))
 
 
 class ProjectHookManager(CRUDMixin[ProjectHook]):
@@ -95,7 +96,7 @@ class GroupHook(SaveMixin, ObjectDeleteMixin, RESTObject):
             GitlabHookTestError: If the hook test attempt failed
         """
         path = f"{self.manager.path}/{self.encoded_id}/test/{trigger}"
-        self.manager.gitlab.http_post(path)
+        return utils.discard_result(self.manager.gitlab.http_post(path))
 
 
 class GroupHookManager(CRUDMixin[GroupHook]):
@@ -6,7 +6,7 @@ import requests
 
 from gitlab import cli, client
 from gitlab import exceptions as exc
-from gitlab import types
+from gitlab import types, utils
 from gitlab.base import RESTObject
 from gitlab.mixins import (
     CreateMixin,
@@ -143,9 +143,7 @@ class ProjectIssue(
         path = f"{self.manager.path}/{self.encoded_id}/move"
         data = {"to_project_id": to_project_id}
         server_data = self.manager.gitlab.http_post(path, post_data=data, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(
         cls_names="ProjectIssue", required=("move_after_id", "move_before_id")
@@ -177,9 +175,7 @@ class ProjectIssue(
             data["move_before_id"] = move_before_id
 
         server_data = self.manager.gitlab.http_put(path, post_data=data, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(cls_names="ProjectIssue")
     @exc.on_http_error(exc.GitlabGetError)
@@ -318,8 +314,12 @@ class ProjectIssueLinkManager(
         self._create_attrs.validate_attrs(data=data)
         server_data = self.gitlab.http_post(self.path, post_data=data, **kwargs)
         if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
             assert self._parent is not None
-        source_issue = ProjectIssue(self._parent.manager, server_data["source_issue"])
-        target_issue = ProjectIssue(self._parent.manager, server_data["target_issue"])
-        return source_issue, target_issue
+        parent_manager = self._parent.manager
+
+        def build(server_data: dict[str, Any]) -> tuple[ProjectIssue, ProjectIssue]:
+            source_issue = ProjectIssue(parent_manager, server_data["source_issue"])
+            target_issue = ProjectIssue(parent_manager, server_data["target_issue"])
+            return source_issue, target_issue
+
+        return utils.map_result(server_data, build)
@@ -65,9 +65,7 @@ class ProjectJob(RefreshMixin, RESTObject):
         """
         path = f"{self.manager.path}/{self.encoded_id}/play"
         result = self.manager.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(result, dict)
-        self._update_attrs(result)
+        return utils.map_result(result, self._update_attrs)
 
     @cli.register_custom_action(cls_names="ProjectJob")
     @exc.on_http_error(exc.GitlabJobEraseError)
@@ -82,7 +80,7 @@ class ProjectJob(RefreshMixin, RESTObject):
             GitlabJobEraseError: If the job could not be erased
         """
         path = f"{self.manager.path}/{self.encoded_id}/erase"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
 
     @cli.register_custom_action(cls_names="ProjectJob")
     @exc.on_http_error(exc.GitlabCreateError)
@@ -97,7 +95,7 @@ class ProjectJob(RefreshMixin, RESTObject):
             GitlabCreateError: If the request could not be performed
         """
         path = f"{self.manager.path}/{self.encoded_id}/artifacts/keep"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
 
     @cli.register_custom_action(cls_names="ProjectJob")
     @exc.on_http_error(exc.GitlabCreateError)
@@ -112,7 +110,19 @@ class ProjectJob(RefreshMixin, RESTObject):
             GitlabDeleteError: If the request could not be performed
         """
         path = f"{self.manager.path}/{self.encoded_id}/artifacts"
-        self.manager.gitlab.http_delete(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_delete(path, **kwargs))
+
+    @overload
+    def artifacts(
+        self,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
 
     @overload
     def artifacts(
@@ -156,8 +166,9 @@ class ProjectJob(RefreshMixin, RESTObject):
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Get the job artifacts.
 
         Args:
@@ -166,6 +177,11 @@ class ProjectJob(RefreshMixin, RESTObject):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -179,6 +195,8 @@ class ProjectJob(RefreshMixin, RESTObject):
             The artifacts if `streamed` is False, None otherwise.
         """
         path = f"{self.manager.path}/{self.encoded_id}/artifacts"
+        if download_to is not None:
+            return self.manager.gitlab.http_download(path, download_to, **kwargs)
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
@@ -188,6 +206,19 @@ class ProjectJob(RefreshMixin, RESTObject):
             result, streamed, action, chunk_size, iterator=iterator
         )
 
+    @overload
+    def artifact(
+        self,
+        path: str,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
+
     @overload
     def artifact(
         self,
@@ -234,8 +265,9 @@ class ProjectJob(RefreshMixin, RESTObject):
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Get a single artifact file from within the job's artifacts archive.
 
         Args:
@@ -245,6 +277,11 @@ class ProjectJob(RefreshMixin, RESTObject):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -258,6 +295,8 @@ class ProjectJob(RefreshMixin, RESTObject):
             The artifacts if `streamed` is False, None otherwise.
         """
         path = f"{self.manager.path}/{self.encoded_id}/artifacts/{path}"
+        if download_to is not None:
+            return self.manager.gitlab.http_download(path, download_to, **kwargs)
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
@@ -267,6 +306,18 @@ class ProjectJob(RefreshMixin, RESTObject):
             result, streamed, action, chunk_size, iterator=iterator
         )
 
+    @overload
+    def trace(
+        self,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
+
     @overload
     def trace(
         self,
@@ -309,8 +360,9 @@ class ProjectJob(RefreshMixin, RESTObject):
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Get the job trace.
 
         Args:
@@ -319,6 +371,11 @@ class ProjectJob(RefreshMixin, RESTObject):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -332,6 +389,8 @@ class ProjectJob(RefreshMixin, RESTObject):
             The trace
         """
         path = f"{self.manager.path}/{self.encoded_id}/trace"
+        if download_to is not None:
+            return self.manager.gitlab.http_download(path, download_to, **kwargs)
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
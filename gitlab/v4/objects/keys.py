@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from typing import Any
 
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.mixins import GetMixin
 
@@ -26,6 +27,4 @@ class KeyManager(GetMixin[Key]):
             raise AttributeError("Missing attribute: id or fingerprint")
 
         server_data = self.gitlab.http_get(self.path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        return self._obj_cls(self, server_data)
+        return utils.map_result(server_data, lambda data: self._obj_cls(self, data))
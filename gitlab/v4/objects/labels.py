@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from gitlab import exceptions as exc
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.mixins import (
     CreateMixin,
@@ -41,7 +42,7 @@ class GroupLabel(SubscribableMixin, SaveMixin, ObjectDeleteMixin, RESTObject):
 
         # call the manager
         server_data = self.manager.update(None, updated_data, **kwargs)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
 
 class GroupLabelManager(
@@ -102,7 +103,7 @@ class ProjectLabel(
 
         # call the manager
         server_data = self.manager.update(None, updated_data, **kwargs)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
 
 class ProjectLabelManager(
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Literal, overload
 
 from gitlab import exceptions as exc
-from gitlab.base import RESTManager, RESTObject, RESTObjectList
+from gitlab.base import build_object_list, RESTManager, RESTObject, RESTObjectList
 
 __all__ = ["LDAPGroup", "LDAPGroupManager"]
 
@@ -63,6 +63,4 @@ class LDAPGroupManager(RESTManager[LDAPGroup]):
             path = self._path
 
         obj = self.gitlab.http_list(path, iterator=iterator, **data)
-        if isinstance(obj, list):
-            return [self._obj_cls(self, item) for item in obj]
-        return RESTObjectList(self, self._obj_cls, obj)
+        return build_object_list(self, self._obj_cls, obj, created_from_list=False)
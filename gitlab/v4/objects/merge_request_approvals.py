@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 
 from gitlab import exceptions as exc
-from gitlab.base import RESTObject
+from gitlab.base import AsyncRESTObjectList, RESTObject
 from gitlab.mixins import (
     CreateMixin,
     CRUDMixin,
@@ -149,17 +149,41 @@ class ProjectMergeRequestApprovalManager(
         )
         # update any existing approval rule matching the name
         existing_approval_rules = approval_rules.list(iterator=True)
+        if isinstance(existing_approval_rules, AsyncRESTObjectList):
+            return self._async_set_approvers(
+                approval_rules, existing_approval_rules, data, **kwargs
+            )
         for ar in existing_approval_rules:
             if ar.name == approval_rule_name:
-                ar.user_ids = data["user_ids"]
-                ar.approvals_required = data["approvals_required"]
-                ar.group_ids = data["group_ids"]
-                ar.usernames = data["usernames"]
+                self._update_approval_rule(ar, data)
                 ar.save()
                 return ar
         # if there was no rule matching the rule name, create a new one
         return approval_rules.create(data=data, **kwargs)
 
+    async def _async_set_approvers(
+        self,
+        approval_rules: ProjectMergeRequestApprovalRuleManager,
+        existing_approval_rules: AsyncRESTObjectList[ProjectMergeRequestApprovalRule],
+        data: dict[str, Any],
+        **kwargs: Any,
+    ) -> RESTObject:
+        async for ar in existing_approval_rules:
+            if ar.name == data["name"]:
+                self._update_approval_rule(ar, data)
+                await ar.save()
+                return ar
+        return await approval_rules.create(data=data, **kwargs)
+
+    @staticmethod
+    def _update_approval_rule(
+        ar: ProjectMergeRequestApprovalRule, data: dict[str, Any]
+    ) -> None:
+        ar.user_ids = data["user_ids"]
+        ar.approvals_required = data["approvals_required"]
+        ar.group_ids = data["group_ids"]
+        ar.usernames = data["usernames"]
+
 
 class ProjectMergeRequestApprovalRule(SaveMixin, ObjectDeleteMixin, RESTObject):
     _repr_attr = "name"
@@ -10,11 +10,10 @@ from typing import Any, TYPE_CHECKING
 
 import requests
 
-import gitlab
 from gitlab import cli
 from gitlab import exceptions as exc
-from gitlab import types
-from gitlab.base import RESTObject, RESTObjectList
+from gitlab import types, utils
+from gitlab.base import build_object_list, RESTObject, RESTObjectList
 from gitlab.mixins import (
     CRUDMixin,
     ListMixin,
@@ -223,12 +222,9 @@ class ProjectMergeRequest(
         path = f"{self.manager.path}/{self.encoded_id}/related_issues"
         data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
 
-        if TYPE_CHECKING:
-            assert isinstance(data_list, gitlab.GitlabList)
-
         manager = ProjectIssueManager(self.manager.gitlab, parent=self.manager._parent)
 
-        return RESTObjectList(manager, ProjectIssue, data_list)
+        return build_object_list(manager, ProjectIssue, data_list)
 
     @cli.register_custom_action(cls_names="ProjectMergeRequest")
     @exc.on_http_error(exc.GitlabListError)
@@ -250,10 +246,8 @@ class ProjectMergeRequest(
         """
         path = f"{self.manager.path}/{self.encoded_id}/closes_issues"
         data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, gitlab.GitlabList)
         manager = ProjectIssueManager(self.manager.gitlab, parent=self.manager._parent)
-        return RESTObjectList(manager, ProjectIssue, data_list)
+        return build_object_list(manager, ProjectIssue, data_list)
 
     @cli.register_custom_action(cls_names="ProjectMergeRequest")
     @exc.on_http_error(exc.GitlabListError)
@@ -276,10 +270,8 @@ class ProjectMergeRequest(
 
         path = f"{self.manager.path}/{self.encoded_id}/commits"
         data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, gitlab.GitlabList)
         manager = ProjectCommitManager(self.manager.gitlab, parent=self.manager._parent)
-        return RESTObjectList(manager, ProjectCommit, data_list)
+        return build_object_list(manager, ProjectCommit, data_list)
 
     @cli.register_custom_action(
         cls_names="ProjectMergeRequest", optional=("access_raw_diffs",)
@@ -325,10 +317,7 @@ class ProjectMergeRequest(
             data["sha"] = sha
 
         server_data = self.manager.gitlab.http_post(path, post_data=data, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
-        return server_data
+        return utils.map_result(server_data, self._update_and_return)
 
     @cli.register_custom_action(cls_names="ProjectMergeRequest")
     @exc.on_http_error(exc.GitlabMRApprovalError)
@@ -348,9 +337,7 @@ class ProjectMergeRequest(
         data: dict[str, Any] = {}
 
         server_data = self.manager.gitlab.http_post(path, post_data=data, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(cls_names="ProjectMergeRequest")
     @exc.on_http_error(exc.GitlabMRRebaseError)
@@ -439,10 +426,7 @@ class ProjectMergeRequest(
             data["merge_when_pipeline_succeeds"] = merge_when_pipeline_succeeds
 
         server_data = self.manager.gitlab.http_put(path, post_data=data, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
-        return server_data
+        return utils.map_result(server_data, self._update_and_return)
 
 
 class ProjectMergeRequestManager(CRUDMixin[ProjectMergeRequest]):
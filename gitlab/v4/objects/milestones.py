@@ -1,10 +1,9 @@
-from typing import Any, TYPE_CHECKING
+from typing import Any
 
 from gitlab import cli
 from gitlab import exceptions as exc
 from gitlab import types
-from gitlab.base import RESTObject, RESTObjectList
-from gitlab.client import GitlabList
+from gitlab.base import build_object_list, RESTObject, RESTObjectList
 from gitlab.mixins import (
     CRUDMixin,
     ObjectDeleteMixin,
@@ -54,11 +53,9 @@ class GroupMilestone(SaveMixin, ObjectDeleteMixin, RESTObject):
 
         path = f"{self.manager.path}/{self.encoded_id}/issues"
         data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, GitlabList)
         manager = GroupIssueManager(self.manager.gitlab, parent=self.manager._parent)
         # FIXME(gpocentek): the computed manager path is not correct
-        return RESTObjectList(manager, GroupIssue, data_list)
+        return build_object_list(manager, GroupIssue, data_list)
 
     @cli.register_custom_action(cls_names="GroupMilestone")
     @exc.on_http_error(exc.GitlabListError)
@@ -80,13 +77,11 @@ class GroupMilestone(SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         path = f"{self.manager.path}/{self.encoded_id}/merge_requests"
         data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, GitlabList)
         manager = GroupMergeRequestManager(
             self.manager.gitlab, parent=self.manager._parent
         )
         # FIXME(gpocentek): the computed manager path is not correct
-        return RESTObjectList(manager, GroupMergeRequest, data_list)
+        return build_object_list(manager, GroupMergeRequest, data_list)
 
 
 class GroupMilestoneManager(CRUDMixin[GroupMilestone]):
@@ -128,11 +123,9 @@ class ProjectMilestone(PromoteMixin, SaveMixin, ObjectDeleteMixin, RESTObject):
 
         path = f"{self.manager.path}/{self.encoded_id}/issues"
         data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, GitlabList)
         manager = ProjectIssueManager(self.manager.gitlab, parent=self.manager._parent)
         # FIXME(gpocentek): the computed manager path is not correct
-        return RESTObjectList(manager, ProjectIssue, data_list)
+        return build_object_list(manager, ProjectIssue, data_list)
 
     @cli.register_custom_action(cls_names="ProjectMilestone")
     @exc.on_http_error(exc.GitlabListError)
@@ -154,13 +147,11 @@ class ProjectMilestone(PromoteMixin, SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         path = f"{self.manager.path}/{self.encoded_id}/merge_requests"
         data_list = self.manager.gitlab.http_list(path, iterator=True, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(data_list, GitlabList)
         manager = ProjectMergeRequestManager(
             self.manager.gitlab, parent=self.manager._parent
         )
         # FIXME(gpocentek): the computed manager path is not correct
-        return RESTObjectList(manager, ProjectMergeRequest, data_list)
+        return build_object_list(manager, ProjectMergeRequest, data_list)
 
 
 class ProjectMilestoneManager(CRUDMixin[ProjectMilestone]):
@@ -1,7 +1,8 @@
-from typing import Any, TYPE_CHECKING
+from typing import Any
 
 from gitlab import cli
 from gitlab import exceptions as exc
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.mixins import RetrieveMixin
 from gitlab.utils import EncodedId
@@ -38,6 +39,4 @@ class NamespaceManager(RetrieveMixin[Namespace]):
         """
         path = f"{self.path}/{EncodedId(namespace)}/exists"
         server_data = self.gitlab.http_get(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        return self._obj_cls(self, server_data)
+        return utils.map_result(server_data, lambda data: self._obj_cls(self, data))
@@ -6,6 +6,7 @@ https://docs.gitlab.com/ee/user/packages/generic_packages/
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from typing import Any, BinaryIO, Callable, Iterator, Literal, overload, TYPE_CHECKING
 
@@ -53,10 +54,14 @@ class GenericPackageManager(RESTManager[GenericPackage]):
         path: str | Path | None = None,
         select: str | None = None,
         data: bytes | BinaryIO | None = None,
+        progress: utils.UploadProgress | None = None,
         **kwargs: Any,
     ) -> GenericPackage:
         """Upload a file as a generic package.
 
+        Files are streamed by chunks from ``path`` or the ``data`` file
+        object, so they are never loaded into memory as a whole.
+
         Args:
             package_name: The package name. Must follow generic package
                                 name regex rules
@@ -65,6 +70,10 @@ class GenericPackageManager(RESTManager[GenericPackage]):
             file_name: The name of the file as uploaded in the registry
             path: The path to a local file to upload
             select: GitLab API accepts a value of 'package_file'
+            data: The content of the file, or a binary file object to read
+                it from
+            progress: Called after each chunk read with the number of bytes
+                uploaded so far and the size of the file (None if unknown)
 
         Raises:
             GitlabConnectionError: If the server cannot be reached
@@ -84,36 +93,56 @@ class GenericPackageManager(RESTManager[GenericPackage]):
         if path is not None and data is not None:
             raise exc.GitlabUploadError("File contents and file path specified")
 
-        file_data: bytes | BinaryIO | None = data
-
-        if not file_data:
-            if TYPE_CHECKING:
-                assert path is not None
-
+        file_data: bytes | utils.UploadStream
+        if path is not None:
             try:
-                with open(path, "rb") as f:
-                    file_data = f.read()
+                file_data = utils.UploadStream(path, progress=progress)
             except OSError as e:
                 raise exc.GitlabUploadError(
                     f"Failed to read package file {path}"
                 ) from e
+        elif isinstance(data, bytes) and progress is None:
+            file_data = data
+        else:
+            if TYPE_CHECKING:
+                assert data is not None
+            if isinstance(data, bytes):
+                data = io.BytesIO(data)
+            file_data = utils.UploadStream(data, progress=progress)
 
         url = f"{self._computed_path}/{package_name}/{package_version}/{file_name}"
         query_data = {} if select is None else {"select": select}
         server_data = self.gitlab.http_put(
             url, query_data=query_data, post_data=file_data, raw=True, **kwargs
         )
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
 
-        attrs = {
-            "package_name": package_name,
-            "package_version": package_version,
-            "file_name": file_name,
-            "path": path,
-        }
-        attrs.update(server_data)
-        return self._obj_cls(self, attrs=attrs)
+        def build(server_data: dict[str, Any]) -> GenericPackage:
+            attrs = {
+                "package_name": package_name,
+                "package_version": package_version,
+                "file_name": file_name,
+                "path": path,
+            }
+            attrs.update(server_data)
+            return self._obj_cls(self, attrs=attrs)
+
+        return utils.map_result(server_data, build)
+
+    @overload
+    def download(
+        self,
+        package_name: str,
+        package_version: str,
+        file_name: str,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        segments: int = 1,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
 
     @overload
     def download(
@@ -172,8 +201,10 @@ class GenericPackageManager(RESTManager[GenericPackage]):
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
+        segments: int = 1,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Download a generic package.
 
         Args:
@@ -185,6 +216,14 @@ class GenericPackageManager(RESTManager[GenericPackage]):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
+            segments: With `download_to` a path, the maximum number of
+                byte ranges of the data to fetch concurrently when the
+                server accepts ranges.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -198,6 +237,10 @@ class GenericPackageManager(RESTManager[GenericPackage]):
             The package content if streamed is False, None otherwise
         """
         path = f"{self._computed_path}/{package_name}/{package_version}/{file_name}"
+        if download_to is not None:
+            return self.gitlab.http_download(
+                path, download_to, segments=segments, **kwargs
+            )
         result = self.gitlab.http_get(path, streamed=streamed, raw=True, **kwargs)
         if TYPE_CHECKING:
             assert isinstance(result, requests.Response)
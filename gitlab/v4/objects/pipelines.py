@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from typing import Any
 
 import requests
 
 from gitlab import cli
 from gitlab import exceptions as exc
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.mixins import (
     CreateMixin,
@@ -152,9 +153,9 @@ class ProjectPipelineManager(
         if ref:
             data = {"ref": ref}
         server_data = self.gitlab.http_get(self.path + "/latest", query_data=data)
-        if TYPE_CHECKING:
-            assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data, lazy=lazy)
+        return utils.map_result(
+            server_data, lambda data: self._obj_cls(self, data, lazy=lazy)
+        )
 
 
 class ProjectPipelineJob(RESTObject):
@@ -236,9 +237,7 @@ class ProjectPipelineSchedule(SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         path = f"{self.manager.path}/{self.encoded_id}/take_ownership"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(cls_names="ProjectPipelineSchedule")
     @exc.on_http_error(exc.GitlabPipelinePlayError)
@@ -255,10 +254,7 @@ class ProjectPipelineSchedule(SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         path = f"{self.manager.path}/{self.encoded_id}/play"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
-        return server_data
+        return utils.map_result(server_data, self._update_and_return)
 
 
 class ProjectPipelineScheduleManager(CRUDMixin[ProjectPipelineSchedule]):
@@ -10,7 +10,7 @@ from typing import Any, Callable, Iterator, Literal, overload, TYPE_CHECKING
 
 import requests
 
-from gitlab import cli, client
+from gitlab import cli, client, const
 from gitlab import exceptions as exc
 from gitlab import types, utils
 from gitlab.base import RESTObject
@@ -135,6 +135,7 @@ class GroupProjectManager(ListMixin[GroupProject]):
     _path = "/groups/{group_id}/projects"
     _obj_cls = GroupProject
     _from_parent_attrs = {"group_id": "id"}
+    _simple_fields = const.SIMPLE_PROJECT_FIELDS
     _list_filters = (
         "archived",
         "visibility",
@@ -269,7 +270,7 @@ class Project(
             GitlabCreateError: If the relation could not be created
         """
         path = f"/projects/{self.encoded_id}/fork/{forked_from_id}"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
 
     @cli.register_custom_action(cls_names="Project")
     @exc.on_http_error(exc.GitlabDeleteError)
@@ -284,7 +285,7 @@ class Project(
             GitlabDeleteError: If the server failed to perform the request
         """
         path = f"/projects/{self.encoded_id}/fork"
-        self.manager.gitlab.http_delete(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_delete(path, **kwargs))
 
     @cli.register_custom_action(cls_names="Project")
     @exc.on_http_error(exc.GitlabGetError)
@@ -315,9 +316,7 @@ class Project(
         """
         path = f"/projects/{self.encoded_id}/star"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(cls_names="Project")
     @exc.on_http_error(exc.GitlabDeleteError)
@@ -333,9 +332,7 @@ class Project(
         """
         path = f"/projects/{self.encoded_id}/unstar"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(cls_names="Project")
     @exc.on_http_error(exc.GitlabCreateError)
@@ -351,9 +348,7 @@ class Project(
         """
         path = f"/projects/{self.encoded_id}/archive"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(cls_names="Project")
     @exc.on_http_error(exc.GitlabDeleteError)
@@ -369,9 +364,7 @@ class Project(
         """
         path = f"/projects/{self.encoded_id}/unarchive"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
+        return utils.map_result(server_data, self._update_attrs)
 
     @cli.register_custom_action(
         cls_names="Project",
@@ -403,7 +396,9 @@ class Project(
             "group_access": group_access,
             "expires_at": expires_at,
         }
-        self.manager.gitlab.http_post(path, post_data=data, **kwargs)
+        return utils.discard_result(
+            self.manager.gitlab.http_post(path, post_data=data, **kwargs)
+        )
 
     @cli.register_custom_action(cls_names="Project", required=("group_id",))
     @exc.on_http_error(exc.GitlabDeleteError)
@@ -419,7 +414,7 @@ class Project(
             GitlabDeleteError: If the server failed to perform the request
         """
         path = f"/projects/{self.encoded_id}/share/{group_id}"
-        self.manager.gitlab.http_delete(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_delete(path, **kwargs))
 
     # variables not supported in CLI
     @cli.register_custom_action(cls_names="Project", required=("ref", "token"))
@@ -457,9 +452,9 @@ class Project(
             "inputs": inputs,
         }
         attrs = self.manager.gitlab.http_post(path, post_data=post_data, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(attrs, dict)
-        return ProjectPipeline(self.pipelines, attrs)
+        return utils.map_result(
+            attrs, lambda attrs: ProjectPipeline(self.pipelines, attrs)
+        )
 
     @cli.register_custom_action(cls_names="Project")
     @exc.on_http_error(exc.GitlabHousekeepingError)
@@ -475,7 +470,7 @@ class Project(
                                      request
         """
         path = f"/projects/{self.encoded_id}/housekeeping"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
 
     @cli.register_custom_action(cls_names="Project")
     @exc.on_http_error(exc.GitlabRestoreError)
@@ -490,7 +485,20 @@ class Project(
             GitlabRestoreError: If the server failed to perform the request
         """
         path = f"/projects/{self.encoded_id}/restore"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
+
+    @overload
+    def snapshot(
+        self,
+        wiki: bool = False,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
 
     @overload
     def snapshot(
@@ -538,8 +546,9 @@ class Project(
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Return a snapshot of the repository.
 
         Args:
@@ -549,6 +558,11 @@ class Project(
                 treatment.
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -562,6 +576,10 @@ class Project(
             The uncompressed tar archive of the repository
         """
         path = f"/projects/{self.encoded_id}/snapshot"
+        if download_to is not None:
+            return self.manager.gitlab.http_download(
+                path, download_to, wiki=wiki, **kwargs
+            )
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, wiki=wiki, **kwargs
         )
@@ -614,7 +632,7 @@ class Project(
             category=DeprecationWarning,
         )
         path = f"/projects/{self.encoded_id}/mirror/pull"
-        self.manager.gitlab.http_post(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_post(path, **kwargs))
 
     @cli.register_custom_action(cls_names="Project")
     @exc.on_http_error(exc.GitlabGetError)
@@ -661,8 +679,10 @@ class Project(
             GitlabTransferProjectError: If the project could not be transferred
         """
         path = f"/projects/{self.encoded_id}/transfer"
-        self.manager.gitlab.http_put(
-            path, post_data={"namespace": to_namespace}, **kwargs
+        return utils.discard_result(
+            self.manager.gitlab.http_put(
+                path, post_data={"namespace": to_namespace}, **kwargs
+            )
         )
 
 
@@ -833,6 +853,7 @@ class ProjectManager(CRUDMixin[Project]):
             "wiki_enabled",
         )
     )
+    _simple_fields = const.SIMPLE_PROJECT_FIELDS
     _list_filters = (
         "archived",
         "id_after",
@@ -1195,6 +1216,7 @@ class ProjectForkManager(CreateMixin[ProjectFork], ListMixin[ProjectFork]):
     _path = "/projects/{project_id}/forks"
     _obj_cls = ProjectFork
     _from_parent_attrs = {"project_id": "id"}
+    _simple_fields = const.SIMPLE_PROJECT_FIELDS
     _list_filters = (
         "archived",
         "visibility",
@@ -1285,10 +1307,7 @@ class ProjectPullMirrorManager(
         self._create_attrs.validate_attrs(data=data)
 
         server_data = self.gitlab.http_put(self.path, post_data=data, **kwargs)
-
-        if TYPE_CHECKING:
-            assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data)
+        return utils.map_result(server_data, lambda data: self._obj_cls(self, data))
 
     @cli.register_custom_action(cls_names="ProjectPullMirrorManager")
     @exc.on_http_error(exc.GitlabCreateError)
@@ -1302,7 +1321,7 @@ class ProjectPullMirrorManager(
             GitlabAuthenticationError: If authentication is not correct
             GitlabCreateError: If the server failed to perform the request
         """
-        self.gitlab.http_post(self.path, **kwargs)
+        return utils.discard_result(self.gitlab.http_post(self.path, **kwargs))
 
 
 class ProjectStorage(RefreshMixin, RESTObject):
@@ -1323,6 +1342,7 @@ class SharedProjectManager(ListMixin[SharedProject]):
     _path = "/groups/{group_id}/projects/shared"
     _obj_cls = SharedProject
     _from_parent_attrs = {"group_id": "id"}
+    _simple_fields = const.SIMPLE_PROJECT_FIELDS
     _list_filters = (
         "archived",
         "visibility",
@@ -15,6 +15,8 @@ from gitlab import cli
 from gitlab import exceptions as exc
 from gitlab import types, utils
 
+__all__ = ["RepositoryMixin"]
+
 if TYPE_CHECKING:
     # When running mypy we use these as the base classes
     _RestObjectBase = gitlab.base.RESTObject
@@ -108,6 +110,19 @@ class RepositoryMixin(_RestObjectBase):
         path = f"/projects/{self.encoded_id}/repository/blobs/{sha}"
         return self.manager.gitlab.http_get(path, **kwargs)
 
+    @overload
+    def repository_raw_blob(
+        self,
+        sha: str,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
+
     @overload
     def repository_raw_blob(
         self,
@@ -154,8 +169,9 @@ class RepositoryMixin(_RestObjectBase):
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Return the raw file contents for a blob.
 
         Args:
@@ -165,6 +181,11 @@ class RepositoryMixin(_RestObjectBase):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -178,6 +199,8 @@ class RepositoryMixin(_RestObjectBase):
             The blob content if streamed is False, None otherwise
         """
         path = f"/projects/{self.encoded_id}/repository/blobs/{sha}/raw"
+        if download_to is not None:
+            return self.manager.gitlab.http_download(path, download_to, **kwargs)
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
@@ -235,6 +258,19 @@ class RepositoryMixin(_RestObjectBase):
         path = f"/projects/{self.encoded_id}/repository/contributors"
         return self.manager.gitlab.http_list(path, **kwargs)
 
+    @overload
+    def repository_archive(
+        self,
+        sha: str | None = None,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
+
     @overload
     def repository_archive(
         self,
@@ -283,8 +319,9 @@ class RepositoryMixin(_RestObjectBase):
         path: str | None = None,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Return an archive of the repository.
 
         Args:
@@ -294,6 +331,11 @@ class RepositoryMixin(_RestObjectBase):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -316,6 +358,10 @@ class RepositoryMixin(_RestObjectBase):
             query_data["sha"] = sha
         if path is not None:
             query_data["path"] = path
+        if download_to is not None:
+            return self.manager.gitlab.http_download(
+                url_path, download_to, query_data=query_data, **kwargs
+            )
         result = self.manager.gitlab.http_get(
             url_path, query_data=query_data, raw=True, streamed=streamed, **kwargs
         )
@@ -364,4 +410,4 @@ class RepositoryMixin(_RestObjectBase):
             GitlabDeleteError: If the server failed to perform the request
         """
         path = f"/projects/{self.encoded_id}/repository/merged_branches"
-        self.manager.gitlab.http_delete(path, **kwargs)
+        return utils.discard_result(self.manager.gitlab.http_delete(path, **kwargs))
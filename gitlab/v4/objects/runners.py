@@ -4,8 +4,8 @@ from typing import Any
 
 from gitlab import cli
 from gitlab import exceptions as exc
-from gitlab import types
-from gitlab.base import RESTObject
+from gitlab import types, utils
+from gitlab.base import build_object_list, RESTObject
 from gitlab.mixins import (
     CreateMixin,
     CRUDMixin,
@@ -103,7 +103,7 @@ class RunnerManager(CRUDMixin[Runner]):
         if scope is not None:
             query_data["scope"] = scope
         obj = self.gitlab.http_list(path, query_data, **kwargs)
-        return [self._obj_cls(self, item) for item in obj]
+        return build_object_list(self, self._obj_cls, obj, created_from_list=False)
 
     @cli.register_custom_action(cls_names="RunnerManager", required=("token",))
     @exc.on_http_error(exc.GitlabVerifyError)
@@ -120,7 +120,9 @@ class RunnerManager(CRUDMixin[Runner]):
         """
         path = "/runners/verify"
         post_data = {"token": token}
-        self.gitlab.http_post(path, post_data=post_data, **kwargs)
+        return utils.discard_result(
+            self.gitlab.http_post(path, post_data=post_data, **kwargs)
+        )
 
 
 class RunnerAll(RESTObject):
@@ -20,6 +20,18 @@ __all__ = ["ProjectSecureFile", "ProjectSecureFileManager"]
 
 
 class ProjectSecureFile(ObjectDeleteMixin, RESTObject):
+    @overload
+    def download(
+        self,
+        streamed: bool = False,
+        action: None = None,
+        chunk_size: int = 1024,
+        *,
+        iterator: Literal[False] = False,
+        download_to: utils.DownloadDestination,
+        **kwargs: Any,
+    ) -> utils.DownloadStats: ...
+
     @overload
     def download(
         self,
@@ -62,8 +74,9 @@ class ProjectSecureFile(ObjectDeleteMixin, RESTObject):
         chunk_size: int = 1024,
         *,
         iterator: bool = False,
+        download_to: utils.DownloadDestination | None = None,
         **kwargs: Any,
-    ) -> bytes | Iterator[Any] | None:
+    ) -> bytes | Iterator[Any] | utils.DownloadStats | None:
         """Download the secure file.
 
         Args:
@@ -72,6 +85,11 @@ class ProjectSecureFile(ObjectDeleteMixin, RESTObject):
                 treatment
             iterator: If True directly return the underlying response
                 iterator
+            download_to: Path or binary file object to write the data to,
+                in large chunks (`streamed`, `action` and `chunk_size` are
+                then ignored). A path is only created once the data was
+                completely downloaded, and interrupted downloads are
+                resumed. The statistics of the download are returned.
             action: Callable responsible of dealing with chunk of
                 data
             chunk_size: Size of each chunk
@@ -84,6 +102,8 @@ class ProjectSecureFile(ObjectDeleteMixin, RESTObject):
         Returns:
             The artifacts if `streamed` is False, None otherwise."""
         path = f"{self.manager.path}/{self.id}/download"
+        if download_to is not None:
+            return self.manager.gitlab.http_download(path, download_to, **kwargs)
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
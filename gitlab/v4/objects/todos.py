@@ -1,7 +1,8 @@
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict
 
 from gitlab import cli
 from gitlab import exceptions as exc
+from gitlab import utils
 from gitlab.base import RESTObject
 from gitlab.mixins import DeleteMixin, ListMixin, ObjectDeleteMixin
 
@@ -26,10 +27,7 @@ class Todo(ObjectDeleteMixin, RESTObject):
         """
         path = f"{self.manager.path}/{self.encoded_id}/mark_as_done"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if TYPE_CHECKING:
-            assert isinstance(server_data, dict)
-        self._update_attrs(server_data)
-        return server_data
+        return utils.map_result(server_data, self._update_and_return)
 
 
 class TodoManager(ListMixin[Todo], DeleteMixin[Todo]):
@@ -52,4 +50,6 @@ class TodoManager(ListMixin[Todo], DeleteMixin[Todo]):
         Returns:
             The number of todos marked done
         """
-        self.gitlab.http_post("/todos/mark_as_done", **kwargs)
+        return utils.discard_result(
+            self.gitlab.http_post("/todos/mark_as_done", **kwargs)
+        )
@@ -10,9 +10,9 @@ from typing import Any, cast, Literal, Optional, overload
 
 import requests
 
-from gitlab import cli
+from gitlab import cli, const
 from gitlab import exceptions as exc
-from gitlab import types
+from gitlab import types, utils
 from gitlab.base import RESTObject, RESTObjectList
 from gitlab.mixins import (
     CreateMixin,
@@ -188,6 +188,11 @@ class User(SaveMixin, ObjectDeleteMixin, RESTObject):
     starred_projects: StarredProjectManager
     status: UserStatusManager
 
+    def _update_state(self, changed: Any, state: str) -> Any:
+        if changed:
+            self._attrs["state"] = state
+        return changed
+
     @cli.register_custom_action(cls_names="User")
     @exc.on_http_error(exc.GitlabBlockError)
     def block(self, **kwargs: Any) -> bool | None:
@@ -209,9 +214,9 @@ class User(SaveMixin, ObjectDeleteMixin, RESTObject):
         server_data = cast(
             Optional[bool], self.manager.gitlab.http_post(path, **kwargs)
         )
-        if server_data is True:
-            self._attrs["state"] = "blocked"
-        return server_data
+        return utils.map_result(
+            server_data, lambda data: self._update_state(data, "blocked")
+        )
 
     @cli.register_custom_action(cls_names="User")
     @exc.on_http_error(exc.GitlabFollowError)
@@ -270,9 +275,9 @@ class User(SaveMixin, ObjectDeleteMixin, RESTObject):
         server_data = cast(
             Optional[bool], self.manager.gitlab.http_post(path, **kwargs)
         )
-        if server_data is True:
-            self._attrs["state"] = "active"
-        return server_data
+        return utils.map_result(
+            server_data, lambda data: self._update_state(data, "active")
+        )
 
     @cli.register_custom_action(cls_names="User")
     @exc.on_http_error(exc.GitlabDeactivateError)
@@ -291,9 +296,9 @@ class User(SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         path = f"/users/{self.encoded_id}/deactivate"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if server_data:
-            self._attrs["state"] = "deactivated"
-        return server_data
+        return utils.map_result(
+            server_data, lambda data: self._update_state(data, "deactivated")
+        )
 
     @cli.register_custom_action(cls_names="User")
     @exc.on_http_error(exc.GitlabActivateError)
@@ -312,9 +317,9 @@ class User(SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         path = f"/users/{self.encoded_id}/activate"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if server_data:
-            self._attrs["state"] = "active"
-        return server_data
+        return utils.map_result(
+            server_data, lambda data: self._update_state(data, "active")
+        )
 
     @cli.register_custom_action(cls_names="User")
     @exc.on_http_error(exc.GitlabUserApproveError)
@@ -369,9 +374,9 @@ class User(SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         path = f"/users/{self.encoded_id}/ban"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if server_data:
-            self._attrs["state"] = "banned"
-        return server_data
+        return utils.map_result(
+            server_data, lambda data: self._update_state(data, "banned")
+        )
 
     @cli.register_custom_action(cls_names="User")
     @exc.on_http_error(exc.GitlabUnbanError)
@@ -390,9 +395,9 @@ class User(SaveMixin, ObjectDeleteMixin, RESTObject):
         """
         path = f"/users/{self.encoded_id}/unban"
         server_data = self.manager.gitlab.http_post(path, **kwargs)
-        if server_data:
-            self._attrs["state"] = "active"
-        return server_data
+        return utils.map_result(
+            server_data, lambda data: self._update_state(data, "active")
+        )
 
 
 class UserManager(CRUDMixin[User]):
@@ -604,6 +609,7 @@ class UserProjectManager(ListMixin[UserProject], CreateMixin[UserProject]):
             "only_allow_merge_if_build_succeeds",
         ),
     )
+    _simple_fields = const.SIMPLE_PROJECT_FIELDS
     _list_filters = (
         "archived",
         "visibility",
@@ -687,6 +693,7 @@ class StarredProjectManager(ListMixin[StarredProject]):
     _path = "/users/{user_id}/starred_projects"
     _obj_cls = StarredProject
     _from_parent_attrs = {"user_id": "id"}
+    _simple_fields = const.SIMPLE_PROJECT_FIELDS
     _list_filters = (
         "archived",
         "membership",
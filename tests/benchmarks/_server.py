@@ -0,0 +1,61 @@
+"""Minimal local HTTP/1.1 server standing in for GitLab in benchmarks."""
+
+import asyncio
+import contextlib
+import json
+from typing import AsyncIterator, Callable, Tuple
+
+#: Returns the status, content type and body answering a request path
+Handler = Callable[[str], Tuple[int, str, bytes]]
+
+
+def json_handler(path: str) -> Tuple[int, str, bytes]:
+    """Answer every request with a small JSON object, like ``GetMixin.get``."""
+    obj_id = path.rstrip("/").rsplit("/", 1)[-1]
+    body = json.dumps({"id": obj_id, "name": f"project-{obj_id}"}).encode()
+    return 200, "application/json", body
+
+
+async def _serve_http1(
+    handler: Handler, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            content_length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    content_length = int(value)
+            if content_length:
+                await reader.readexactly(content_length)
+
+            path = request_line.split()[1].decode()
+            status, content_type, body = handler(path)
+            writer.write(
+                f"HTTP/1.1 {status} OK\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "\r\n".encode() + body
+            )
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+@contextlib.asynccontextmanager
+async def http1_server(handler: Handler = json_handler) -> AsyncIterator[str]:
+    """Run a keep-alive HTTP/1.1 server on localhost and yield its URL."""
+    server = await asyncio.start_server(
+        lambda r, w: _serve_http1(handler, r, w), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}"
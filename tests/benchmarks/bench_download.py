@@ -0,0 +1,144 @@
+"""Compare the ways of writing a large download to disk.
+
+A local server streams the artifacts of a job (1 GiB by default), which are
+written to a temporary directory: with ``streamed=True`` and ``action`` at the
+default and a larger ``chunk_size``, and with ``download_to``, using both the
+sync and the async clients::
+
+    python -m tests.benchmarks.bench_download --size 1024 --rounds 3
+"""
+
+import argparse
+import asyncio
+import contextlib
+import http.server
+import pathlib
+import re
+import socketserver
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional
+
+import gitlab
+
+_BLOCK = bytes(range(256)) * 4096  # 1 MiB
+
+
+def _handler(
+    size: int, rate: Optional[float]
+) -> type[http.server.BaseHTTPRequestHandler]:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            start, end = 0, size
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            if match:
+                start = int(match[1])
+                end = int(match[2]) + 1 if match[2] else size
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(end - start))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", f'"{size}"')
+            self.end_headers()
+            began = time.perf_counter()
+            position = start
+            try:
+                while position < end:
+                    offset = position % len(_BLOCK)
+                    block = _BLOCK[offset : offset + end - position]
+                    self.wfile.write(block)
+                    position += len(block)
+                    if rate:
+                        # Cap the throughput of each connection
+                        ahead = (position - start) / rate - (
+                            time.perf_counter() - began
+                        )
+                        time.sleep(max(ahead, 0))
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # the client only needed the start of the data
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+@contextlib.contextmanager
+def artifacts_server(size: int, rate: Optional[float] = None) -> Iterator[str]:
+    """Serve ``size`` bytes of artifacts on localhost, yield the server URL.
+
+    The server accepts ``Range`` requests, and sends at most ``rate`` bytes
+    per second on each connection if set.
+    """
+
+    class Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+        daemon_threads = True
+
+    server = Server(("127.0.0.1", 0), _handler(size, rate))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _best(
+    func: Callable[[pathlib.Path], Any], rounds: int, path: pathlib.Path
+) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(path)
+        timings.append(time.perf_counter() - start)
+        path.unlink()
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1024, help="size in MiB")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    size = args.size * 1024 * 1024
+
+    with artifacts_server(size) as url, tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "artifacts.zip"
+        job = gitlab.Gitlab(url).projects.get(1, lazy=True).jobs.get(1, lazy=True)
+
+        def action(chunk_size: int) -> Callable[[pathlib.Path], Any]:
+            def download(path: pathlib.Path) -> None:
+                with open(path, "wb") as f:
+                    job.artifacts(streamed=True, action=f.write, chunk_size=chunk_size)
+
+            return download
+
+        def async_download_to(path: pathlib.Path) -> None:
+            async def download() -> None:
+                async with gitlab.AsyncGitlab(url) as gl:
+                    project = gl.projects.get(1, lazy=True)
+                    await project.jobs.get(1, lazy=True).artifacts(download_to=path)
+
+            asyncio.run(download())
+
+        runs = {
+            "action, chunk_size=1 KiB": action(1024),
+            "action, chunk_size=1 MiB": action(1024 * 1024),
+            "download_to": lambda path: job.artifacts(download_to=path),
+            "async download_to": async_download_to,
+        }
+        print(f"{args.size} MiB, best of {args.rounds} rounds")
+        for label, func in runs.items():
+            seconds = _best(func, args.rounds, path)
+            print(f"  {label:26} {seconds:7.2f}s {args.size / seconds:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
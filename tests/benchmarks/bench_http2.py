@@ -0,0 +1,133 @@
+"""Compare HTTP/1.1 and HTTP/2 request rates for concurrent ``GetMixin.get`` calls.
+
+Many small concurrent GETs are sent through :class:`gitlab.AsyncGitlab` to a
+local stand-in server. With HTTP/1.1, the requests queue up behind the
+``max_connections`` limit of the pool, while HTTP/2 multiplexes them over a
+single connection. HTTP/2 requires the ``h2`` package::
+
+    pip install httpx[http2]
+    python -m tests.benchmarks.bench_http2 --requests 2000 --max-connections 10
+"""
+
+import argparse
+import asyncio
+import contextlib
+import time
+from typing import Any, AsyncIterator, List, Optional
+
+import gitlab
+from tests.benchmarks._server import Handler, http1_server, json_handler
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+except ImportError:  # pragma: no cover
+    h2 = None
+
+
+class _H2Protocol(asyncio.Protocol):
+    """Cleartext HTTP/2 (prior knowledge) server connection."""
+
+    def __init__(self, handler: Handler) -> None:
+        self._handler = handler
+        self._conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self._transport: Optional[asyncio.Transport] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self._transport = transport
+        self._conn.initiate_connection()
+        transport.write(self._conn.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        assert self._transport is not None
+        try:
+            events = self._conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self._transport.write(self._conn.data_to_send())
+            self._transport.close()
+            return
+
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                headers = dict(event.headers)
+                status, content_type, body = self._handler(headers[":path"])
+                self._conn.send_headers(
+                    event.stream_id,
+                    [
+                        (":status", str(status)),
+                        ("content-type", content_type),
+                        ("content-length", str(len(body))),
+                    ],
+                )
+                self._conn.send_data(event.stream_id, body, end_stream=True)
+        self._transport.write(self._conn.data_to_send())
+
+
+@contextlib.asynccontextmanager
+async def h2_server(handler: Handler = json_handler) -> AsyncIterator[str]:
+    """Run a cleartext HTTP/2 server on localhost and yield its URL."""
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: _H2Protocol(handler), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}"
+
+
+async def run(url: str, requests: int, max_connections: int, http2: bool) -> float:
+    """Return the number of ``get`` calls per second."""
+    # Without TLS there is no ALPN negotiation, so HTTP/2 must be forced
+    options: dict[str, Any] = {"http1": False} if http2 else {}
+    async with gitlab.AsyncGitlab(
+        url, http2=http2, max_connections=max_connections, **options
+    ) as gl:
+        await gl.projects.get(0)  # warm up the connection
+        start = time.perf_counter()
+        projects: List[Any] = await asyncio.gather(
+            *(gl.projects.get(i) for i in range(requests))
+        )
+        elapsed = time.perf_counter() - start
+        assert len(projects) == requests
+        assert gl.http2_active is http2
+    return requests / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--max-connections", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{args.requests} concurrent GETs, pool of {args.max_connections} "
+        f"connections, best of {args.rounds}"
+    )
+    async with http1_server() as url:
+        rate = max(
+            [
+                await run(url, args.requests, args.max_connections, http2=False)
+                for _ in range(args.rounds)
+            ]
+        )
+        print(f"HTTP/1.1: {rate:10.0f} req/s")
+
+    if h2 is None:
+        print("HTTP/2:   skipped, install httpx[http2] to enable it")
+        return
+    async with h2_server() as url:
+        rate = max(
+            [
+                await run(url, args.requests, args.max_connections, http2=True)
+                for _ in range(args.rounds)
+            ]
+        )
+        print(f"HTTP/2:   {rate:10.0f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
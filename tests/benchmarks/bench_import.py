@@ -0,0 +1,86 @@
+"""Measure the start-up time of python-gitlab.
+
+Each step is timed in a new interpreter, as modules are only imported once
+per process: ``import gitlab``, creating a ``Gitlab`` client, and the first
+use of a manager, which imports the object modules it needs. The slowest
+imports of ``import gitlab`` are then listed from ``python -X importtime``::
+
+    python -m tests.benchmarks.bench_import --rounds 10 --top 15
+"""
+
+import argparse
+import pathlib
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import gitlab
+
+_ROOT = pathlib.Path(gitlab.__file__).parent.parent
+
+_STEPS = {
+    "import gitlab": "import gitlab",
+    "gitlab.Gitlab()": "gl = gitlab.Gitlab()",
+    "gl.users": "gl.users",
+    "gl.projects": "gl.projects",
+}
+
+# Prints the time of each step, in seconds, separated by spaces
+_SCRIPT = """
+import time
+timings = []
+start = time.perf_counter()
+{steps}
+print(*timings)
+"""
+
+
+def _run(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args], check=True, capture_output=True, text=True, cwd=_ROOT
+    )
+
+
+def time_steps(rounds: int) -> Dict[str, float]:
+    """Return the best time of each step, in seconds."""
+    steps = "\n".join(
+        f"{code}\ntimings.append(time.perf_counter() - start)\n"
+        "start = time.perf_counter()"
+        for code in _STEPS.values()
+    )
+    script = _SCRIPT.format(steps=steps)
+    runs = [
+        [float(t) for t in _run("-c", script).stdout.split()] for _ in range(rounds)
+    ]
+    return {step: min(run[i] for run in runs) for i, step in enumerate(_STEPS)}
+
+
+def slowest_imports(top: int) -> List[Tuple[int, str]]:
+    """Return the cumulative time, in microseconds, of the slowest modules
+    imported by ``import gitlab`` (including the modules they import)."""
+    lines = _run("-X", "importtime", "-c", "import gitlab").stderr.splitlines()
+    imports = []
+    for line in lines:
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():  # skip the header
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"Best of {args.rounds} new interpreters, in milliseconds")
+    for step, seconds in time_steps(args.rounds).items():
+        print(f"  {step:18} {seconds * 1000:8.1f}")
+
+    print("\nSlowest imports of 'import gitlab' (cumulative, -X importtime)")
+    for cumulative, name in slowest_imports(args.top):
+        print(f"  {name:40} {cumulative / 1000:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
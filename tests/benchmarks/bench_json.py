@@ -0,0 +1,230 @@
+"""Compare the JSON codecs on large GitLab payloads.
+
+The payloads are generated with the shape of real responses: a pipeline test
+report, the diffs of a merge request, and a page of 100 projects. Decoding is
+compared with ``requests.Response.json()``, which was used before codecs were
+pluggable. Codecs whose package is not installed are skipped::
+
+    pip install orjson msgspec
+    python -m tests.benchmarks.bench_json --rounds 20
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+import requests
+
+from gitlab import json_codec
+
+_LOREM = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_LOREM) for _ in range(words))
+
+
+def _user(rng: random.Random) -> Dict[str, Any]:
+    user_id = rng.randrange(1, 100_000)
+    return {
+        "id": user_id,
+        "username": f"user{user_id}",
+        "name": f"User {user_id}",
+        "state": "active",
+        "avatar_url": f"https://gitlab.example.com/uploads/user/avatar/{user_id}.png",
+        "web_url": f"https://gitlab.example.com/user{user_id}",
+    }
+
+
+def pipeline_test_report(rng: random.Random, cases: int = 20_000) -> Dict[str, Any]:
+    """A ``GET /projects/:id/pipelines/:id/test_report`` response."""
+    suites = []
+    for suite in range(cases // 500):
+        test_cases = [
+            {
+                "status": rng.choice(["success", "success", "failed", "skipped"]),
+                "name": f"test_{_text(rng, 4).replace(' ', '_')}[{case}]",
+                "classname": f"tests.unit.test_module_{suite}",
+                "file": f"tests/unit/test_module_{suite}.py",
+                "execution_time": rng.random(),
+                "system_output": _text(rng, 30) if case % 10 == 0 else None,
+                "stack_trace": None,
+                "recent_failures": None,
+            }
+            for case in range(500)
+        ]
+        suites.append(
+            {
+                "name": f"unit-{suite}",
+                "total_time": sum(c["execution_time"] for c in test_cases),
+                "total_count": len(test_cases),
+                "success_count": 450,
+                "failed_count": 25,
+                "skipped_count": 25,
+                "error_count": 0,
+                "suite_error": None,
+                "test_cases": test_cases,
+            }
+        )
+    return {
+        "total_time": sum(s["total_time"] for s in suites),
+        "total_count": cases,
+        "success_count": 18_000,
+        "failed_count": 1_000,
+        "skipped_count": 1_000,
+        "error_count": 0,
+        "test_suites": suites,
+    }
+
+
+def mr_diffs(rng: random.Random, files: int = 300) -> List[Dict[str, Any]]:
+    """A ``GET /projects/:id/merge_requests/:iid/diffs`` response."""
+    diffs = []
+    for i in range(files):
+        lines = [
+            f"{rng.choice('+- ')}    {_text(rng, rng.randrange(3, 12))}"
+            for _ in range(rng.randrange(20, 200))
+        ]
+        path = f"src/package/module_{i}.py"
+        diffs.append(
+            {
+                "old_path": path,
+                "new_path": path,
+                "a_mode": "100644",
+                "b_mode": "100644",
+                "diff": f"@@ -1,{len(lines)} +1,{len(lines)} @@\n" + "\n".join(lines),
+                "new_file": False,
+                "renamed_file": False,
+                "deleted_file": False,
+                "generated_file": False,
+            }
+        )
+    return diffs
+
+
+def project_page(rng: random.Random, per_page: int = 100) -> List[Dict[str, Any]]:
+    """A ``GET /projects?per_page=100`` response."""
+    projects = []
+    for i in range(per_page):
+        name = f"project-{i}"
+        namespace = {
+            "id": i,
+            "name": f"group-{i}",
+            "path": f"group-{i}",
+            "kind": "group",
+            "full_path": f"group-{i}",
+            "parent_id": None,
+            "avatar_url": None,
+            "web_url": f"https://gitlab.example.com/groups/group-{i}",
+        }
+        projects.append(
+            {
+                "id": i,
+                "description": _text(rng, 20),
+                "name": name,
+                "name_with_namespace": f"Group {i} / {name}",
+                "path": name,
+                "path_with_namespace": f"group-{i}/{name}",
+                "created_at": "2024-01-01T12:00:00.000Z",
+                "default_branch": "main",
+                "tag_list": [],
+                "topics": [rng.choice(_LOREM) for _ in range(3)],
+                "ssh_url_to_repo": f"git@gitlab.example.com:group-{i}/{name}.git",
+                "http_url_to_repo": f"https://gitlab.example.com/group-{i}/{name}.git",
+                "web_url": f"https://gitlab.example.com/group-{i}/{name}",
+                "readme_url": f"https://gitlab.example.com/group-{i}/{name}/README.md",
+                "forks_count": rng.randrange(100),
+                "star_count": rng.randrange(1000),
+                "last_activity_at": "2024-06-01T12:00:00.000Z",
+                "namespace": namespace,
+                "owner": _user(rng),
+                "_links": {
+                    key: f"https://gitlab.example.com/api/v4/projects/{i}/{key}"
+                    for key in ("issues", "merge_requests", "repo_branches", "labels")
+                },
+                "permissions": {"project_access": None, "group_access": None},
+                "container_expiration_policy": {
+                    "cadence": "1d",
+                    "enabled": False,
+                    "keep_n": 10,
+                    "older_than": "90d",
+                    "name_regex": ".*",
+                    "name_regex_keep": None,
+                    "next_run_at": "2024-06-02T12:00:00.000Z",
+                },
+                **{
+                    f"{feature}_access_level": "enabled"
+                    for feature in (
+                        "issues",
+                        "repository",
+                        "merge_requests",
+                        "forking",
+                        "wiki",
+                        "builds",
+                        "snippets",
+                        "pages",
+                        "analytics",
+                        "security_and_compliance",
+                    )
+                },
+            }
+        )
+    return projects
+
+
+def _best(func: Callable[[], Any], rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _requests_json(body: bytes) -> Any:
+    response = requests.Response()
+    response._content = body
+    response.headers["Content-Type"] = "application/json"
+    return response.json()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    payloads = {
+        "test report": pipeline_test_report(rng),
+        "MR diffs": mr_diffs(rng),
+        "project page": project_page(rng),
+    }
+    codecs = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codecs.append(json_codec.get_codec(name))
+        except ImportError:
+            print(f"{name}: skipped, its package is not installed")
+
+    print(f"Best of {args.rounds} rounds, in milliseconds")
+    for label, payload in payloads.items():
+        body = json_codec.StdlibCodec().dumps(payload)
+        print(f"\n{label} ({len(body) / 1024 / 1024:.1f} MiB)")
+        baseline = _best(lambda: _requests_json(body), args.rounds)
+        print(f"  {'requests .json()':18} decode {baseline * 1000:8.2f}")
+        for codec in codecs:
+            decode = _best(lambda: codec.loads(body), args.rounds)
+            encode = _best(lambda: codec.dumps(payload), args.rounds)
+            print(
+                f"  {codec.name:18} decode {decode * 1000:8.2f} "
+                f"({baseline / decode:4.1f}x)  encode {encode * 1000:8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare downloads fetched in concurrent segments with a single stream.
+
+A local server accepting ``Range`` requests streams the artifacts of a job
+(512 MiB by default), at most ``--rate`` MiB/s per connection like a link
+where a single TCP stream can't reach the link speed. The artifacts are
+written to a temporary directory with ``download_to`` and several
+``segments``, using both the sync and the async clients::
+
+    python -m tests.benchmarks.bench_segmented_download --size 512 --rate 100
+"""
+
+import argparse
+import asyncio
+import pathlib
+import tempfile
+from typing import Any, Callable
+
+import gitlab
+from tests.benchmarks.bench_download import _best, artifacts_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=512, help="size in MiB")
+    parser.add_argument(
+        "--rate", type=float, default=100, help="MiB/s per connection, 0 for none"
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    size = args.size * 1024 * 1024
+    rate = args.rate * 1024 * 1024 or None
+
+    with artifacts_server(size, rate) as url, tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "artifacts.zip"
+        artifacts = gitlab.Gitlab(url).projects.get(1, lazy=True).artifacts
+
+        def download_to(segments: int) -> Callable[[pathlib.Path], Any]:
+            def download(path: pathlib.Path) -> None:
+                stats = artifacts.download(
+                    "main", "build", download_to=path, segments=segments
+                )
+                assert stats.size == size, stats
+
+            return download
+
+        def async_download_to(segments: int) -> Callable[[pathlib.Path], Any]:
+            async def download(path: pathlib.Path) -> None:
+                async with gitlab.AsyncGitlab(url) as gl:
+                    project = gl.projects.get(1, lazy=True)
+                    stats = await project.artifacts.download(
+                        "main", "build", download_to=path, segments=segments
+                    )
+                    assert stats.size == size, stats
+
+            return lambda path: asyncio.run(download(path))
+
+        runs = {
+            f"{client}, segments={segments}": func(segments)
+            for client, func in (("sync", download_to), ("async", async_download_to))
+            for segments in (1, 2, 4, 8)
+        }
+        limit = f"{args.rate:g} MiB/s per connection" if rate else "no rate limit"
+        print(f"{args.size} MiB, {limit}, best of {args.rounds} rounds")
+        for label, func in runs.items():
+            seconds = _best(func, args.rounds, path)
+            print(f"  {label:20} {seconds:7.2f}s {args.size / seconds:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import io
+import sys
+
+import httpx
+import pytest
+import respx
+
+from gitlab._backends import httpx_backend
+
+
+class TestHTTPXBackend:
+    def test_default_pool_limits(self) -> None:
+        backend = httpx_backend.HTTPXBackend()
+        pool = backend.client._transport._pool
+
+        assert pool._max_connections == httpx_backend.DEFAULT_MAX_CONNECTIONS
+        assert (
+            pool._max_keepalive_connections
+            == httpx_backend.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        )
+        assert pool._keepalive_expiry == httpx_backend.DEFAULT_KEEPALIVE_EXPIRY
+
+    def test_custom_pool_limits(self) -> None:
+        backend = httpx_backend.HTTPXBackend(
+            max_connections=5, max_keepalive_connections=2, keepalive_expiry=30.0
+        )
+        pool = backend.client._transport._pool
+
+        assert pool._max_connections == 5
+        assert pool._max_keepalive_connections == 2
+        assert pool._keepalive_expiry == 30.0
+
+    def test_uses_provided_client(self) -> None:
+        client = httpx.AsyncClient()
+        backend = httpx_backend.HTTPXBackend(client=client)
+
+        assert backend.client is client
+
+    @pytest.mark.anyio
+    async def test_reuses_client_between_requests(
+        self, respx_mock: respx.MockRouter
+    ) -> None:
+        url = "http://localhost/api/v4/projects"
+        route = respx_mock.get(url).mock(return_value=httpx.Response(200, json=[]))
+        backend = httpx_backend.HTTPXBackend()
+        client = backend.client
+
+        await backend.http_request("GET", url)
+        await backend.http_request("GET", url)
+
+        assert route.call_count == 2
+        assert backend.client is client
+        assert not backend.is_closed
+
+    @pytest.mark.anyio
+    async def test_aclose_closes_client(self) -> None:
+        backend = httpx_backend.HTTPXBackend()
+
+        await backend.aclose()
+
+        assert backend.is_closed
+        assert backend.client.is_closed
+
+    @pytest.mark.anyio
+    async def test_response_reason(self, respx_mock: respx.MockRouter) -> None:
+        url = "http://localhost/api/v4/projects"
+        respx_mock.get(url).mock(return_value=httpx.Response(404))
+        backend = httpx_backend.HTTPXBackend()
+
+        result = await backend.http_request("GET", url)
+
+        assert result.status_code == 404
+        assert result.reason == "Not Found"
+
+    def test_http2_requires_h2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "h2", None)
+
+        with pytest.raises(ImportError, match="h2"):
+            httpx_backend.HTTPXBackend(http2=True)
+
+    def test_http2_enabled(self) -> None:
+        pytest.importorskip("h2")
+        backend = httpx_backend.HTTPXBackend(http2=True)
+
+        assert backend.client._transport._pool._http2
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("http_version", ["HTTP/1.1", "HTTP/2"])
+    async def test_http_version(
+        self, respx_mock: respx.MockRouter, http_version: str
+    ) -> None:
+        url = "http://localhost/api/v4/projects"
+        respx_mock.get(url).mock(
+            return_value=httpx.Response(
+                200, extensions={"http_version": http_version.encode()}
+            )
+        )
+        backend = httpx_backend.HTTPXBackend()
+        assert backend.http_version is None
+
+        await backend.http_request("GET", url)
+
+        assert backend.http_version == http_version
+
+    @pytest.mark.anyio
+    async def test_multipart_content_is_encoded_like_httpx(self) -> None:
+        data = {"path": "my-project", "tags": ["a", "b"], "quote": 'say "hi"'}
+        content = httpx_backend.AsyncMultipartContent(
+            data,
+            {
+                "file": ("export.tar.gz", io.BytesIO(b"x" * 3000), "application/gzip"),
+                "avatar": ("avatar.png", b"png data"),
+            },
+        )
+        expected = httpx.Request(
+            "POST",
+            "http://localhost",
+            data=data,
+            files={
+                "file": ("export.tar.gz", b"x" * 3000, "application/gzip"),
+                "avatar": ("avatar.png", b"png data"),
+            },
+            headers={"Content-Type": content.content_type},
+        ).read()
+
+        body = b"".join([chunk async for chunk in content])
+
+        assert body == expected
+        assert content.size == len(body)
+        # The files are read again by each attempt of the request
+        assert b"".join([chunk async for chunk in content]) == expected
+
+    def test_prepare_send_data_streams_multipart_files(self, tmp_path) -> None:
+        path = tmp_path / "export.tar.gz"
+        path.write_bytes(b"x" * 3000)
+
+        with open(path, "rb") as f:
+            send_data = httpx_backend.HTTPXBackend.prepare_send_data(
+                files={"file": ("export.tar.gz", f)}, post_data={"overwrite": True}
+            )
+
+            assert isinstance(send_data.content, httpx_backend.AsyncMultipartContent)
+            assert send_data.content_type == send_data.content.content_type
+            assert send_data.content_type.startswith("multipart/form-data; boundary=")
+            assert send_data.content_length == send_data.content.size
+            assert send_data.content_length > 3000
+
+    @pytest.mark.anyio
+    async def test_raw_file_object_is_streamed(self) -> None:
+        bodies = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(await request.aread())
+            return httpx.Response(201)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        backend = httpx_backend.HTTPXBackend(client=client)
+        send_data = backend.prepare_send_data(post_data=io.BytesIO(b"abc"), raw=True)
+
+        assert isinstance(send_data.content, httpx_backend.AsyncUploadContent)
+        assert send_data.content_length == 3
+        for _ in range(2):
+            send_data.content.stream.rewind()
+            result = await backend.http_request(
+                "POST",
+                "http://localhost/api/v4/x",
+                headers={"Content-Length": str(send_data.content_length)},
+                content=send_data.content,
+            )
+            assert result.status_code == 201
+        assert bodies == [b"abc", b"abc"]
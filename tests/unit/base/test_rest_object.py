@@ -7,7 +7,7 @@ import pytest
 import gitlab
 from gitlab import base
 from tests.unit import helpers
-from tests.unit.helpers import FakeManager  # noqa: F401, needed for _create_managers
+from tests.unit.helpers import FakeManager  # noqa: F401, needed for managers
 
 
 def test_instantiate(gl, fake_manager):
@@ -16,7 +16,6 @@ def test_instantiate(gl, fake_manager):
 
     assert attrs == obj._attrs
     assert {} == obj._updated_attrs
-    assert obj._create_managers() is None
     assert fake_manager == obj.manager
     assert gl == obj.manager.gitlab
     assert str(obj) == f"{type(obj)} => {attrs}"
@@ -64,6 +63,37 @@ def test_picklability(fake_manager):
     pickle.dumps(unpickled)
 
 
+def test_unpickle_legacy_state(fake_manager):
+    obj = helpers.FakeObject.__new__(helpers.FakeObject)
+    obj.__setstate__(
+        {
+            "manager": fake_manager,
+            "_attrs": {"foo": "bar"},
+            "_updated_attrs": {},
+            "_parent_attrs": {},
+            "_created_from_list": False,
+            "_lazy": False,
+            "_module_name": "tests.unit.helpers",
+        }
+    )
+    assert obj.foo == "bar"
+    assert "_module_name" not in obj.__dict__
+    assert obj._module is helpers
+
+
+def test_compact_layout(fake_manager):
+    obj = helpers.FakeObject(fake_manager, {"foo": "bar"})
+    assert obj._module is helpers
+    assert obj._created_from_list is False
+    assert obj._lazy is False
+    # the module and default flags are stored on the class only
+    assert set(obj.__dict__) == {"manager", "_attrs", "_updated_attrs", "_parent_attrs"}
+
+    obj = helpers.FakeObject(fake_manager, {}, created_from_list=True, lazy=True)
+    assert obj._created_from_list is True
+    assert obj._lazy is True
+
+
 def test_attrs(fake_manager):
     obj = helpers.FakeObject(fake_manager, {"foo": "bar"})
 
@@ -137,9 +167,24 @@ def test_create_managers(gl, fake_manager):
 
     obj = ObjectWithManager(fake_manager, {"foo": "bar"})
     obj.id = 42
+    # managers are only created when first accessed
+    assert "fakes" not in obj.__dict__
     assert isinstance(obj.fakes, helpers.FakeManager)
     assert obj.fakes.gitlab == gl
     assert obj.fakes._parent == obj
+    assert obj.fakes is obj.fakes
+
+
+def test_create_managers_inherited(gl, fake_manager):
+    class ObjectWithManager(helpers.FakeObject):
+        fakes: FakeManager
+
+    class ChildObject(ObjectWithManager):
+        pass
+
+    obj = ChildObject(fake_manager, {"id": 42})
+    assert isinstance(obj.fakes, helpers.FakeManager)
+    assert obj.fakes._parent == obj
 
 
 def test_equality(fake_manager):
@@ -49,6 +49,11 @@ def gl():
     )
 
 
+@pytest.fixture
+def gl_async():
+    return gitlab.AsyncGitlab("http://localhost", private_token="private_token")
+
+
 @pytest.fixture
 def gl_retry():
     return gitlab.Gitlab(
@@ -4,9 +4,14 @@ Ensure objects defined in gitlab.v4.objects are imported in
 
 """
 
+import importlib
+import pathlib
 import pkgutil
+import subprocess
+import sys
 from typing import Set
 
+import gitlab
 import gitlab.exceptions
 import gitlab.v4.objects
 
@@ -27,8 +32,8 @@ def test_all_v4_objects_are_imported() -> None:
     init_files: Set[str] = set()
     with open(gitlab.v4.objects.__file__, encoding="utf-8") as in_file:
         for line in in_file.readlines():
-            if line.startswith("from ."):
-                init_files.add(line.rstrip())
+            if line.strip().startswith("from ."):
+                init_files.add(line.strip())
 
     object_files = set()
     for module in pkgutil.iter_modules(gitlab.v4.objects.__path__):
@@ -42,3 +47,30 @@ def test_all_v4_objects_are_imported() -> None:
         error_message += f"\n    {missing}"
 
     assert not missing_in_init, error_message
+
+
+def test_all_v4_objects_names_are_exported() -> None:
+    for module in pkgutil.iter_modules(gitlab.v4.objects.__path__):
+        object_module = importlib.import_module(f"gitlab.v4.objects.{module.name}")
+        assert gitlab.v4.objects._MODULE_NAMES.get(module.name) == tuple(
+            object_module.__all__
+        ), f"_MODULE_NAMES of {gitlab.v4.objects.__file__!r} is out of date"
+
+
+def test_import_gitlab_is_lazy() -> None:
+    # Run in a new interpreter, as the tests already imported everything
+    code = (
+        "import sys; import gitlab; gitlab.Gitlab().users; "
+        "print(' '.join(sorted(sys.modules)))"
+    )
+    modules = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=pathlib.Path(gitlab.__file__).parent.parent,
+    ).stdout.split()
+
+    for name in ("gql", "httpx", "gitlab.async_client", "gitlab.v4.objects.projects"):
+        assert name not in modules
+    assert "gitlab.v4.objects.users" in modules
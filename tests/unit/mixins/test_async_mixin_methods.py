@@ -0,0 +1,346 @@
+import anyio
+import httpx
+import pytest
+
+from gitlab import base, GitlabGetError, GitlabListError
+from gitlab import types as gl_types
+from gitlab.cache import TTLCache
+from gitlab.mixins import (
+    CreateMixin,
+    DeleteMixin,
+    GetMixin,
+    ListMixin,
+    ObjectDeleteMixin,
+    RefreshMixin,
+    SaveMixin,
+    UpdateMixin,
+)
+
+
+class FakeObject(base.RESTObject):
+    pass
+
+
+class FakeManager(base.RESTManager):
+    _path = "/tests"
+    _obj_cls = FakeObject
+
+
+@pytest.mark.anyio
+async def test_get_mixin(gl_async, respx_mock):
+    class M(GetMixin, FakeManager):
+        pass
+
+    respx_mock.get("http://localhost/api/v4/tests/42").mock(
+        return_value=httpx.Response(200, json={"id": 42, "foo": "bar"})
+    )
+
+    mgr = M(gl_async)
+    obj = await mgr.get(42)
+    assert isinstance(obj, FakeObject)
+    assert obj.foo == "bar"
+    assert obj.id == 42
+
+
+@pytest.mark.anyio
+async def test_get_mixin_response_cache(gl_async, respx_mock):
+    class M(GetMixin, FakeManager):
+        pass
+
+    route = respx_mock.get("http://localhost/api/v4/tests/42").mock(
+        return_value=httpx.Response(200, json={"id": 42, "foo": "bar"})
+    )
+    gl_async.response_cache = TTLCache({M: 300})
+
+    mgr = M(gl_async)
+    obj = await mgr.get(42)
+    cached = await mgr.get(42)
+    assert cached.foo == "bar"
+    assert cached is not obj
+    assert route.call_count == 1
+    assert gl_async.response_cache.hits == 1
+
+
+@pytest.mark.anyio
+async def test_writes_invalidate_response_cache(gl_async, respx_mock):
+    class M(GetMixin, UpdateMixin, DeleteMixin, FakeManager):
+        pass
+
+    class TestClass(SaveMixin, ObjectDeleteMixin, base.RESTObject):
+        pass
+
+    M._obj_cls = TestClass
+    url = "http://localhost/api/v4/tests/42"
+    route = respx_mock.get(url).mock(
+        return_value=httpx.Response(200, json={"id": 42, "foo": "bar"})
+    )
+    respx_mock.put(url).mock(
+        return_value=httpx.Response(200, json={"id": 42, "foo": "baz"})
+    )
+    respx_mock.delete(url).mock(return_value=httpx.Response(204))
+    gl_async.response_cache = TTLCache({M: 300})
+    mgr = M(gl_async)
+
+    obj = await mgr.get(42)
+    obj.foo = "baz"
+    await obj.save()
+    assert len(gl_async.response_cache) == 0
+
+    obj = await mgr.get(42)
+    await obj.delete()
+    assert len(gl_async.response_cache) == 0
+    assert route.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_get_mixin_raises_get_error(gl_async, respx_mock):
+    class M(GetMixin, FakeManager):
+        pass
+
+    respx_mock.get("http://localhost/api/v4/tests/42").mock(
+        return_value=httpx.Response(404, json={"message": "404 Not Found"})
+    )
+
+    mgr = M(gl_async)
+    with pytest.raises(GitlabGetError) as e:
+        await mgr.get(42)
+    assert e.value.response_code == 404
+    assert e.value.error_message == "404 Not Found"
+
+
+@pytest.mark.anyio
+async def test_get_many_mixin(gl_async, respx_mock):
+    class M(GetMixin, FakeManager):
+        pass
+
+    in_flight = max_in_flight = 0
+
+    async def side_effect(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await anyio.sleep(0.01)
+        in_flight -= 1
+        obj_id = int(request.url.path.rsplit("/", 1)[-1])
+        if obj_id == 3:
+            return httpx.Response(404, json={"message": "404 Not Found"})
+        return httpx.Response(200, json={"id": obj_id})
+
+    respx_mock.get(url__regex=r"http://localhost/api/v4/tests/\d+").mock(
+        side_effect=side_effect
+    )
+
+    mgr = M(gl_async)
+    results = await mgr.get_many(range(1, 8), concurrency=2)
+    assert [getattr(obj, "id", None) for obj in results] == [1, 2, None, 4, 5, 6, 7]
+    assert isinstance(results[2], GitlabGetError)
+    assert max_in_flight == 2
+
+
+@pytest.mark.anyio
+async def test_get_many_mixin_with_list_threshold(gl_async, respx_mock):
+    class M(GetMixin, ListMixin, FakeManager):
+        _list_filters = ("id_after", "id_before")
+
+    route = respx_mock.get(
+        "http://localhost/api/v4/tests", params={"id_after": "9", "id_before": "13"}
+    ).mock(return_value=httpx.Response(200, json=[{"id": 12}, {"id": 10}]))
+
+    mgr = M(gl_async)
+    results = await mgr.get_many([10, 12], list_threshold=2)
+    assert [obj.id for obj in results] == [10, 12]
+    assert route.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_refresh_mixin(gl_async, respx_mock):
+    class TestClass(RefreshMixin, FakeObject):
+        pass
+
+    respx_mock.get("http://localhost/api/v4/tests/42").mock(
+        return_value=httpx.Response(200, json={"id": 42, "foo": "bar"})
+    )
+
+    mgr = FakeManager(gl_async)
+    obj = TestClass(mgr, {"id": 42})
+    res = await obj.refresh()
+    assert res is None
+    assert obj.foo == "bar"
+
+
+@pytest.mark.anyio
+async def test_list_mixin(gl_async, respx_mock):
+    class M(ListMixin, FakeManager):
+        pass
+
+    respx_mock.get("http://localhost/api/v4/tests").mock(
+        return_value=httpx.Response(200, json=[{"id": 42, "foo": "bar"}, {"id": 43}])
+    )
+
+    mgr = M(gl_async)
+    obj_list = await mgr.list()
+    assert isinstance(obj_list, list)
+    assert [obj.id for obj in obj_list] == [42, 43]
+    assert all(obj._created_from_list for obj in obj_list)
+
+
+@pytest.mark.anyio
+async def test_list_mixin_iterator(gl_async, respx_mock):
+    class M(ListMixin, FakeManager):
+        pass
+
+    url = "http://localhost/api/v4/tests"
+    respx_mock.get(url, params={"page": "2"}).mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 43}],
+            headers={"X-Page": "2", "X-Total-Pages": "2", "X-Total": "2"},
+        )
+    )
+    respx_mock.get(url).mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 42}],
+            headers={
+                "Link": f'<{url}?page=2>; rel="next"',
+                "X-Page": "1",
+                "X-Next-Page": "2",
+                "X-Total-Pages": "2",
+                "X-Total": "2",
+            },
+        )
+    )
+
+    mgr = M(gl_async)
+    obj_list = mgr.list(iterator=True)
+    assert isinstance(obj_list, base.AsyncRESTObjectList)
+
+    ids = [obj.id async for obj in obj_list]
+    assert ids == [42, 43]
+    assert obj_list.total == 2
+    assert obj_list.total_pages == 2
+
+
+@pytest.mark.anyio
+async def test_list_mixin_as_dicts(gl_async, respx_mock):
+    class M(ListMixin, FakeManager):
+        pass
+
+    items = [{"id": 42, "foo": "bar"}, {"id": 43, "foo": "baz"}]
+    respx_mock.get("http://localhost/api/v4/tests").mock(
+        return_value=httpx.Response(200, json=items)
+    )
+
+    mgr = M(gl_async)
+    assert await mgr.list(as_dicts=True) == items
+
+    obj_list = mgr.list(iterator=True, as_dicts=True)
+    assert isinstance(obj_list, base.AsyncRESTObjectList)
+    assert [item async for item in obj_list] == items
+
+
+@pytest.mark.anyio
+async def test_list_mixin_fields(gl_async, respx_mock):
+    class M(GetMixin, ListMixin, FakeManager):
+        pass
+
+    respx_mock.get("http://localhost/api/v4/tests/42").mock(
+        return_value=httpx.Response(200, json={"id": 42, "foo": "bar", "big": 1})
+    )
+    respx_mock.get("http://localhost/api/v4/tests").mock(
+        return_value=httpx.Response(200, json=[{"id": 42, "foo": "bar", "big": 1}])
+    )
+
+    mgr = M(gl_async)
+    obj = await mgr.get(42, fields=["foo"])
+    assert obj._attrs == {"id": 42, "foo": "bar"}
+
+    objs = await mgr.list(fields=["foo"])
+    assert [obj._attrs for obj in objs] == [{"id": 42, "foo": "bar"}]
+
+    items = mgr.list(iterator=True, as_dicts=True, fields=["foo"])
+    assert [item async for item in items] == [{"id": 42, "foo": "bar"}]
+
+
+@pytest.mark.anyio
+async def test_list_mixin_raises_list_error(gl_async, respx_mock):
+    class M(ListMixin, FakeManager):
+        pass
+
+    respx_mock.get("http://localhost/api/v4/tests").mock(
+        return_value=httpx.Response(403, json={"message": "403 Forbidden"})
+    )
+
+    mgr = M(gl_async)
+    with pytest.raises(GitlabListError):
+        await mgr.list()
+
+
+@pytest.mark.anyio
+async def test_create_mixin(gl_async, respx_mock):
+    class M(CreateMixin, FakeManager):
+        _create_attrs = gl_types.RequiredOptional(
+            required=("foo",), optional=("bar", "baz")
+        )
+
+    route = respx_mock.post("http://localhost/api/v4/tests").mock(
+        return_value=httpx.Response(200, json={"id": 42, "foo": "bar"})
+    )
+
+    mgr = M(gl_async)
+    obj = await mgr.create({"foo": "bar"})
+    assert isinstance(obj, FakeObject)
+    assert obj.id == 42
+    assert route.calls.last.request.content == b'{"foo":"bar"}'
+
+
+@pytest.mark.anyio
+async def test_save_mixin(gl_async, respx_mock):
+    class M(UpdateMixin, FakeManager):
+        pass
+
+    class TestClass(SaveMixin, base.RESTObject):
+        pass
+
+    respx_mock.put("http://localhost/api/v4/tests/42").mock(
+        return_value=httpx.Response(200, json={"id": 42, "foo": "baz"})
+    )
+
+    mgr = M(gl_async)
+    obj = TestClass(mgr, {"id": 42, "foo": "bar"})
+    obj.foo = "baz"
+    result = await obj.save()
+    assert result == {"id": 42, "foo": "baz"}
+    assert obj._attrs["foo"] == "baz"
+    assert obj._updated_attrs == {}
+
+
+@pytest.mark.anyio
+async def test_save_mixin_without_changes(gl_async):
+    class M(UpdateMixin, FakeManager):
+        pass
+
+    class TestClass(SaveMixin, base.RESTObject):
+        pass
+
+    mgr = M(gl_async)
+    obj = TestClass(mgr, {"id": 42, "foo": "bar"})
+    assert await obj.save() is None
+
+
+@pytest.mark.anyio
+async def test_delete_mixin(gl_async, respx_mock):
+    class M(DeleteMixin, FakeManager):
+        pass
+
+    class TestClass(ObjectDeleteMixin, base.RESTObject):
+        pass
+
+    route = respx_mock.delete("http://localhost/api/v4/tests/42").mock(
+        return_value=httpx.Response(204)
+    )
+
+    mgr = M(gl_async)
+    assert await mgr.delete(42) is None
+    assert await TestClass(mgr, {"id": 42}).delete() is None
+    assert route.call_count == 2
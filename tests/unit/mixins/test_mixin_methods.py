@@ -1,11 +1,10 @@
-from unittest.mock import mock_open, patch
-
 import pytest
 import requests
 import responses
 
-from gitlab import base, GitlabUploadError
+from gitlab import base, Gitlab, GitlabGetError, GitlabUploadError
 from gitlab import types as gl_types
+from gitlab.cache import TTLCache
 from gitlab.mixins import (
     CreateMixin,
     DeleteMixin,
@@ -53,6 +52,115 @@ def test_get_mixin(gl):
     assert responses.assert_call_count(url, 1) is True
 
 
+@responses.activate
+def test_get_mixin_response_cache(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    class Uncached(GetMixin, FakeManager):
+        pass
+
+    url = "http://localhost/api/v4/tests/42"
+    responses.add(method=responses.GET, url=url, json={"id": 42, "foo": "bar"})
+    gl.response_cache = TTLCache({M: 300})
+
+    mgr = M(gl)
+    obj = mgr.get(42)
+    obj.foo = "baz"
+    cached = mgr.get(42)
+    assert cached.foo == "bar"
+    assert cached is not obj
+    assert responses.assert_call_count(url, 1) is True
+
+    mgr.get(42, statistics=True)
+    Uncached(gl).get(42)
+    assert len(responses.calls) == 3
+    assert (gl.response_cache.hits, gl.response_cache.misses) == (1, 2)
+
+
+@responses.activate
+def test_get_mixin_response_cache_keys_on_credentials():
+    class M(GetMixin, FakeManager):
+        pass
+
+    url = "http://localhost/api/v4/tests/42"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json={"id": 42, "foo": "a"},
+        match=[responses.matchers.header_matcher({"PRIVATE-TOKEN": "a"})],
+    )
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json={"id": 42, "foo": "b"},
+        match=[responses.matchers.header_matcher({"PRIVATE-TOKEN": "b"})],
+    )
+    response_cache = TTLCache({M: 300})
+    gl_a = Gitlab("http://localhost", private_token="a", response_cache=response_cache)
+    gl_b = Gitlab("http://localhost", private_token="b", response_cache=response_cache)
+
+    assert M(gl_a).get(42).foo == "a"
+    assert M(gl_b).get(42).foo == "b"
+    assert M(gl_b).get(42).foo == "b"
+    assert len(responses.calls) == 2
+    assert len(response_cache) == 2
+
+
+@responses.activate
+def test_writes_invalidate_response_cache(gl):
+    class M(GetMixin, CreateMixin, UpdateMixin, DeleteMixin, FakeManager):
+        pass
+
+    class TestClass(SaveMixin, base.RESTObject):
+        pass
+
+    M._obj_cls = TestClass
+    url = "http://localhost/api/v4/tests/42"
+    responses.add(method=responses.GET, url=url, json={"id": 42, "foo": "bar"})
+    responses.add(method=responses.PUT, url=url, json={"id": 42, "foo": "baz"})
+    responses.add(method=responses.DELETE, url=url, status=204)
+    responses.add(
+        method=responses.POST,
+        url="http://localhost/api/v4/tests",
+        json={"id": 43, "foo": "bar"},
+    )
+    gl.response_cache = TTLCache({M: 300})
+    mgr = M(gl)
+
+    obj = mgr.get(42)
+    obj.foo = "baz"
+    obj.save()
+    assert len(gl.response_cache) == 0
+
+    mgr.get(42)
+    mgr.delete(42)
+    assert len(gl.response_cache) == 0
+
+    mgr.get(42)
+    mgr.create({"foo": "bar"})
+    assert len(gl.response_cache) == 0
+    assert responses.assert_call_count(url, 5) is True
+
+
+@responses.activate
+def test_get_mixin_fields(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    url = "http://localhost/api/v4/tests/42"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json={"id": 42, "foo": "bar", "big": {"a": 1}},
+        status=200,
+        match=[responses.matchers.query_param_matcher({})],
+    )
+
+    obj = M(gl).get(42, fields=["foo"])
+    assert obj._attrs == {"id": 42, "foo": "bar"}
+
+
 def test_get_mixin_lazy(gl):
     class M(GetMixin, FakeManager):
         pass
@@ -115,6 +223,123 @@ def test_head_mixin(gl):
     assert result["x-gitlab-header"] == "test"
 
 
+@responses.activate
+def test_get_many_mixin(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    for obj_id in (1, 2, 4):
+        responses.add(
+            method=responses.GET,
+            url=f"http://localhost/api/v4/tests/{obj_id}",
+            json={"id": obj_id},
+            status=200,
+        )
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests/3",
+        json={"message": "404 Not Found"},
+        status=404,
+    )
+
+    mgr = M(gl)
+    results = mgr.get_many([4, 3, 2, 1], concurrency=3)
+    assert [getattr(obj, "id", None) for obj in results] == [4, None, 2, 1]
+    assert isinstance(results[1], GitlabGetError)
+    assert results[1].response_code == 404
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_get_many_mixin_connection_error(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests/1",
+        json={"id": 1},
+        status=200,
+    )
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests/2",
+        body=requests.ConnectionError("connection reset"),
+    )
+
+    results = M(gl).get_many([1, 2])
+    assert results[0].id == 1
+    assert isinstance(results[1], GitlabGetError)
+    assert "connection reset" in str(results[1])
+    assert isinstance(results[1].__cause__, requests.ConnectionError)
+
+
+def test_get_many_mixin_invalid_concurrency(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    with pytest.raises(ValueError):
+        M(gl).get_many([1], concurrency=0)
+
+
+@responses.activate
+def test_get_many_mixin_with_list_threshold(gl):
+    class M(GetMixin, ListMixin, FakeManager):
+        _list_filters = ("id_after", "id_before")
+
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests",
+        json=[{"id": 12}, {"id": 11}, {"id": 10}],
+        status=200,
+        match=[
+            responses.matchers.query_param_matcher({"id_after": "9", "id_before": "14"})
+        ],
+    )
+
+    mgr = M(gl)
+    results = mgr.get_many([10, 13, 12], list_threshold=3)
+    assert isinstance(results[0], FakeObject)
+    assert results[0].id == 10
+    assert isinstance(results[1], GitlabGetError)
+    assert results[2].id == 12
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_many_mixin_sparse_ids_above_list_threshold(gl):
+    class M(GetMixin, ListMixin, FakeManager):
+        _list_filters = ("id_after", "id_before")
+
+    for obj_id in (10, 1000):
+        responses.add(
+            method=responses.GET,
+            url=f"http://localhost/api/v4/tests/{obj_id}",
+            json={"id": obj_id},
+            status=200,
+        )
+
+    results = M(gl).get_many([10, 1000], list_threshold=2)
+    assert [obj.id for obj in results] == [10, 1000]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_get_many_mixin_below_list_threshold(gl):
+    class M(GetMixin, ListMixin, FakeManager):
+        _list_filters = ("id_after", "id_before")
+
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests/10",
+        json={"id": 10},
+        status=200,
+    )
+
+    results = M(gl).get_many([10], list_threshold=2)
+    assert results[0].id == 10
+
+
 @responses.activate
 def test_refresh_mixin(gl):
     class TestClass(RefreshMixin, FakeObject):
@@ -228,6 +453,88 @@ def test_list_mixin_with_attributes(gl):
     mgr.list(iterator=True, my_array=[1, 2, 3])
 
 
+@responses.activate
+def test_list_mixin_as_dicts(gl):
+    class M(ListMixin, FakeManager):
+        pass
+
+    url = "http://localhost/api/v4/tests"
+    items = [{"id": 42, "foo": "bar"}, {"id": 43, "foo": "baz"}]
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=items,
+        status=200,
+        match=[responses.matchers.query_param_matcher({})],
+    )
+
+    mgr = M(gl)
+    assert mgr.list(as_dicts=True) == items
+
+    obj_list = mgr.list(iterator=True, as_dicts=True)
+    assert isinstance(obj_list, base.RESTObjectList)
+    assert list(obj_list) == items
+
+
+@responses.activate
+def test_list_mixin_fields(gl):
+    class M(ListMixin, FakeManager):
+        pass
+
+    url = "http://localhost/api/v4/tests"
+    headers = {"Link": f'<{url}?page=2>; rel="next"'}
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 42, "foo": "bar", "big": {"a": 1}}],
+        headers=headers,
+        match=[responses.matchers.query_param_matcher({})],
+    )
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 43, "foo": "baz", "big": {"a": 2}}],
+        match=[responses.matchers.query_param_matcher({"page": "2"})],
+    )
+
+    mgr = M(gl)
+    objs = mgr.list(get_all=True, fields=["foo"])
+    assert [obj._attrs for obj in objs] == [
+        {"id": 42, "foo": "bar"},
+        {"id": 43, "foo": "baz"},
+    ]
+
+    items = mgr.list(iterator=True, as_dicts=True, fields=["foo"])
+    assert list(items) == [{"id": 42, "foo": "bar"}, {"id": 43, "foo": "baz"}]
+
+    with pytest.raises(TypeError):
+        mgr.list(fields="foo")
+
+
+@responses.activate
+def test_list_mixin_fields_simple(gl):
+    class M(ListMixin, FakeManager):
+        _simple_fields = frozenset({"id", "name"})
+
+    url = "http://localhost/api/v4/tests"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 42, "name": "bar"}],
+        match=[responses.matchers.query_param_matcher({"simple": "True"})],
+    )
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 42, "name": "bar", "foo": "baz"}],
+        match=[responses.matchers.query_param_matcher({})],
+    )
+
+    mgr = M(gl)
+    assert mgr.list(fields=["name"], as_dicts=True) == [{"id": 42, "name": "bar"}]
+    assert mgr.list(fields=["foo"], as_dicts=True) == [{"id": 42, "foo": "baz"}]
+
+
 @responses.activate
 def test_list_other_url(gl):
     class M(ListMixin, FakeManager):
@@ -574,7 +881,7 @@ def test_upload_mixin_with_filedata(gl):
 
 
 @responses.activate
-def test_upload_mixin_with_filepath(gl):
+def test_upload_mixin_with_filepath(gl, tmp_path):
     class TestClass(UploadMixin, FakeObject):
         _upload_path = "/tests/{id}/uploads"
 
@@ -589,10 +896,44 @@ def test_upload_mixin_with_filepath(gl):
 
     mgr = FakeManager(gl)
     obj = TestClass(mgr, {"id": 42})
-    with patch("builtins.open", mock_open(read_data="raw\nfile\ndata")):
-        res_only_path = obj.upload("test.txt", None, "/filepath")
+    path = tmp_path / "test.txt"
+    path.write_bytes(b"raw\nfile\ndata")
+    res_only_path = obj.upload("test.txt", None, str(path))
     assert obj._get_upload_path() == "/tests/42/uploads"
     assert isinstance(res_only_path, dict)
     assert res_only_path["file_name"] == "test.txt"
     assert res_only_path["file_content"] == "testing contents"
     assert responses.assert_call_count(url, 1) is True
+
+
+@responses.activate
+def test_upload_mixin_retry_sends_file_again(gl, tmp_path):
+    class TestClass(UploadMixin, FakeObject):
+        _upload_path = "/tests/{id}/uploads"
+
+    bodies = []
+
+    def request_callback(request):
+        bodies.append(request.body)
+        return (500 if len(bodies) == 1 else 201, {}, '{"id": 42}')
+
+    url = "http://localhost/api/v4/tests/42/uploads"
+    responses.add_callback(
+        method=responses.POST,
+        url=url,
+        callback=request_callback,
+        content_type="application/json",
+    )
+
+    mgr = FakeManager(gl)
+    obj = TestClass(mgr, {"id": 42})
+    path = tmp_path / "test.txt"
+    path.write_bytes(b"raw\nfile\ndata")
+    obj.upload("test.txt", filepath=str(path), retry_transient_errors=True)
+
+    assert len(bodies) == 2
+    assert b"raw\nfile\ndata" in bodies[0]
+    assert b"raw\nfile\ndata" in bodies[1]
+    for body, call in zip(bodies, responses.calls):
+        boundary = body.split(b"\r\n", 1)[0][2:].decode()
+        assert boundary in call.request.headers["Content-type"]
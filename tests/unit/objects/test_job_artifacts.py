@@ -24,6 +24,19 @@ def resp_artifacts_by_ref_name(binary_content):
         yield rsps
 
 
+@pytest.fixture
+def resp_job_artifacts(binary_content):
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.GET,
+            url="http://localhost/api/v4/projects/1/jobs/123/artifacts",
+            body=binary_content,
+            content_type="application/octet-stream",
+            status=200,
+        )
+        yield rsps
+
+
 @pytest.fixture
 def resp_project_artifacts_delete():
     with responses.RequestsMock() as rsps:
@@ -70,3 +83,13 @@ def test_job_artifact_download_bytes_range(
 
     artifacts = job.artifacts(extra_headers={"Range": "bytes=0-9"})
     assert len(artifacts) == 10
+
+
+def test_job_artifacts_download_to(gl, binary_content, resp_job_artifacts, tmp_path):
+    project = gl.projects.get(1, lazy=True)
+    job = project.jobs.get(123, lazy=True)
+    path = tmp_path / "artifacts.zip"
+
+    stats = job.artifacts(download_to=path)
+    assert path.read_bytes() == binary_content
+    assert stats.size == len(binary_content)
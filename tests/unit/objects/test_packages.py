@@ -2,6 +2,7 @@
 GitLab API: https://docs.gitlab.com/ce/api/packages.html
 """
 
+import json
 import re
 
 import pytest
@@ -417,6 +418,29 @@ def test_upload_generic_package_file(tmp_path, project, resp_upload_generic_pack
     assert isinstance(package, GenericPackage)
 
 
+def test_upload_generic_package_streams_file(tmp_path, project, created_content):
+    path = tmp_path / file_name
+    path.write_bytes(b"x" * 3000)
+    progress = []
+
+    def callback(request):
+        assert request.headers["Content-Length"] == "3000"
+        assert request.body == b"x" * 3000
+        return 201, {}, json.dumps(created_content)
+
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(responses.PUT, package_url, callback=callback)
+        project.generic_packages.upload(
+            package_name=package_name,
+            package_version=package_version,
+            file_name=file_name,
+            path=path,
+            progress=lambda sent, size: progress.append((sent, size)),
+        )
+
+    assert progress == [(3000, 3000)]
+
+
 def test_download_generic_package(project, resp_download_generic_package):
     package = project.generic_packages.download(
         package_name=package_name, package_version=package_version, file_name=file_name
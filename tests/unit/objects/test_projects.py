@@ -2,8 +2,6 @@
 GitLab API: https://docs.gitlab.com/ce/api/projects.html
 """
 
-from unittest.mock import mock_open, patch
-
 import pytest
 import responses
 
@@ -664,9 +662,10 @@ def test_upload_file(project, resp_upload_file_project):
     project.upload("filename.png", "raw\nfile\ndata")
 
 
-def test_upload_file_with_filepath(project, resp_upload_file_project):
-    with patch("builtins.open", mock_open(read_data="raw\nfile\ndata")):
-        project.upload("filename.png", None, "/filepath")
+def test_upload_file_with_filepath(project, resp_upload_file_project, tmp_path):
+    path = tmp_path / "filename.png"
+    path.write_bytes(b"raw\nfile\ndata")
+    project.upload("filename.png", None, str(path))
 
 
 def test_upload_file_without_filepath_nor_filedata(project):
@@ -0,0 +1,896 @@
+import asyncio
+import json
+import time
+from unittest import mock
+
+import anyio
+import httpx
+import pytest
+
+import gitlab
+from gitlab import utils
+from gitlab.async_client import ConcurrencyLimiter
+from gitlab.cache import MemoryCache
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_as_context_manager_aexits():
+    async with gitlab.AsyncGitlab("http://localhost") as gl:
+        client = gl.client
+        assert isinstance(gl, gitlab.AsyncGitlab)
+        assert not client.is_closed
+
+    assert client.is_closed
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_aclose(gl_async):
+    await gl_async.aclose()
+
+    assert gl_async.client.is_closed
+
+
+def test_async_gitlab_pool_options():
+    gl = gitlab.AsyncGitlab(
+        "http://localhost",
+        max_connections=10,
+        max_keepalive_connections=4,
+        keepalive_expiry=60.0,
+    )
+    pool = gl.client._transport._pool
+
+    assert pool._max_connections == 10
+    assert pool._max_keepalive_connections == 4
+    assert pool._keepalive_expiry == 60.0
+
+
+def test_async_gitlab_uses_provided_client():
+    client = httpx.AsyncClient()
+    gl = gitlab.AsyncGitlab("http://localhost", client=client)
+
+    assert gl.client is client
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_requests_share_client(gl_async, respx_mock):
+    route = respx_mock.get("http://localhost/api/v4/user").mock(
+        return_value=httpx.Response(200, json={"id": 1})
+    )
+    client = gl_async.client
+
+    await gl_async.get("/user")
+    await gl_async.get("/user")
+
+    assert route.call_count == 2
+    assert gl_async.client is client
+    assert route.calls.last.request.headers["PRIVATE-TOKEN"] == "private_token"
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_object_custom_action(gl_async, respx_mock):
+    respx_mock.get("http://localhost/api/v4/projects/1").mock(
+        return_value=httpx.Response(200, json={"id": 1, "star_count": 0})
+    )
+    route = respx_mock.post("http://localhost/api/v4/projects/1/star").mock(
+        return_value=httpx.Response(201, json={"id": 1, "star_count": 1})
+    )
+
+    project = await gl_async.projects.get(1)
+    assert await project.star() is None
+
+    assert route.call_count == 1
+    assert project.star_count == 1
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_object_custom_action_raises(gl_async, respx_mock):
+    respx_mock.post("http://localhost/api/v4/projects/1/star").mock(
+        return_value=httpx.Response(500, json={"message": "Internal error"})
+    )
+
+    project = gl_async.projects.get(1, lazy=True)
+    with pytest.raises(gitlab.GitlabCreateError):
+        await project.star()
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_object_download(gl_async, respx_mock):
+    content = b"snippet content"
+    respx_mock.get("http://localhost/api/v4/snippets/1/raw").mock(
+        return_value=httpx.Response(200, content=content)
+    )
+    snippet = gl_async.snippets.get(1, lazy=True)
+
+    assert await snippet.content() == content
+
+    chunks = []
+    assert await snippet.content(streamed=True, action=chunks.append) is None
+    assert b"".join(chunks) == content
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("parent", ["projects", "groups"])
+async def test_async_gitlab_label_save(gl_async, respx_mock, parent):
+    route = respx_mock.put(f"http://localhost/api/v4/{parent}/1/labels").mock(
+        return_value=httpx.Response(200, json={"name": "bug", "color": "#FF0000"})
+    )
+    manager = getattr(gl_async, parent).get(1, lazy=True).labels
+    label = manager.get("bug", lazy=True)
+    label.color = "#FF0000"
+
+    assert await label.save() is None
+
+    assert route.call_count == 1
+    assert json.loads(route.calls.last.request.content) == {
+        "name": "bug",
+        "color": "#FF0000",
+    }
+    assert label.color == "#FF0000"
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_object_download_to(gl_async, respx_mock, tmp_path):
+    content = b"snippet content" * 1000
+    respx_mock.get("http://localhost/api/v4/snippets/1/raw").mock(
+        return_value=httpx.Response(200, content=content)
+    )
+    snippet = gl_async.snippets.get(1, lazy=True)
+    path = tmp_path / "snippet.txt"
+
+    stats = await snippet.content(download_to=path)
+    assert path.read_bytes() == content
+    assert stats.size == len(content)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_download_resumes_after_connection_error(
+    gl_async, respx_mock, tmp_path
+):
+    content = bytes(range(256)) * 100
+    requests = []
+
+    def artifacts(request):
+        requests.append(request)
+        if "Range" not in request.headers:
+            # The connection is closed after the first 1000 bytes
+            return httpx.Response(
+                200,
+                headers={"Content-Length": str(len(content)), "ETag": '"v1"'},
+                content=content[:1000],
+            )
+        return httpx.Response(
+            206,
+            headers={
+                "Content-Range": f"bytes 1000-{len(content) - 1}/{len(content)}",
+                "ETag": '"v1"',
+            },
+            content=content[1000:],
+        )
+
+    respx_mock.get("http://localhost/api/v4/projects/1/jobs/1/artifacts").mock(
+        side_effect=artifacts
+    )
+    job = gl_async.projects.get(1, lazy=True).jobs.get(1, lazy=True)
+    path = tmp_path / "artifacts.zip"
+
+    stats = await job.artifacts(download_to=path, retry_transient_errors=True)
+
+    assert path.read_bytes() == content
+    assert stats.retries == 1
+    assert requests[1].headers["Range"] == "bytes=1000-"
+    assert requests[1].headers["If-Range"] == '"v1"'
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("max_concurrency", [None, 1])
+async def test_async_gitlab_download_in_segments(
+    gl_async, respx_mock, tmp_path, monkeypatch, max_concurrency
+):
+    monkeypatch.setattr(utils, "DOWNLOAD_MIN_SEGMENT_SIZE", 1000)
+    gl_async.concurrency_limiter = ConcurrencyLimiter(max_concurrency)
+    content = bytes(range(256)) * 100
+    ranges = []
+
+    def package(request):
+        headers = {"ETag": '"v1"', "Accept-Ranges": "bytes"}
+        if "Range" not in request.headers:
+            return httpx.Response(200, headers=headers, content=content)
+        ranges.append(request.headers["Range"])
+        start, end = map(int, request.headers["Range"][6:].split("-"))
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(content)}"
+        return httpx.Response(206, headers=headers, content=content[start : end + 1])
+
+    respx_mock.get(
+        "http://localhost/api/v4/projects/1/packages/generic/pkg/1.0/pkg.tar.gz"
+    ).mock(side_effect=package)
+    packages = gl_async.projects.get(1, lazy=True).generic_packages
+    path = tmp_path / "pkg.tar.gz"
+
+    # Each segment holds a slot until it is read
+    with anyio.fail_after(5):
+        stats = await packages.download(
+            "pkg", "1.0", "pkg.tar.gz", download_to=path, segments=3
+        )
+
+    assert path.read_bytes() == content
+    assert stats.segments == 3
+    assert sorted(ranges) == ["bytes=17066-25599", "bytes=8533-17065"]
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_upload_streams_file(gl_async, respx_mock, tmp_path):
+    path = tmp_path / "pkg.tar.gz"
+    path.write_bytes(b"x" * 3000)
+    route = respx_mock.put(
+        "http://localhost/api/v4/projects/1/packages/generic/pkg/1.0/pkg.tar.gz"
+    ).mock(return_value=httpx.Response(201, json={"id": 1}))
+    progress = []
+    packages = gl_async.projects.get(1, lazy=True).generic_packages
+
+    package = await packages.upload(
+        "pkg",
+        "1.0",
+        "pkg.tar.gz",
+        path=path,
+        progress=lambda sent, size: progress.append((sent, size)),
+    )
+
+    assert package.id == 1
+    request = route.calls.last.request
+    assert request.headers["Content-Length"] == "3000"
+    assert "Transfer-Encoding" not in request.headers
+    assert request.content == b"x" * 3000
+    assert progress == [(3000, 3000)]
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_import_project_streams_multipart_body(
+    gl_async, respx_mock, tmp_path
+):
+    path = tmp_path / "export.tar.gz"
+    path.write_bytes(b"x" * 3000)
+    route = respx_mock.post("http://localhost/api/v4/projects/import").mock(
+        return_value=httpx.Response(201, json={"id": 1, "import_status": "scheduled"})
+    )
+
+    with open(path, "rb") as f:
+        await gl_async.projects.import_project(f, path="project", overwrite=True)
+
+    request = route.calls.last.request
+    boundary = request.headers["Content-Type"].split("boundary=")[1]
+    assert request.headers["Content-Length"] == str(len(request.content))
+    assert "Transfer-Encoding" not in request.headers
+    assert request.content.endswith(f"--{boundary}--\r\n".encode())
+    assert b'name="overwrite"\r\n\r\nTrue\r\n' in request.content
+    assert b'filename="file.tar.gz"' in request.content
+    assert b"\r\n\r\n" + b"x" * 3000 + b"\r\n" in request.content
+
+
+def _mock_pages(respx_mock, pages):
+    url = "http://localhost/api/v4/tests"
+    routes = []
+    for number, items in enumerate(pages, start=1):
+        headers = {
+            "X-Page": str(number),
+            "X-Per-Page": str(len(pages[0])),
+            "X-Total-Pages": str(len(pages)),
+            "X-Total": str(sum(len(page) for page in pages)),
+        }
+        if number < len(pages):
+            headers["Link"] = f'<{url}?page={number + 1}>; rel="next"'
+            headers["X-Next-Page"] = str(number + 1)
+        if number > 1:
+            headers["X-Prev-Page"] = str(number - 1)
+        params = {"page": str(number)} if number > 1 else {}
+        routes.append((params, httpx.Response(200, json=items, headers=headers)))
+    # The routes without page parameter match any page, so they go last
+    return [
+        respx_mock.get(url, params=params).mock(return_value=response)
+        for params, response in reversed(routes)
+    ][::-1]
+
+
+def test_async_gitlab_list_pagination_before_iteration(gl_async):
+    gl_list = gl_async.http_list("/tests", iterator=True)
+
+    assert gl_list.current_page is None
+    assert gl_list.prev_page is None
+    assert gl_list.next_page is None
+    assert gl_list.per_page is None
+    assert gl_list.total_pages is None
+    assert gl_list.total is None
+    assert len(gl_list) == 0
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_list_iterates_all_pages(gl_async, respx_mock):
+    _mock_pages(respx_mock, [[{"id": 1}, {"id": 2}], [{"id": 3}]])
+
+    gl_list = gl_async.http_list("/tests", iterator=True)
+    assert isinstance(gl_list, gitlab.AsyncGitlabList)
+
+    first = await gl_list.next()
+    assert first == {"id": 1}
+    assert gl_list.current_page == 1
+    assert gl_list.next_page == 2
+    assert gl_list.total == 3
+    assert gl_list.total_pages == 2
+
+    items = [item async for item in gl_list]
+    assert items == [{"id": 2}, {"id": 3}]
+    assert gl_list.current_page == 2
+    assert gl_list.prev_page == 1
+    assert gl_list.next_page is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_async_gitlab_list_prefetches_next_page(gl_async, respx_mock):
+    routes = _mock_pages(respx_mock, [[{"id": 1}], [{"id": 2}], [{"id": 3}]])
+
+    gl_list = gl_async.http_list("/tests", iterator=True)
+    assert await gl_list.next() == {"id": 1}
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    # page 2 is fetched while page 1 is consumed, but not page 3
+    assert [route.call_count for route in routes] == [1, 1, 0]
+
+    assert await gl_list.next() == {"id": 2}
+    assert [item async for item in gl_list] == [{"id": 3}]
+    assert [route.call_count for route in routes] == [1, 1, 1]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_async_gitlab_list_prefetch_depth(gl_async, respx_mock):
+    routes = _mock_pages(respx_mock, [[{"id": i}] for i in range(1, 6)])
+
+    gl_list = gl_async.http_list("/tests", iterator=True, prefetch=3)
+    await gl_list.next()
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    assert [route.call_count for route in routes] == [1, 1, 1, 1, 0]
+    assert [item["id"] async for item in gl_list] == [2, 3, 4, 5]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_async_gitlab_list_prefetch_disabled(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", list_prefetch=0)
+    routes = _mock_pages(respx_mock, [[{"id": 1}], [{"id": 2}]])
+
+    gl_list = gl.http_list("/tests", iterator=True)
+    await gl_list.next()
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert [route.call_count for route in routes] == [1, 0]
+    assert [item async for item in gl_list] == [{"id": 2}]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_async_gitlab_list_prefetch_error(gl_async, respx_mock):
+    url = "http://localhost/api/v4/tests"
+    respx_mock.get(url, params={"page": "2"}).mock(
+        return_value=httpx.Response(500, json={"message": "Internal error"})
+    )
+    respx_mock.get(url).mock(
+        return_value=httpx.Response(
+            200, json=[{"id": 1}], headers={"Link": f'<{url}?page=2>; rel="next"'}
+        )
+    )
+
+    gl_list = gl_async.http_list("/tests", iterator=True)
+    assert await gl_list.next() == {"id": 1}
+    with pytest.raises(gitlab.GitlabHttpError):
+        await gl_list.next()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_async_gitlab_list_aclose_cancels_prefetch(gl_async, respx_mock):
+    _mock_pages(respx_mock, [[{"id": 1}], [{"id": 2}]])
+
+    gl_list = gl_async.http_list("/tests", iterator=True)
+    await gl_list.next()
+    task = gl_list._prefetch_task
+    assert task is not None
+
+    await gl_list.aclose()
+    assert task.done()
+    assert gl_list._prefetch_task is None
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_list_stream(gl_async, respx_mock):
+    routes = _mock_pages(respx_mock, [[{"id": 1}, {"id": 2}], [{"id": 3}]])
+
+    gl_list = gl_async.http_list("/tests", iterator=True, stream=True)
+    assert await gl_list.next() == {"id": 1}
+    assert gl_list.total_pages == 2
+    for _ in range(10):
+        await anyio.sleep(0)
+
+    # the next page is not fetched while the current one is being read
+    assert [route.call_count for route in routes] == [1, 0]
+    assert [item async for item in gl_list] == [{"id": 2}, {"id": 3}]
+    assert [route.call_count for route in routes] == [1, 1]
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_list_stream_all(gl_async, respx_mock):
+    _mock_pages(respx_mock, [[{"id": 1, "name": "a"}], [{"id": 2, "name": "b"}]])
+
+    items = await gl_async.http_list(
+        "/tests", get_all=True, concurrency=2, stream=True, fields=["id"]
+    )
+    assert items == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_list_stream_invalid_data(gl_async, respx_mock):
+    respx_mock.get("http://localhost/api/v4/tests").mock(
+        return_value=httpx.Response(200, content=b'[{"id": 1}, {"id"')
+    )
+
+    gl_list = gl_async.http_list("/tests", iterator=True, stream=True)
+    assert await gl_list.next() == {"id": 1}
+    with pytest.raises(gitlab.GitlabParsingError):
+        await gl_list.next()
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_list_aclose_closes_stream(gl_async, respx_mock):
+    _mock_pages(respx_mock, [[{"id": 1}, {"id": 2}]])
+
+    gl_list = gl_async.http_list("/tests", iterator=True, stream=True)
+    await gl_list.next()
+    await gl_list.aclose()
+
+    assert gl_list._items is None
+    assert [item async for item in gl_list] == []
+
+
+def test_async_gitlab_list_invalid_prefetch(gl_async):
+    with pytest.raises(ValueError):
+        gl_async.http_list("/tests", iterator=True, prefetch=-1)
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_list_all_concurrency(gl_async, respx_mock):
+    routes = _mock_pages(respx_mock, [[{"id": i}] for i in range(1, 6)])
+
+    items = await gl_async.http_list("/tests", get_all=True, concurrency=3)
+    assert [item["id"] for item in items] == [1, 2, 3, 4, 5]
+    assert [route.call_count for route in routes] == [1, 1, 1, 1, 1]
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_list_all_concurrency_cap(gl_async, respx_mock):
+    url = "http://localhost/api/v4/tests"
+    running = 0
+    max_running = 0
+
+    async def get_page(request):
+        nonlocal running, max_running
+        if "page" not in request.url.params:
+            headers = {
+                "Link": f'<{url}?page=2>; rel="next"',
+                "X-Page": "1",
+                "X-Total-Pages": "8",
+            }
+            return httpx.Response(200, json=[{"id": 1}], headers=headers)
+
+        running += 1
+        max_running = max(max_running, running)
+        await anyio.sleep(0.01)
+        running -= 1
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json=[{"id": page}])
+
+    respx_mock.get(url).mock(side_effect=get_page)
+
+    items = await gl_async.http_list("/tests", get_all=True, concurrency=2)
+    assert [item["id"] for item in items] == list(range(1, 9))
+    assert max_running == 2
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_list_all_concurrency_error(gl_async, respx_mock):
+    url = "http://localhost/api/v4/tests"
+    headers = {
+        "Link": f'<{url}?page=2>; rel="next"',
+        "X-Page": "1",
+        "X-Total-Pages": "3",
+    }
+    respx_mock.get(url, params={"page": "2"}).mock(
+        return_value=httpx.Response(403, json={"message": "403 Forbidden"})
+    )
+    respx_mock.get(url, params={"page": "3"}).mock(
+        return_value=httpx.Response(200, json=[{"id": 3}])
+    )
+    respx_mock.get(url).mock(
+        return_value=httpx.Response(200, json=[{"id": 1}], headers=headers)
+    )
+
+    with pytest.raises(gitlab.GitlabHttpError) as exc_info:
+        await gl_async.http_list("/tests", get_all=True, concurrency=2)
+    assert exc_info.value.response_code == 403
+
+
+@pytest.fixture
+def async_sleep(monkeypatch):
+    mock_sleep = mock.AsyncMock()
+    monkeypatch.setattr(gitlab.utils.AsyncRetry, "_sleep", mock_sleep)
+    return mock_sleep
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_retries_on_429_response(gl_async, respx_mock, async_sleep):
+    route = respx_mock.get("http://localhost/api/v4/projects/1").mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"id": 1}),
+        ]
+    )
+
+    assert await gl_async.http_get("/projects/1") == {"id": 1}
+    assert route.call_count == 2
+    async_sleep.assert_awaited_once_with(3.0)
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_retries_transient_errors(respx_mock, async_sleep):
+    gl = gitlab.AsyncGitlab("http://localhost", retry_transient_errors=True)
+    route = respx_mock.get("http://localhost/api/v4/projects/1").mock(
+        side_effect=[
+            httpx.ConnectError("connection refused"),
+            httpx.Response(502),
+            httpx.Response(200, json={"id": 1}),
+        ]
+    )
+
+    assert await gl.http_get("/projects/1") == {"id": 1}
+    assert route.call_count == 3
+    assert async_sleep.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_does_not_retry_transient_errors_by_default(
+    gl_async, respx_mock, async_sleep
+):
+    respx_mock.get("http://localhost/api/v4/projects/1").mock(
+        side_effect=httpx.ConnectError("connection refused")
+    )
+
+    with pytest.raises(gitlab.GitlabHttpError, match="connection refused"):
+        await gl_async.http_get("/projects/1")
+    async_sleep.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_retry_deadline(respx_mock, async_sleep):
+    gl = gitlab.AsyncGitlab("http://localhost", retry_deadline=5)
+    route = respx_mock.get("http://localhost/api/v4/projects/1").mock(
+        return_value=httpx.Response(429, headers={"Retry-After": "10"})
+    )
+
+    with pytest.raises(gitlab.GitlabHttpError) as e:
+        await gl.http_get("/projects/1")
+    assert e.value.response_code == 429
+    assert route.call_count == 1
+    async_sleep.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_rate_limiter_waits_for_reset(respx_mock, monkeypatch):
+    sleeps = []
+
+    async def async_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(gitlab.utils, "async_sleep", async_sleep)
+    limiter = gitlab.utils.RateLimiter()
+    gl = gitlab.AsyncGitlab("http://localhost", rate_limiter=limiter)
+    respx_mock.get("http://localhost/api/v4/user").mock(
+        return_value=httpx.Response(
+            200,
+            json={},
+            headers={
+                "RateLimit-Limit": "10",
+                "RateLimit-Remaining": "0",
+                "RateLimit-Reset": str(int(time.time()) + 30),
+            },
+        )
+    )
+
+    await gl.http_get("/user")
+    assert sleeps == []
+    await gl.http_get("/user")
+    assert len(sleeps) == 1
+    assert 28 < sleeps[0] <= 30
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_http2_active(gl_async, respx_mock):
+    route = respx_mock.get("http://localhost/api/v4/user").mock(
+        return_value=httpx.Response(200, json={})
+    )
+    await gl_async.http_get("/user")
+    assert not gl_async.http2_active
+
+    route.mock(
+        return_value=httpx.Response(
+            200, json={}, extensions={"http_version": b"HTTP/2"}
+        )
+    )
+    await gl_async.http_get("/user")
+    assert gl_async.http2_active
+
+
+def _track_concurrency(respx_mock, url, release):
+    state = {"in_flight": 0, "max_in_flight": 0, "paths": []}
+
+    async def side_effect(request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        state["paths"].append(request.url.path)
+        await release.wait()
+        state["in_flight"] -= 1
+        return httpx.Response(200, json={})
+
+    respx_mock.get(url__regex=rf"{url}.*").mock(side_effect=side_effect)
+    return state
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_max_concurrency(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", max_concurrency=2)
+    release = anyio.Event()
+    state = _track_concurrency(respx_mock, "http://localhost/api/v4/", release)
+
+    async with anyio.create_task_group() as tg:
+        for i in range(6):
+            tg.start_soon(gl.http_get, f"/projects/{i}")
+            await anyio.sleep(0.01)
+        assert state["in_flight"] == 2
+        assert gl.queue_depth == 4
+        release.set()
+
+    assert state["max_in_flight"] == 2
+    assert gl.queue_depth == 0
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_max_concurrency_is_fifo(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", max_concurrency=1)
+    release = anyio.Event()
+    state = _track_concurrency(respx_mock, "http://localhost/api/v4/", release)
+
+    async with anyio.create_task_group() as tg:
+        for i in range(6):
+            tg.start_soon(gl.http_get, f"/projects/{i}")
+            await anyio.sleep(0.01)
+        release.set()
+
+    assert state["paths"] == [f"/api/v4/projects/{i}" for i in range(6)]
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_max_concurrency_per_prefix(respx_mock):
+    gl = gitlab.AsyncGitlab(
+        "http://localhost",
+        max_concurrency_per_prefix={"/projects": 1, "/projects/1/jobs": 2},
+    )
+    release = anyio.Event()
+    state = _track_concurrency(respx_mock, "http://localhost/api/v4/", release)
+
+    paths = ["/projects/1", "/projects/2", "/projects/1/jobs", "/projects/1/jobs/3"]
+    paths += ["/projects/1/jobs/4", "/groups/1", "/groups/2"]
+    async with anyio.create_task_group() as tg:
+        for path in paths:
+            tg.start_soon(gl.http_get, path)
+            await anyio.sleep(0.01)
+        # 1 project, 2 jobs and the 2 unlimited groups
+        assert state["in_flight"] == 5
+        assert gl.concurrency_limiter.prefix_queue_depth("/projects") == 1
+        assert gl.concurrency_limiter.prefix_queue_depth("/projects/1/jobs/") == 1
+        assert gl.queue_depth == 2
+        release.set()
+
+    assert gl.queue_depth == 0
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_max_concurrency_holds_slot_while_streaming(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", max_concurrency=1)
+    respx_mock.get("http://localhost/api/v4/projects/1/export/download").mock(
+        return_value=httpx.Response(200, content=b"archive")
+    )
+    respx_mock.get("http://localhost/api/v4/projects/2").mock(
+        return_value=httpx.Response(200, json={"id": 2})
+    )
+
+    response = await gl.http_get("/projects/1/export/download", streamed=True, raw=True)
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(gl.http_get, "/projects/2")
+        await anyio.sleep(0.01)
+        assert gl.queue_depth == 1
+
+        assert await response.aread() == b"archive"
+        await anyio.sleep(0.01)
+        assert gl.queue_depth == 0
+
+    await response.aclose()
+    assert gl.concurrency_limiter._global.value == 1
+
+
+def test_async_gitlab_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        gitlab.AsyncGitlab("http://localhost", max_concurrency=0)
+    with pytest.raises(ValueError):
+        gitlab.AsyncGitlab("http://localhost", max_concurrency_per_prefix={"/a": 0})
+
+
+def _mock_slow_get(respx_mock, url, response):
+    async def side_effect(request):
+        await anyio.sleep(0.05)
+        return response
+
+    return respx_mock.get(url).mock(side_effect=side_effect)
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_coalesces_identical_gets(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", coalesce_requests=True)
+    route = _mock_slow_get(
+        respx_mock,
+        "http://localhost/api/v4/projects/1",
+        httpx.Response(200, json={"id": 1}),
+    )
+    results = []
+
+    async def get(**kwargs):
+        results.append(await gl.http_get("/projects/1", **kwargs))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(get)
+        tg.start_soon(lambda: get(query_data={"statistics": True}))
+
+    assert results == [{"id": 1}] * 6
+    assert route.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_coalesced_gets_share_errors(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", coalesce_requests=True)
+    route = _mock_slow_get(
+        respx_mock,
+        "http://localhost/api/v4/projects/1",
+        httpx.Response(404, json={"message": "404 Not Found"}),
+    )
+    errors = []
+
+    async def get():
+        try:
+            await gl.http_get("/projects/1")
+        except gitlab.GitlabHttpError as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(get)
+
+    assert len(errors) == 3
+    assert all(e.response_code == 404 for e in errors)
+    assert route.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_coalesced_get_survives_cancelled_leader(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", coalesce_requests=True)
+    sent = []
+
+    async def side_effect(request):
+        sent.append(request)
+        await anyio.sleep(0.05)
+        return httpx.Response(200, json={"id": 1})
+
+    respx_mock.get("http://localhost/api/v4/projects/1").mock(side_effect=side_effect)
+    leader_scope = anyio.CancelScope()
+    results = []
+
+    async def leader():
+        with leader_scope:
+            await gl.http_get("/projects/1")
+
+    async def follower():
+        results.append(await gl.http_get("/projects/1"))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(leader)
+        await anyio.sleep(0.01)
+        tg.start_soon(follower)
+        await anyio.sleep(0.01)
+        leader_scope.cancel()
+
+    # The follower sends the request again once the leader is cancelled
+    assert results == [{"id": 1}]
+    assert len(sent) == 2
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_does_not_coalesce_by_default(gl_async, respx_mock):
+    route = _mock_slow_get(
+        respx_mock,
+        "http://localhost/api/v4/projects/1",
+        httpx.Response(200, json={"id": 1}),
+    )
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(gl_async.http_get, "/projects/1")
+
+    assert route.call_count == 3
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_revalidates_cached_responses(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", http_cache=MemoryCache())
+    route = respx_mock.get("http://localhost/api/v4/projects/1").mock(
+        side_effect=[
+            httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"'}),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+        ]
+    )
+
+    assert await gl.http_get("/projects/1") == {"id": 1}
+    assert await gl.http_get("/projects/1") == {"id": 1}
+    assert "If-None-Match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_does_not_cache_without_validators(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", http_cache=MemoryCache())
+    route = respx_mock.get("http://localhost/api/v4/projects/1").mock(
+        return_value=httpx.Response(200, json={"id": 1})
+    )
+
+    await gl.http_get("/projects/1")
+    await gl.http_get("/projects/1")
+
+    assert "If-None-Match" not in route.calls[1].request.headers
+    assert len(gl.http_cache) == 0
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_encodes_json_with_codec(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", json_codec="orjson")
+    route = respx_mock.post("http://localhost/api/v4/projects").mock(
+        return_value=httpx.Response(201, json={"name": "é"})
+    )
+
+    result = await gl.http_post("/projects", post_data={"name": "é", "id": 2**70})
+
+    assert result == {"name": "é"}
+    request = route.calls[0].request
+    assert request.content == '{"name":"é","id":1180591620717411303424}'.encode()
+    assert request.headers["Content-type"] == "application/json"
+
+
+@pytest.mark.anyio
+async def test_async_gitlab_stdlib_codec_uses_backend_encoding(respx_mock):
+    gl = gitlab.AsyncGitlab("http://localhost", json_codec="json")
+    route = respx_mock.post("http://localhost/api/v4/projects").mock(
+        return_value=httpx.Response(201, json={})
+    )
+
+    await gl.http_post("/projects", post_data={"name": "project1"})
+
+    assert json.loads(route.calls[0].request.content) == {"name": "project1"}
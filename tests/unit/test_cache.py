@@ -0,0 +1,254 @@
+import pickle
+
+import pytest
+
+from gitlab import cache
+
+
+def _entry(content=b"{}", **kwargs):
+    return cache.CacheEntry(content=content, headers={}, etag='"etag"', **kwargs)
+
+
+def test_entry_from_response_requires_validator():
+    headers = {"Content-Type": "application/json"}
+    assert cache.CacheEntry.from_response(headers, b"{}") is None
+
+
+def test_entry_from_response():
+    headers = {
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+        "Content-Length": "2",
+        "ETag": 'W/"abc"',
+        "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+    entry = cache.CacheEntry.from_response(headers, b"{}")
+
+    assert entry.content == b"{}"
+    assert entry.headers == {
+        "Content-Type": "application/json",
+        "ETag": 'W/"abc"',
+        "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+    assert entry.conditional_headers() == {
+        "If-None-Match": 'W/"abc"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+
+
+def test_entry_revalidated():
+    entry = cache.CacheEntry(
+        content=b"{}",
+        headers={"Content-Type": "application/json", "ETag": '"1"', "X-Total": "1"},
+        etag='"1"',
+    )
+    revalidated = entry.revalidated(
+        {"ETag": '"2"', "Content-Length": "0", "Content-Type": "text/plain"}
+    )
+
+    assert revalidated.content == b"{}"
+    assert revalidated.etag == '"2"'
+    assert revalidated.headers == {
+        "Content-Type": "application/json",
+        "ETag": '"2"',
+        "X-Total": "1",
+    }
+
+
+def test_cache_key_hides_credentials():
+    key = cache.cache_key(("url", "[('PRIVATE-TOKEN', 'secret')]"))
+    assert "secret" not in key
+    assert key == cache.cache_key(("url", "[('PRIVATE-TOKEN', 'secret')]"))
+
+
+class TestMemoryCache:
+    def test_get_set_delete(self):
+        storage = cache.MemoryCache()
+        entry = _entry()
+
+        assert storage.get("a") is None
+        storage.set("a", entry)
+        assert storage.get("a") is entry
+        storage.delete("a")
+        storage.delete("a")
+        assert storage.get("a") is None
+        assert storage.size == 0
+
+    def test_evicts_least_recently_used(self):
+        entry_size = _entry(b"x" * 10).size
+        storage = cache.MemoryCache(max_bytes=entry_size * 2)
+        storage.set("a", _entry(b"a" * 10))
+        storage.set("b", _entry(b"b" * 10))
+        storage.get("a")
+        storage.set("c", _entry(b"c" * 10))
+
+        assert storage.get("b") is None
+        assert storage.get("a") is not None
+        assert storage.get("c") is not None
+        assert storage.size == entry_size * 2
+
+    def test_does_not_store_entries_over_budget(self):
+        storage = cache.MemoryCache(max_bytes=5)
+        storage.set("a", _entry(b"x" * 10))
+        assert len(storage) == 0
+
+    def test_replaces_entries(self):
+        storage = cache.MemoryCache()
+        storage.set("a", _entry(b"x" * 10))
+        storage.set("a", _entry(b"x"))
+        assert len(storage) == 1
+        assert storage.size == _entry(b"x").size
+
+    def test_clear(self):
+        storage = cache.MemoryCache()
+        storage.set("a", _entry())
+        storage.clear()
+        assert len(storage) == 0
+        assert storage.size == 0
+
+
+class TestDiskCache:
+    def test_get_set_delete(self, tmp_path):
+        storage = cache.DiskCache(tmp_path / "cache")
+        entry = cache.CacheEntry(
+            content=b"\x00binary",
+            headers={"Content-Type": "application/octet-stream"},
+            last_modified="Wed, 21 Oct 2015 07:28:00 GMT",
+        )
+
+        assert storage.get("a") is None
+        storage.set("a", entry)
+        assert storage.get("a") == entry
+        # Entries are shared with other instances using the same directory
+        assert cache.DiskCache(tmp_path / "cache").get("a") == entry
+        storage.delete("a")
+        storage.delete("a")
+        assert storage.get("a") is None
+
+    def test_ignores_corrupted_entries(self, tmp_path):
+        storage = cache.DiskCache(tmp_path)
+        (tmp_path / "a.json").write_text("{not json")
+        assert storage.get("a") is None
+
+    def test_clear(self, tmp_path):
+        storage = cache.DiskCache(tmp_path)
+        storage.set("a", _entry())
+        storage.set("b", _entry())
+        storage.clear()
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("storage_cls", [cache.MemoryCache, cache.DiskCache])
+def test_storages_implement_interface(storage_cls):
+    assert issubclass(storage_cls, cache.CacheStorage)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class TestTTLCache:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(cache, "time", clock)
+        return clock
+
+    def test_ttl_policies(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        class Never:
+            pass
+
+        class Other:
+            pass
+
+        ttl_cache = cache.TTLCache({Base: 300, Never: None}, default_ttl=60)
+
+        assert ttl_cache.ttl(Base) == 300
+        assert ttl_cache.ttl(Child) == 300
+        assert ttl_cache.ttl(Never) is None
+        assert ttl_cache.ttl(Other) == 60
+        assert cache.TTLCache({Base: 300}).ttl(Other) is None
+
+    def test_get_set_expiry(self, clock):
+        ttl_cache = cache.TTLCache()
+        key = ttl_cache.key("/projects/1", {"statistics": True})
+
+        assert ttl_cache.get(key) is None
+        ttl_cache.set(key, {"id": 1}, ttl=10)
+        assert ttl_cache.get(key) == {"id": 1}
+        assert ttl_cache.get(ttl_cache.key("/projects/1", {})) is None
+
+        clock.now += 10
+        assert ttl_cache.get(key) is None
+        assert len(ttl_cache) == 0
+        assert (ttl_cache.hits, ttl_cache.misses) == (1, 3)
+
+    def test_key_hashes_credentials(self):
+        key = cache.TTLCache.key("/projects/1", {}, ("token-a",))
+
+        assert key != cache.TTLCache.key("/projects/1", {}, ("token-b",))
+        assert key == cache.TTLCache.key("/projects/1", {}, ("token-a",))
+        assert "token-a" not in repr(key)
+
+    def test_returns_copies(self, clock):
+        ttl_cache = cache.TTLCache()
+        data = {"id": 1, "tags": ["a"]}
+        ttl_cache.set(("/a", ""), data, ttl=10)
+        data["tags"].append("b")
+        ttl_cache.get(("/a", ""))["tags"].append("c")
+
+        assert ttl_cache.get(("/a", "")) == {"id": 1, "tags": ["a"]}
+
+    def test_evicts_least_recently_used(self, clock):
+        ttl_cache = cache.TTLCache(max_entries=2)
+        ttl_cache.set(("/a", ""), {"id": "a"}, ttl=10)
+        ttl_cache.set(("/b", ""), {"id": "b"}, ttl=10)
+        ttl_cache.get(("/a", ""))
+        ttl_cache.set(("/c", ""), {"id": "c"}, ttl=10)
+
+        assert ttl_cache.get(("/b", "")) is None
+        assert ttl_cache.get(("/a", "")) == {"id": "a"}
+        assert ttl_cache.get(("/c", "")) == {"id": "c"}
+
+    def test_invalidate(self, clock):
+        ttl_cache = cache.TTLCache()
+        for path in ("/projects/1", "/projects/1/issues/2", "/projects/10"):
+            ttl_cache.set(ttl_cache.key(path, {}), {}, ttl=10)
+        ttl_cache.set(
+            ttl_cache.key("/projects/group%2Fproject", {}),
+            {},
+            ttl=10,
+            paths=["/projects/1"],
+        )
+
+        ttl_cache.invalidate("/projects/1/")
+
+        assert len(ttl_cache) == 1
+        assert ttl_cache.get(ttl_cache.key("/projects/10", {})) == {}
+
+    def test_clear(self, clock):
+        ttl_cache = cache.TTLCache()
+        ttl_cache.set(("/a", ""), {}, ttl=10)
+        ttl_cache.get(("/a", ""))
+        ttl_cache.clear()
+
+        assert len(ttl_cache) == 0
+        assert (ttl_cache.hits, ttl_cache.misses) == (0, 0)
+
+    @pytest.mark.parametrize(
+        "storage", [cache.TTLCache(), cache.MemoryCache()], ids=["ttl", "memory"]
+    )
+    def test_pickle(self, storage):
+        unpickled = pickle.loads(pickle.dumps(storage))
+        assert len(unpickled) == 0
+        unpickled.clear()
@@ -155,6 +155,50 @@ def test_v4_parser():
     assert actions["--name"].required
 
 
+def _resources(parser):
+    subparsers = next(
+        action
+        for action in parser._actions
+        if isinstance(action, argparse._SubParsersAction)
+    )
+    return subparsers.choices
+
+
+def test_v4_parser_for_resource():
+    parser = cli._get_parser("project-job")
+    assert list(_resources(parser)) == ["project-job"]
+
+    args = parser.parse_args(["project-job", "get", "--project-id", "1", "--id", "2"])
+    assert args.gitlab_resource == "project-job"
+    assert args.resource_action == "get"
+    assert args.id == "2"
+
+
+@pytest.mark.parametrize("gitlab_resource", ["projectjob", "ProjectJob", "unknown"])
+def test_v4_parser_for_unknown_resource_has_all_resources(gitlab_resource):
+    parser = cli._get_parser(gitlab_resource)
+    assert {"project", "project-job", "user"} <= set(_resources(parser))
+
+
+@pytest.mark.parametrize(
+    "remaining_args,expected",
+    [
+        (["gitlab", "project", "get", "--id", "1"], "project"),
+        (["gitlab", "project", "--help"], "project"),
+        (["gitlab"], None),
+        (["gitlab", "--help"], None),
+        (["gitlab", "-h", "project"], None),
+    ],
+)
+def test_requested_resource(remaining_args, expected):
+    assert cli._requested_resource(remaining_args) == expected
+
+
+def test_requested_resource_with_argcomplete(monkeypatch):
+    monkeypatch.setenv("_ARGCOMPLETE", "1")
+    assert cli._requested_resource(["gitlab", "project", "get"]) is None
+
+
 def test_extend_parser():
     class ExceptionArgParser(argparse.ArgumentParser):
         def error(self, message):
@@ -9,6 +9,7 @@ import responses
 
 import gitlab
 from gitlab.config import GitlabConfigMissingError, GitlabDataError
+from gitlab.v4.objects import MemberRoleManager, ProjectManager
 from tests.unit import helpers
 
 localhost = "http://localhost"
@@ -84,6 +85,18 @@ def test_gitlab_init_with_invalid_api_version():
         gitlab.Gitlab(api_version="1")
 
 
+def test_gitlab_creates_managers_on_first_access():
+    gl = gitlab.Gitlab()
+    assert "projects" not in gl.__dict__
+
+    projects = gl.projects
+    assert isinstance(projects, ProjectManager)
+    assert projects.gitlab is gl
+    assert gl.projects is projects
+    assert gl.__dict__["projects"] is projects
+    assert isinstance(gl.member_roles, MemberRoleManager)
+
+
 def test_gitlab_as_context_manager():
     with gitlab.Gitlab() as gl:
         assert isinstance(gl, gitlab.Gitlab)
@@ -227,6 +240,7 @@ def test_gitlab_pickability(gl):
     assert isinstance(unpickled, gitlab.Gitlab)
     assert hasattr(unpickled, "_objects")
     assert unpickled._objects == original_gl_objects
+    assert unpickled.projects.gitlab is unpickled
 
 
 @responses.activate
@@ -1,11 +1,26 @@
+import concurrent.futures
 import copy
+import gzip
+import io
+import json
+import time
 import warnings
+from unittest import mock
 
 import pytest
 import requests
 import responses
 
-from gitlab import GitlabHttpError, GitlabList, GitlabParsingError, RedirectError
+from gitlab import (
+    cache,
+    Gitlab,
+    GitlabHttpError,
+    GitlabList,
+    GitlabParsingError,
+    json_codec,
+    RedirectError,
+    utils,
+)
 from gitlab.const import RETRYABLE_TRANSIENT_ERROR_CODES
 from tests.unit import helpers
 
@@ -117,6 +132,27 @@ def test_http_request_with_retry_on_method_for_transient_failures(gl):
     assert len(responses.calls) == calls_before_success
 
 
+@responses.activate
+def test_http_request_retry_sends_upload_stream_again(gl):
+    bodies = []
+
+    def request_callback(request):
+        bodies.append(request.body)
+        return (500 if len(bodies) == 1 else 201, {}, "{}")
+
+    responses.add_callback(
+        method=responses.PUT,
+        url="http://localhost/api/v4/uploads",
+        callback=request_callback,
+        content_type="application/json",
+    )
+    stream = utils.UploadStream(io.BytesIO(b"package data"))
+
+    gl.http_put("/uploads", post_data=stream, raw=True, retry_transient_errors=True)
+
+    assert bodies == [b"package data", b"package data"]
+
+
 @responses.activate
 def test_http_request_extra_headers(gl):
     path = "/projects/123/jobs/123456"
@@ -444,6 +480,175 @@ def test_http_request_on_409_resource_lock_without_retry_raises(gl):
     assert excinfo.value.response_code == 409
 
 
+@responses.activate
+def test_http_request_with_rate_limiter_waits_for_reset(gl, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    gl.rate_limiter = utils.RateLimiter()
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/user",
+        status=200,
+        headers={
+            "RateLimit-Limit": "10",
+            "RateLimit-Remaining": "0",
+            "RateLimit-Reset": str(int(time.time()) + 30),
+        },
+        match=helpers.MATCH_EMPTY_QUERY_PARAMS,
+    )
+
+    gl.http_request("get", "/user")
+    assert sleeps == []
+    assert gl.rate_limiter.limit == 10
+
+    gl.http_request("get", "/user")
+    assert len(sleeps) == 1
+    assert 28 < sleeps[0] <= 30
+
+
+def _slow_callback(status, body):
+    def callback(request):
+        time.sleep(0.1)
+        return status, {"Content-Type": "application/json"}, json.dumps(body)
+
+    return callback
+
+
+@responses.activate
+def test_http_request_coalesces_identical_gets(gl):
+    gl.coalesce_requests = True
+    url = "http://localhost/api/v4/projects/1"
+    responses.add_callback(responses.GET, url, callback=_slow_callback(200, {"id": 1}))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: gl.http_get("/projects/1"), range(5)))
+
+    assert results == [{"id": 1}] * 5
+    assert responses.assert_call_count(url, 1) is True
+
+
+@responses.activate
+def test_http_request_coalesced_gets_share_errors(gl):
+    gl.coalesce_requests = True
+    url = "http://localhost/api/v4/projects/1"
+    responses.add_callback(
+        responses.GET, url, callback=_slow_callback(404, {"message": "404"})
+    )
+
+    def get(_):
+        with pytest.raises(GitlabHttpError):
+            gl.http_get("/projects/1")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(get, range(3)))
+
+    assert responses.assert_call_count(url, 1) is True
+
+
+@responses.activate
+def test_http_request_does_not_coalesce_other_requests(gl):
+    gl.coalesce_requests = True
+    url = "http://localhost/api/v4/projects/1"
+    responses.add_callback(responses.GET, url, callback=_slow_callback(200, {"id": 1}))
+    responses.add_callback(responses.POST, url, callback=_slow_callback(200, {"id": 1}))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(gl.http_get, "/projects/1"),
+            pool.submit(gl.http_get, "/projects/1", query_data={"license": True}),
+            pool.submit(gl.http_post, "/projects/1"),
+            pool.submit(gl.http_post, "/projects/1"),
+        ]
+        for future in futures:
+            future.result()
+
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_http_request_does_not_coalesce_by_default(gl):
+    url = "http://localhost/api/v4/projects/1"
+    responses.add_callback(responses.GET, url, callback=_slow_callback(200, {"id": 1}))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(lambda _: gl.http_get("/projects/1"), range(3)))
+
+    assert responses.assert_call_count(url, 3) is True
+
+
+@responses.activate
+def test_http_request_revalidates_cached_responses(gl):
+    gl.http_cache = cache.MemoryCache()
+    url = "http://localhost/api/v4/projects/1"
+    responses.add(responses.GET, url, json={"id": 1}, headers={"ETag": '"v1"'})
+    responses.add(
+        responses.GET,
+        url,
+        status=304,
+        headers={"ETag": '"v1"'},
+        match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+    )
+
+    assert gl.http_get("/projects/1") == {"id": 1}
+    assert gl.http_get("/projects/1") == {"id": 1}
+    assert len(responses.calls) == 2
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+@responses.activate
+def test_http_request_cache_keys_on_query_parameters(gl):
+    gl.http_cache = cache.MemoryCache()
+    url = "http://localhost/api/v4/projects/1"
+    responses.add(responses.GET, url, json={"id": 1}, headers={"ETag": '"v1"'})
+
+    gl.http_get("/projects/1")
+    gl.http_get("/projects/1", query_data={"statistics": True})
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert len(gl.http_cache) == 2
+
+
+@responses.activate
+def test_http_request_cache_keys_on_credentials():
+    http_cache = cache.MemoryCache()
+    gl_a = Gitlab("http://localhost", private_token="a", http_cache=http_cache)
+    gl_b = Gitlab("http://localhost", private_token="b", http_cache=http_cache)
+    url = "http://localhost/api/v4/projects/1"
+    responses.add(responses.GET, url, json={"id": 1}, headers={"ETag": '"v1"'})
+    responses.add(responses.GET, url, json={"id": 2}, headers={"ETag": '"v2"'})
+
+    assert gl_a.http_get("/projects/1") == {"id": 1}
+    assert gl_b.http_get("/projects/1") == {"id": 2}
+
+    assert responses.calls[1].request.headers["PRIVATE-TOKEN"] == "b"
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert len(http_cache) == 2
+
+
+@responses.activate
+def test_http_request_does_not_cache_without_validators(gl):
+    gl.http_cache = cache.MemoryCache()
+    url = "http://localhost/api/v4/projects/1"
+    responses.add(responses.GET, url, json={"id": 1})
+
+    gl.http_get("/projects/1")
+    gl.http_get("/projects/1")
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert len(gl.http_cache) == 0
+
+
+@responses.activate
+def test_http_request_does_not_cache_other_methods(gl):
+    gl.http_cache = cache.MemoryCache()
+    url = "http://localhost/api/v4/projects"
+    responses.add(responses.POST, url, json={"id": 1}, headers={"ETag": '"v1"'})
+
+    gl.http_post("/projects")
+
+    assert len(gl.http_cache) == 0
+
+
 @responses.activate
 def test_get_request(gl):
     url = "http://localhost/api/v4/projects"
@@ -644,6 +849,142 @@ def test_list_request_all_true_nowarning(gl):
     assert len(responses.calls) == 1
 
 
+def _add_numbered_pages(total_pages, link_page_param=True):
+    url = "http://localhost/api/v4/projects"
+    for page in range(1, total_pages + 1):
+        headers = {"X-Page": str(page), "X-Total-Pages": str(total_pages)}
+        if page < total_pages:
+            next_query = f"page={page + 1}" if link_page_param else "id_after=1"
+            headers["Link"] = f'<{url}?per_page=1&{next_query}>; rel="next"'
+        query = {"per_page": "1", "page": str(page)} if page > 1 else {}
+        responses.add(
+            method=responses.GET,
+            url=url,
+            json=[{"name": f"project{page}"}],
+            headers=headers,
+            status=200,
+            match=[responses.matchers.query_param_matcher(query)],
+        )
+
+
+@responses.activate
+def test_list_request_all_concurrency(gl):
+    _add_numbered_pages(5)
+
+    result = gl.http_list("/projects", get_all=True, concurrency=3)
+    assert [item["name"] for item in result] == [f"project{i}" for i in range(1, 6)]
+    assert len(responses.calls) == 5
+    assert responses.calls[0].request.url == "http://localhost/api/v4/projects"
+
+
+@responses.activate
+def test_list_request_all_concurrency_fields(gl):
+    _add_numbered_pages(3)
+
+    result = gl.http_list("/projects", get_all=True, concurrency=3, fields=["id"])
+    assert result == [{}, {}, {}]
+
+
+@responses.activate
+def test_list_request_stream(gl):
+    _add_numbered_pages(3)
+
+    result = gl.http_list("/projects", iterator=True, stream=True)
+    assert isinstance(result, GitlabList)
+    assert result.total_pages == 3
+    assert next(result) == {"name": "project1"}
+    assert len(responses.calls) == 1
+    assert list(result) == [{"name": "project2"}, {"name": "project3"}]
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_list_request_stream_large_page(gl):
+    url = "http://localhost/api/v4/projects"
+    items = [{"id": i, "description": "x" * 1000} for i in range(200)]
+    responses.add(method=responses.GET, url=url, json=items, status=200)
+
+    result = gl.http_list("/projects", get_all=True, stream=True, fields=["id"])
+    assert result == [{"id": i} for i in range(200)]
+
+
+@responses.activate
+def test_list_request_stream_invalid_data(gl):
+    url = "http://localhost/api/v4/projects"
+    responses.add(method=responses.GET, url=url, body='[{"id": 1}, {"id"', status=200)
+
+    result = gl.http_list("/projects", iterator=True, stream=True)
+    assert next(result) == {"id": 1}
+    with pytest.raises(GitlabParsingError):
+        next(result)
+
+
+@responses.activate
+def test_get_request_fields(gl):
+    url = "http://localhost/api/v4/projects/1"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json={"id": 1, "name": "project1", "namespace": {"id": 2}},
+        status=200,
+        match=helpers.MATCH_EMPTY_QUERY_PARAMS,
+    )
+
+    assert gl.http_get("/projects/1", fields=["id", "name"]) == {
+        "id": 1,
+        "name": "project1",
+    }
+
+
+@responses.activate
+def test_list_request_all_concurrency_single_page(gl):
+    _add_numbered_pages(1)
+
+    result = gl.http_list("/projects", get_all=True, concurrency=3)
+    assert result == [{"name": "project1"}]
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_list_request_all_concurrency_without_page_numbers(gl):
+    url = "http://localhost/api/v4/projects"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"name": "project2"}],
+        status=200,
+        match=[
+            responses.matchers.query_param_matcher({"per_page": "1", "id_after": "1"})
+        ],
+    )
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"name": "project1"}],
+        headers={"Link": f'<{url}?per_page=1&id_after=1>; rel="next"'},
+        status=200,
+        match=helpers.MATCH_EMPTY_QUERY_PARAMS,
+    )
+
+    result = gl.http_list("/projects", get_all=True, concurrency=3)
+    assert result == [{"name": "project1"}, {"name": "project2"}]
+
+
+@responses.activate
+def test_list_request_all_concurrency_error(gl):
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/projects",
+        json={"message": "Forbidden"},
+        status=403,
+        match=[responses.matchers.query_param_matcher({"per_page": "1", "page": "3"})],
+    )
+    _add_numbered_pages(3)
+
+    with pytest.raises(GitlabHttpError):
+        gl.http_list("/projects", get_all=True, concurrency=3)
+
+
 @responses.activate
 def test_list_request_all_false_nowarning(gl):
     responses.add(**large_list_response)
@@ -716,6 +1057,41 @@ def test_post_request(gl):
     assert responses.assert_call_count(url, 1) is True
 
 
+@responses.activate
+def test_post_request_encodes_json_with_codec(gl):
+    url = "http://localhost/api/v4/projects"
+    responses.add(method=responses.POST, url=url, json={"name": "é"}, status=201)
+    gl.json_codec = json_codec.get_codec("orjson")
+
+    result = gl.http_post("/projects", post_data={"name": "é", "id": 2**70})
+
+    assert result == {"name": "é"}
+    request = responses.calls[0].request
+    assert request.body == '{"name":"é","id":1180591620717411303424}'.encode()
+    assert request.headers["Content-type"] == "application/json"
+
+
+@responses.activate
+def test_post_request_stdlib_codec_uses_backend_encoding(gl):
+    url = "http://localhost/api/v4/projects"
+    responses.add(method=responses.POST, url=url, json={}, status=201)
+    gl.json_codec = json_codec.get_codec("json")
+
+    gl.http_post("/projects", post_data={"name": "project1"})
+
+    assert json.loads(responses.calls[0].request.body) == {"name": "project1"}
+
+
+@responses.activate
+def test_get_request_decodes_with_codec(gl):
+    url = "http://localhost/api/v4/projects/1"
+    responses.add(method=responses.GET, url=url, json={"id": 1}, status=200)
+    gl.json_codec = codec = mock.Mock(wraps=json_codec.StdlibCodec())
+
+    assert gl.http_get("/projects/1") == {"id": 1}
+    codec.loads.assert_called_once_with(b'{"id": 1}')
+
+
 @responses.activate
 def test_post_request_404(gl):
     url = "http://localhost/api/v4/not_there"
@@ -910,3 +1286,229 @@ def test_delete_request_404(gl):
     with pytest.raises(GitlabHttpError):
         gl.http_delete("/not_there")
     assert responses.assert_call_count(url, 1) is True
+
+
+_DOWNLOAD_URL = "http://localhost/api/v4/projects/1/jobs/1/artifacts"
+_DOWNLOAD_BODY = bytes(range(256)) * 1024  # larger than the first chunk
+
+
+def _add_download(status=200, body=_DOWNLOAD_BODY, headers=None, **kwargs):
+    responses.add(
+        method=responses.GET,
+        url=_DOWNLOAD_URL,
+        status=status,
+        body=body,
+        headers={"ETag": '"v1"', **(headers or {})},
+        content_type="application/octet-stream",
+        **kwargs,
+    )
+
+
+# The data of the read interrupted by the connection error is lost, so the
+# download is resumed after the first chunk
+_RESUMED_FROM = utils.DOWNLOAD_MIN_CHUNK_SIZE
+
+
+def _add_interrupted_download(received=_RESUMED_FROM + 1000):
+    """The connection drops once ``received`` bytes were sent."""
+    _add_download(
+        body=_DOWNLOAD_BODY[:received],
+        headers={"Content-Length": str(len(_DOWNLOAD_BODY))},
+        auto_calculate_content_length=False,
+    )
+
+
+def _add_download_range(start, etag='"v1"'):
+    _add_download(
+        status=206,
+        body=_DOWNLOAD_BODY[start:],
+        headers={
+            "ETag": etag,
+            "Content-Range": f"bytes {start}-{len(_DOWNLOAD_BODY) - 1}/"
+            f"{len(_DOWNLOAD_BODY)}",
+        },
+        match=[
+            responses.matchers.header_matcher(
+                {"Range": f"bytes={start}-", "If-Range": '"v1"'}
+            )
+        ],
+    )
+
+
+@responses.activate
+def test_http_download_to_path(gl, tmp_path):
+    _add_download()
+    path = tmp_path / "artifacts.zip"
+
+    stats = gl.http_download(_DOWNLOAD_URL, path)
+
+    assert path.read_bytes() == _DOWNLOAD_BODY
+    assert list(tmp_path.iterdir()) == [path]
+    assert stats.size == len(_DOWNLOAD_BODY)
+    assert stats.elapsed > 0
+    assert stats.throughput == stats.size / stats.elapsed
+    assert stats.resumed_from == stats.retries == 0
+
+
+@responses.activate
+def test_http_download_to_file_object_decodes_content(gl):
+    _add_download(
+        body=gzip.compress(b"test" * 100), headers={"Content-Encoding": "gzip"}
+    )
+    f = io.BytesIO(b"header")
+    f.seek(0, io.SEEK_END)
+
+    stats = gl.http_download(_DOWNLOAD_URL, f)
+
+    assert f.getvalue() == b"header" + b"test" * 100
+    assert stats.size == 400
+
+
+@responses.activate(registry=responses.registries.OrderedRegistry)
+def test_http_download_resumes_after_connection_error(gl, tmp_path):
+    _add_interrupted_download()
+    _add_download_range(_RESUMED_FROM)
+    path = tmp_path / "artifacts.zip"
+
+    stats = gl.http_download(_DOWNLOAD_URL, path, retry_transient_errors=True)
+
+    assert path.read_bytes() == _DOWNLOAD_BODY
+    assert list(tmp_path.iterdir()) == [path]
+    assert stats.retries == 1
+    assert stats.size == len(_DOWNLOAD_BODY)
+
+
+@responses.activate(registry=responses.registries.OrderedRegistry)
+def test_http_download_resumes_partial_file(gl, tmp_path):
+    _add_interrupted_download()
+    _add_download_range(_RESUMED_FROM)
+    path = tmp_path / "artifacts.zip"
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        gl.http_download(_DOWNLOAD_URL, path)
+    assert not path.exists()
+    assert (tmp_path / ".artifacts.zip.part").read_bytes() == (
+        _DOWNLOAD_BODY[:_RESUMED_FROM]
+    )
+
+    stats = gl.http_download(_DOWNLOAD_URL, path)
+
+    assert path.read_bytes() == _DOWNLOAD_BODY
+    assert list(tmp_path.iterdir()) == [path]
+    assert stats.resumed_from == _RESUMED_FROM
+    assert stats.size == len(_DOWNLOAD_BODY) - _RESUMED_FROM
+
+
+@responses.activate(registry=responses.registries.OrderedRegistry)
+def test_http_download_restarts_when_file_changed(gl, tmp_path):
+    _add_interrupted_download()
+    _add_download_range(_RESUMED_FROM, etag='"v2"')
+    _add_download(headers={"ETag": '"v2"'})
+    path = tmp_path / "artifacts.zip"
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        gl.http_download(_DOWNLOAD_URL, path)
+    stats = gl.http_download(_DOWNLOAD_URL, path)
+
+    assert path.read_bytes() == _DOWNLOAD_BODY
+    assert stats.size == len(_DOWNLOAD_BODY)
+    assert stats.resumed_from == 0
+    assert "Range" not in responses.calls[-1].request.headers
+
+
+@responses.activate(registry=responses.registries.OrderedRegistry)
+def test_http_download_restarts_when_range_not_satisfiable(gl, tmp_path):
+    _add_interrupted_download()
+    _add_download(status=416, body="")
+    _add_download()
+    path = tmp_path / "artifacts.zip"
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        gl.http_download(_DOWNLOAD_URL, path)
+    gl.http_download(_DOWNLOAD_URL, path)
+
+    assert path.read_bytes() == _DOWNLOAD_BODY
+
+
+@responses.activate
+def test_http_download_with_range_header_does_not_resume(gl, tmp_path):
+    _add_download(status=206, body=_DOWNLOAD_BODY[:10])
+    path = tmp_path / "artifacts.zip"
+    (tmp_path / ".artifacts.zip.part").write_bytes(b"partial")
+    (tmp_path / ".artifacts.zip.part.json").write_text('{"etag": "\\"v1\\""}')
+
+    gl.http_download(_DOWNLOAD_URL, path, extra_headers={"Range": "bytes=0-9"})
+
+    assert path.read_bytes() == _DOWNLOAD_BODY[:10]
+    assert responses.calls[0].request.headers["Range"] == "bytes=0-9"
+
+
+def _add_download_ranges(etags=('"v1"',), accept_ranges="bytes"):
+    """Serve the ranges requested, with the next ETag of ``etags`` if any."""
+    etags = list(etags)
+
+    def callback(request):
+        headers = {"ETag": etags.pop(0) if len(etags) > 1 else etags[0]}
+        if accept_ranges:
+            headers["Accept-Ranges"] = accept_ranges
+        if "Range" not in request.headers:
+            headers["Content-Length"] = str(len(_DOWNLOAD_BODY))
+            return 200, headers, _DOWNLOAD_BODY
+        start, end = map(int, request.headers["Range"][6:].split("-"))
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(_DOWNLOAD_BODY)}"
+        headers["Content-Length"] = str(end + 1 - start)
+        return 206, headers, _DOWNLOAD_BODY[start : end + 1]
+
+    responses.add_callback(responses.GET, _DOWNLOAD_URL, callback=callback)
+
+
+@pytest.fixture
+def small_segments(monkeypatch):
+    monkeypatch.setattr(utils, "DOWNLOAD_MIN_SEGMENT_SIZE", 1000)
+
+
+@responses.activate
+def test_http_download_in_segments(gl, tmp_path, small_segments):
+    _add_download_ranges()
+    path = tmp_path / "artifacts.zip"
+
+    stats = gl.http_download(_DOWNLOAD_URL, path, segments=4)
+
+    assert path.read_bytes() == _DOWNLOAD_BODY
+    assert list(tmp_path.iterdir()) == [path]
+    assert stats.size == len(_DOWNLOAD_BODY)
+    assert stats.segments == 4
+    ranges = sorted(call.request.headers.get("Range") for call in responses.calls[1:])
+    assert ranges == [
+        "bytes=131072-196607",
+        "bytes=196608-262143",
+        "bytes=65536-131071",
+    ]
+    assert all(c.request.headers["If-Range"] == '"v1"' for c in responses.calls[1:])
+
+
+@responses.activate
+def test_http_download_in_segments_requires_accept_ranges(gl, tmp_path, small_segments):
+    _add_download_ranges(accept_ranges=None)
+    path = tmp_path / "artifacts.zip"
+
+    stats = gl.http_download(_DOWNLOAD_URL, path, segments=4)
+
+    assert path.read_bytes() == _DOWNLOAD_BODY
+    assert stats.segments == 1
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_http_download_in_segments_restarts_when_file_changed(
+    gl, tmp_path, small_segments
+):
+    _add_download_ranges(etags=['"v1"', '"v2"'])
+    path = tmp_path / "artifacts.zip"
+
+    stats = gl.http_download(_DOWNLOAD_URL, path, segments=2)
+
+    assert path.read_bytes() == _DOWNLOAD_BODY
+    assert list(tmp_path.iterdir()) == [path]
+    assert stats.segments == 1
+    assert "Range" not in responses.calls[-1].request.headers
@@ -1,3 +1,6 @@
+import sys
+from unittest import mock
+
 import httpx
 import pytest
 import respx
@@ -114,3 +117,78 @@ async def test_async_graphql_raises_on_401_response(
     respx_mock.post(api_url).mock(return_value=httpx.Response(401))
     with pytest.raises(gitlab.GitlabAuthenticationError):
         await gl_async_gql.execute("query {currentUser {id}}")
+
+
+@pytest.mark.anyio
+async def test_async_graphql_retry_does_not_block_event_loop(
+    api_url: str, respx_mock: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("time.sleep", mock.Mock(side_effect=AssertionError))
+    async_sleep = mock.AsyncMock()
+    monkeypatch.setattr(gitlab.utils.AsyncRetry, "_sleep", async_sleep)
+    responses = [
+        httpx.Response(429, headers={"retry-after": "30"}),
+        httpx.Response(
+            200, json={"data": {"currentUser": {"id": "gid://gitlab/User/1"}}}
+        ),
+    ]
+    respx_mock.post(api_url).mock(side_effect=responses)
+
+    async with gitlab.AsyncGraphQL("https://gitlab.example.com") as gl:
+        await gl.execute("query {currentUser {id}}")
+    async_sleep.assert_awaited_once_with(30.0)
+
+
+@pytest.mark.anyio
+async def test_async_graphql_retry_deadline(api_url: str, respx_mock: respx.MockRouter):
+    respx_mock.post(api_url).mock(
+        return_value=httpx.Response(429, headers={"retry-after": "30"})
+    )
+
+    async with gitlab.AsyncGraphQL(
+        "https://gitlab.example.com", retry_deadline=5
+    ) as gl:
+        with pytest.raises(gitlab.GitlabHttpError):
+            await gl.execute("query {currentUser {id}}")
+
+
+@pytest.mark.parametrize("http_version", ["HTTP/1.1", "HTTP/2"])
+def test_graphql_http2_active(
+    gl_gql: gitlab.GraphQL,
+    api_url: str,
+    respx_mock: respx.MockRouter,
+    http_version: str,
+):
+    respx_mock.post(api_url).mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": {"currentUser": {"id": "gid://gitlab/User/1"}}},
+            extensions={"http_version": http_version.encode()},
+        )
+    )
+    assert not gl_gql.http2_active
+
+    gl_gql.execute("query {currentUser {id}}")
+    assert gl_gql.http2_active is (http_version == "HTTP/2")
+
+
+@pytest.mark.anyio
+async def test_async_graphql_http2_active(
+    gl_async_gql: gitlab.AsyncGraphQL, api_url: str, respx_mock: respx.MockRouter
+):
+    respx_mock.post(api_url).mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": {"currentUser": {"id": "gid://gitlab/User/1"}}},
+            extensions={"http_version": b"HTTP/2"},
+        )
+    )
+
+    await gl_async_gql.execute("query {currentUser {id}}")
+    assert gl_async_gql.http2_active
+
+
+def test_graphql_http2_requires_h2(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "h2", None)
+    with pytest.raises(ImportError, match="h2"):
+        gitlab.GraphQL("https://gitlab.example.com", http2=True)
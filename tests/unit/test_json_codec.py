@@ -0,0 +1,108 @@
+import json
+import pickle
+
+import pytest
+
+from gitlab import json_codec
+
+
+class RecordingCodec(json_codec.JSONCodec):
+    """Codec recording its calls, to check where it is used."""
+
+    name = "recording"
+
+    def __init__(self):
+        self.calls = []
+
+    def loads(self, data):
+        self.calls.append(("loads", data))
+        return json_codec.StdlibCodec().loads(data)
+
+    def dumps(self, obj):
+        self.calls.append(("dumps", obj))
+        return json_codec.StdlibCodec().dumps(obj)
+
+
+def test_get_codec_by_name():
+    assert isinstance(json_codec.get_codec("json"), json_codec.StdlibCodec)
+    assert isinstance(json_codec.get_codec("orjson"), json_codec.OrjsonCodec)
+
+
+def test_get_codec_instance():
+    codec = RecordingCodec()
+    assert json_codec.get_codec(codec) is codec
+
+
+def test_get_codec_auto_prefers_installed_codecs(monkeypatch):
+    assert isinstance(json_codec.get_codec(), json_codec.OrjsonCodec)
+
+    monkeypatch.setattr(json_codec, "_ORJSON_INSTALLED", False)
+    monkeypatch.setattr(json_codec, "_MSGSPEC_INSTALLED", False)
+    assert isinstance(json_codec.get_codec("auto"), json_codec.StdlibCodec)
+    with pytest.raises(ImportError):
+        json_codec.get_codec("orjson")
+
+
+def test_get_codec_unknown():
+    with pytest.raises(ValueError, match="Unknown JSON codec 'yaml'"):
+        json_codec.get_codec("yaml")
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codec_round_trip(name):
+    if name == "msgspec":
+        pytest.importorskip("msgspec")
+    codec = json_codec.get_codec(name)
+    obj = {"id": 1, "name": "é", "tags": ["a", None], "big": 2**70, "ok": True}
+
+    assert codec.loads(codec.dumps(obj)) == obj
+    assert codec.loads(b'{"id": 1}') == {"id": 1}
+    assert codec.loads('{"id": 1}') == {"id": 1}
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+    assert pickle.loads(pickle.dumps(codec)).name == name
+
+
+def test_stdlib_codec_output():
+    codec = json_codec.StdlibCodec()
+    assert codec.dumps({"name": "é", "id": 1}) == '{"name":"é","id":1}'.encode()
+    with pytest.raises(ValueError):
+        codec.dumps({"value": float("nan")})
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 100_000])
+def test_array_decoder_chunks(chunk_size):
+    items = [
+        {"name": 'a "quoted" \\ name', "nested": [1, {"é": "€😀"}]},
+        "]",
+        12345678901234567890,
+        -1.5e10,
+        None,
+        {"big": "x" * 5000},
+    ]
+    body = json.dumps(items, ensure_ascii=False).encode()
+    decoder = json_codec.JSONArrayDecoder()
+
+    decoded = []
+    for i in range(0, len(body), chunk_size):
+        decoded.extend(decoder.feed(body[i : i + chunk_size]))
+    decoded.extend(decoder.close())
+    assert decoded == items
+
+
+def test_array_decoder_returns_items_when_complete():
+    decoder = json_codec.JSONArrayDecoder()
+    assert decoder.feed(b' [ {"id": 1}, {"id"') == [{"id": 1}]
+    assert decoder.feed(b": 2}, 3") == [{"id": 2}]
+    assert decoder.feed(b"4 ]") == [34]
+    assert decoder.close() == []
+
+
+@pytest.mark.parametrize(
+    "body", [b"", b'{"id": 1}', b"[1,]", b"[,1]", b"[1 2]", b"[1", b"[1] 2"]
+)
+def test_array_decoder_invalid(body):
+    decoder = json_codec.JSONArrayDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed(body)
+        decoder.close()
@@ -1,3 +1,4 @@
+import email.utils
 import time
 from unittest import mock
 
@@ -39,3 +40,83 @@ def test_handle_retry_on_status_accepts_ratelimit_reset_header(
 def test_handle_retry_on_status_returns_false_when_max_retries_reached():
     retry = utils.Retry(max_retries=0)
     assert retry.handle_retry_on_status(429) is False
+
+
+@pytest.fixture
+def async_sleep(monkeypatch: pytest.MonkeyPatch) -> mock.AsyncMock:
+    mock_sleep = mock.AsyncMock()
+    monkeypatch.setattr(utils.AsyncRetry, "_sleep", mock_sleep)
+    monkeypatch.setattr(time, "sleep", mock.Mock(side_effect=AssertionError))
+    return mock_sleep
+
+
+@pytest.mark.anyio
+async def test_async_handle_retry_on_status_uses_jittered_backoff(async_sleep):
+    retry = utils.AsyncRetry(max_retries=3)
+
+    for cur_retries in range(3):
+        assert await retry.handle_retry_on_status(429) is True
+        assert 0 <= async_sleep.call_args[0][0] <= 2**cur_retries * 0.1
+    assert await retry.handle_retry_on_status(429) is False
+    assert async_sleep.await_count == 3
+
+
+@pytest.mark.anyio
+async def test_async_handle_retry_on_status_without_jitter(async_sleep):
+    retry = utils.AsyncRetry(max_retries=2, jitter=False)
+
+    assert await retry.handle_retry_on_status(429) is True
+    assert await retry.handle_retry_on_status(429) is True
+    assert [call.args[0] for call in async_sleep.await_args_list] == [0.1, 0.2]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "retry_after",
+    ["2", lambda: email.utils.formatdate(time.time() + 2, usegmt=True)],
+    ids=["seconds", "http-date"],
+)
+async def test_async_handle_retry_on_status_accepts_retry_after_header(
+    async_sleep, retry_after
+):
+    if callable(retry_after):
+        retry_after = retry_after()
+    retry = utils.AsyncRetry(max_retries=1)
+
+    assert await retry.handle_retry_on_status(429, {"Retry-After": retry_after})
+    assert async_sleep.call_args[0][0] == pytest.approx(2, abs=1)
+
+
+@pytest.mark.anyio
+async def test_async_handle_retry_on_status_accepts_ratelimit_reset_header(async_sleep):
+    retry = utils.AsyncRetry(max_retries=1)
+    headers = {"RateLimit-Reset": str(int(time.time()) - 10)}
+
+    assert await retry.handle_retry_on_status(429, headers=headers) is True
+    assert async_sleep.call_args[0][0] == 0
+
+
+@pytest.mark.anyio
+async def test_async_handle_retry_on_status_stops_at_deadline(async_sleep):
+    retry = utils.AsyncRetry(max_retries=-1, deadline=5)
+
+    assert await retry.handle_retry_on_status(429, {"Retry-After": "3"}) is True
+    assert await retry.handle_retry_on_status(429, {"Retry-After": "10"}) is False
+    assert async_sleep.await_count == 1
+
+
+@pytest.mark.anyio
+async def test_async_handle_retry_only_retries_transient_errors(async_sleep):
+    assert await utils.AsyncRetry(max_retries=1).handle_retry() is False
+
+    retry = utils.AsyncRetry(max_retries=1, retry_transient_errors=True)
+    assert await retry.handle_retry() is True
+    assert await retry.handle_retry() is False
+    assert async_sleep.await_count == 1
+
+
+@pytest.mark.anyio
+async def test_async_retry_sleep_runs_on_any_event_loop():
+    start = time.monotonic()
+    await utils.AsyncRetry._sleep(0.01)
+    assert time.monotonic() - start >= 0.01
@@ -1,5 +1,8 @@
+import concurrent.futures
 import json
 import logging
+import os
+import pickle
 import warnings
 
 import pytest
@@ -42,6 +45,53 @@ def test_response_content(capsys):
     assert "test" in captured.out
 
 
+@pytest.mark.parametrize(
+    "size,read,elapsed,expected",
+    [
+        (utils.DOWNLOAD_MIN_CHUNK_SIZE, utils.DOWNLOAD_MIN_CHUNK_SIZE, 0.001, 2),
+        (utils.DOWNLOAD_MIN_CHUNK_SIZE, 100, 0.001, 1),
+        (utils.DOWNLOAD_MIN_CHUNK_SIZE, utils.DOWNLOAD_MIN_CHUNK_SIZE, 0.1, 1),
+        (utils.DOWNLOAD_MIN_CHUNK_SIZE * 4, 100, 1.0, 2),
+        (utils.DOWNLOAD_MIN_CHUNK_SIZE, 100, 1.0, 1),
+        (utils.DOWNLOAD_MAX_CHUNK_SIZE, utils.DOWNLOAD_MAX_CHUNK_SIZE, 0.001, 128),
+    ],
+)
+def test_next_chunk_size(size, read, elapsed, expected):
+    assert utils._next_chunk_size(size, read, elapsed) == (
+        expected * utils.DOWNLOAD_MIN_CHUNK_SIZE
+    )
+
+
+def test_upload_stream_reads_path_by_chunks(tmp_path):
+    path = tmp_path / "package.tar.gz"
+    path.write_bytes(b"0123456789")
+    progress = []
+    stream = utils.UploadStream(
+        path, chunk_size=4, progress=lambda sent, size: progress.append((sent, size))
+    )
+
+    assert stream.size == stream.len == 10
+    assert list(stream) == [b"0123", b"4567", b"89"]
+    assert progress == [(4, 10), (8, 10), (10, 10)]
+    assert stream.len == 0
+    assert stream.read() == b""
+
+    stream.rewind()
+    assert stream.len == 10
+    assert stream.read() == b"0123456789"
+
+
+def test_upload_stream_of_unseekable_file():
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"0123456789")
+    os.close(write_fd)
+    with open(read_fd, "rb") as f:
+        stream = utils.UploadStream(f, chunk_size=4)
+
+        assert stream.size is stream.len is None
+        assert b"".join(stream) == b"0123456789"
+
+
 class TestEncodedId:
     def test_init_str(self):
         obj = utils.EncodedId("Hello")
@@ -235,3 +285,115 @@ def test_masking_formatter_masks_token(capsys: pytest.CaptureFixture):
 
     assert "[MASKED]" in captured.err
     assert token not in captured.err
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(utils, "time", clock)
+        return clock
+
+    def headers(self, clock, remaining, reset_in=60, limit=3):
+        return {
+            "RateLimit-Limit": str(limit),
+            "RateLimit-Remaining": str(remaining),
+            "RateLimit-Reset": str(clock.now + reset_in),
+        }
+
+    def test_does_not_wait_without_headers(self, clock):
+        limiter = utils.RateLimiter()
+        limiter.update({})
+        for _ in range(10):
+            limiter.acquire()
+        assert clock.sleeps == []
+        assert limiter.limit is None
+
+    def test_waits_for_reset_once_quota_is_used(self, clock):
+        limiter = utils.RateLimiter()
+        limiter.update(self.headers(clock, remaining=2, reset_in=30))
+        assert limiter.limit == 3
+        assert limiter.remaining == 2
+
+        limiter.acquire()
+        limiter.acquire()
+        assert clock.sleeps == []
+
+        limiter.acquire()
+        assert clock.sleeps == [30]
+        assert limiter.remaining == 2
+
+    def test_spreads_waiting_requests_over_windows(self, clock):
+        limiter = utils.RateLimiter(period=60)
+        limiter.update(self.headers(clock, remaining=0, reset_in=10))
+
+        waits = [limiter._reserve() for _ in range(7)]
+        assert waits == [10, 10, 10, 70, 70, 70, 130]
+
+    def test_keeps_in_flight_requests_reserved(self, clock):
+        limiter = utils.RateLimiter()
+        limiter.update(self.headers(clock, remaining=3))
+        limiter.acquire()
+        limiter.acquire()
+        # The server only saw the first request so far
+        limiter.update(self.headers(clock, remaining=2))
+        assert limiter.remaining == 1
+
+    def test_ignores_invalid_headers(self, clock):
+        limiter = utils.RateLimiter()
+        limiter.update({**self.headers(clock, remaining=0), "RateLimit-Limit": "x"})
+        assert limiter.limit is None
+
+    def test_is_shared_between_threads(self, clock):
+        limiter = utils.RateLimiter()
+        limiter.update(self.headers(clock, remaining=100, limit=100))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: limiter._reserve(), range(100)))
+        assert limiter.remaining == 0
+
+    def test_can_be_pickled(self, clock):
+        limiter = utils.RateLimiter()
+        limiter.update(self.headers(clock, remaining=1))
+        unpickled = pickle.loads(pickle.dumps(limiter))
+        assert unpickled.limit == 3
+        unpickled.acquire()
+        assert unpickled.remaining == 0
+
+    @pytest.mark.anyio
+    async def test_async_acquire_does_not_block(self, clock, monkeypatch):
+        sleeps = []
+
+        async def async_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(utils, "async_sleep", async_sleep)
+        limiter = utils.RateLimiter()
+        limiter.update(self.headers(clock, remaining=1, reset_in=5))
+
+        await limiter.async_acquire()
+        await limiter.async_acquire()
+        assert sleeps == [5]
+        assert clock.sleeps == []
+
+
+def test_select_fields():
+    assert utils.select_fields({"a": 1, "b": 2}, None) == {"a": 1, "b": 2}
+    assert utils.select_fields({"a": 1, "b": 2}, ["a", "c"]) == {"a": 1}
+    assert utils.select_fields([{"a": 1, "b": 2}, "x"], ("b",)) == [{"b": 2}, "x"]
+    assert utils.select_fields("text", ["a"]) == "text"